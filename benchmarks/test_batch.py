@@ -0,0 +1,22 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytest.importorskip("yaml")
+
+from core.batch_generator import BatchGenerator, parse_manifest  # noqa: E402
+
+
+@pytest.fixture
+def manifest():
+    return parse_manifest({
+        "defaults": {"customizations": {"requirements": {"memory": "4GB"}}},
+        "agents": [{"file_name": f"customer_{i}", "template": "advanced" if i % 3 == 0 else "basic",
+                    "customizations": {"name": f"Customer {i} Agent"}} for i in range(200)]
+    })
+
+
+def test_rerun_unchanged(benchmark, manifest, tmp_path):
+    generator = BatchGenerator(tmp_path, workers=1)
+    assert generator.run(manifest["agents"])["written"] == 200
+    result = benchmark(generator.run, manifest["agents"])
+    assert result["unchanged"] == 200 and not result["failed"]
@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.agent_designer import AgentDesigner  # noqa: E402
+
+
+@pytest.fixture
+def designer():
+    return AgentDesigner()
+
+
+@pytest.mark.parametrize("template", ["basic", "advanced"])
+def test_generate_agent_code(benchmark, designer, template):
+    config = designer.create_agent_config(template, {})
+    code = benchmark(designer.generate_agent_code, config)
+    compile(code, "<agent>", "exec")
+
+
+def test_generate_async_agent_code(benchmark, designer):
+    config = designer.create_agent_config("basic", {"runtime": "async"})
+    code = benchmark(designer.generate_agent_code, config)
+    compile(code, "<agent>", "exec")
+    assert "async def run_many" in code
+
+
+def test_save_agent(benchmark, designer, tmp_path):
+    pytest.importorskip("yaml")
+    config = designer.create_agent_config("basic", {})
+    path = benchmark(designer.save_agent, "bench_agent", config, str(tmp_path))
+    assert path.endswith(".py")
+
+
+def test_render_many_uncached(benchmark, designer):
+    from core.codegen import CodeGenerator
+
+    configs = [designer.create_agent_config("advanced" if i % 2 else "basic", {"name": f"Agent {i}"})
+               for i in range(200)]
+    generator = CodeGenerator(cache_size=0)
+    sources = benchmark(generator.render_many, configs)
+    assert len(set(sources)) == 200
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.device_settings import DeviceSettings  # noqa: E402
+from core.prometheus import MetricsExporter  # noqa: E402
+
+
+@pytest.fixture
+def exporter(fake_psutil, isolated):
+    exporter = MetricsExporter(DeviceSettings())
+    exporter.refresh()
+    return exporter
+
+
+def test_render(benchmark, exporter):
+    text = benchmark(exporter.render)
+    assert 'ai_agent_cpu_usage_percent{core="7"}' in text
+
+
+def test_scrape_body(benchmark, exporter):
+    body = benchmark(exporter.body)
+    assert body.endswith(b"\n")
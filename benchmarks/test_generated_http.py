@@ -0,0 +1,17 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from fixtures import url  # noqa: E402
+
+
+def test_cached_fetch(benchmark, http_agent, upstream):
+    result = benchmark(http_agent.fetch, url(upstream, "/cached"))
+    assert result == {"path": "/cached"}
+    assert upstream.calls == 1
+
+
+def test_uncached_fetch(benchmark, http_agent, upstream):
+    # Keep-alive still saves the TCP handshake on every call
+    benchmark(http_agent.fetch, url(upstream, "/private"))
+    assert upstream.calls == http_agent.cache.misses
@@ -0,0 +1,33 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_startup_to_first_paint(benchmark, app, fake_psutil, isolated):
+    from ui.main_window import MainWindow
+
+    def start():
+        window = MainWindow()
+        painted = []
+        window.startup_probe.on_first_paint(painted.append)
+        window.show()
+        deadline = time.monotonic() + 10
+        while not painted and time.monotonic() < deadline:
+            app.processEvents()
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+        return painted
+
+    painted = benchmark.pedantic(start, rounds=10, warmup_rounds=1)
+    assert painted
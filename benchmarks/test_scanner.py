@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.system_scanner import SystemScanner  # noqa: E402
+
+SECTIONS = ["system_info", "hardware_info", "performance_metrics",
+            "installed_software", "python_environment"]
+
+
+@pytest.fixture
+def scanner(fake_psutil, isolated):
+    return SystemScanner()
+
+
+@pytest.mark.parametrize("section", SECTIONS)
+def test_collect_section(benchmark, scanner, section):
+    collector = scanner.collectors.get(section)
+    result = benchmark(collector.func)
+    assert "error" not in result
+
+
+def test_scan_system(benchmark, scanner):
+    snapshot = benchmark(scanner.scan_system)
+    assert not snapshot.failed_sections()
+
+
+def test_cached_snapshot(benchmark, scanner):
+    scanner.scan_system()
+    snapshot = benchmark(scanner.get_snapshot)
+    assert snapshot.is_fresh(scanner.snapshot_ttl)
@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from core.device_settings import DeviceSettings  # noqa: E402
+
+
+@pytest.fixture
+def settings(fake_psutil, isolated):
+    return DeviceSettings()
+
+
+def test_health_report(benchmark, settings):
+    report = benchmark(settings.get_system_health_report)
+    assert report["cpu_usage"]["cores"] == 8
+
+
+def test_optimization_suggestions(benchmark, settings):
+    settings.update_settings({"max_cpu_usage": 0, "max_memory_usage": 0})
+    suggestions = benchmark(settings.get_optimization_suggestions)
+    assert {s["type"] for s in suggestions} == {"cpu", "memory"}
+
+
+def test_update_settings(benchmark, settings):
+    values = iter(range(30, 10 ** 9))
+    assert benchmark(lambda: settings.update_settings({"monitoring_interval": next(values)}))
@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+yaml = pytest.importorskip("yaml")
+
+from core.template_registry import TemplateRegistry  # noqa: E402
+
+PACKAGES = ["torch", "numpy", "pandas", "requests", "transformers",
+            "scikit-learn", "fastapi", "redis", "python-dotenv", "aiohttp"]
+FEATURES = ["HTTP requests", "Caching", "Logging and monitoring",
+            "Data processing", "Scheduling", "Retries"]
+
+
+@pytest.fixture
+def template_dir(tmp_path):
+    """150 templates with varied requirements"""
+    for i in range(150):
+        template = {
+            "name": f"Agent {i}",
+            "description": "Generated benchmark template",
+            "requirements": {
+                "memory": f"{2 ** (i % 6)}GB",
+                "cpu_cores": 2 ** (i % 4),
+                "python_packages": [PACKAGES[(i + k) % len(PACKAGES)] for k in range(0, 8, 2)]
+            },
+            "features": [FEATURES[(i + k) % len(FEATURES)] for k in range(3)]
+        }
+        (tmp_path / f"agent_{i}.yaml").write_text(yaml.safe_dump(template))
+    return tmp_path
+
+
+def test_cold_load(benchmark, template_dir):
+    registry = benchmark(TemplateRegistry, template_dir)
+    assert len(registry.templates) == 152
+
+
+def test_reload_unchanged(benchmark, template_dir):
+    registry = TemplateRegistry(template_dir)
+    changes = benchmark(registry.reload)
+    assert not any(changes.values())
+
+
+def test_find(benchmark, template_dir):
+    registry = TemplateRegistry(template_dir)
+    names = benchmark(registry.find, max_memory="8GB", max_cores=4, exclude_packages=["torch"])
+    assert names and all("torch" not in registry.get(name)["requirements"]["python_packages"]
+                         for name in names)
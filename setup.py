@@ -3,7 +3,10 @@ from setuptools import setup, find_packages
 setup(
     name="ai-agent-assistant",
     version="0.1.0",
-    packages=find_packages(),
+    # Modules import each other as top-level core, ui, cli and main, as when run from src/
+    package_dir={"": "src"},
+    packages=find_packages("src"),
+    py_modules=["cli", "main"],
     install_requires=[
         "PyQt6>=6.4.0",
         "psutil>=5.9.0",
@@ -15,7 +18,7 @@ setup(
     ],
     entry_points={
         "console_scripts": [
-            "ai-agent-assistant=src.main:main",
+            "ai-agent-assistant=cli:main",
         ],
     },
     author="TsungLun Ho",
@@ -0,0 +1,342 @@
+"""Command line interface for AI Agent Assistant.
+
+Subcommands import only what they need, so ``--help`` and ``health`` do
+not pay for PyQt6, YAML or the package inventory. Running without a
+subcommand starts the GUI.
+"""
+import argparse
+import json
+import sys
+import time
+
+
+def _print_json(data) -> None:
+    json.dump(data, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
+
+
+def _percent_line(label: str, value) -> str:
+    return f"{label:<16}{value}%"
+
+
+def cmd_scan(args) -> int:
+    from core.system_scanner import SystemScanner
+    from core.tracing import get_tracer
+
+    scanner = SystemScanner()
+    unknown = [name for name in args.section or [] if name not in scanner.collectors.names()]
+    if unknown:
+        print(f"Unknown section(s): {', '.join(unknown)}. "
+              f"Available: {', '.join(scanner.collectors.names())}", file=sys.stderr)
+        return 2
+    tracer = get_tracer()
+    if args.trace:
+        tracer.enable()
+    if args.profile:
+        tracer.profile_next(f"collector.{args.profile}")
+    snapshot = scanner.scan_system(sections=args.section or None)
+    if args.trace:
+        count = tracer.export_chrome_trace(args.trace)
+        print(f"Wrote {count} trace events to {args.trace}", file=sys.stderr)
+    for name, report in tracer.profiles.items():
+        print(f"Profile of {name}:\n{report}", file=sys.stderr)
+    if args.json:
+        data = snapshot.to_dict()
+        data["collectors"] = dict(snapshot.collectors)
+        _print_json(data)
+        return 0
+    for name, section in snapshot.items():
+        print(f"[{name}]")
+        if isinstance(section, dict):
+            for key, value in section.items():
+                if isinstance(value, (list, tuple)) and len(value) > 8:
+                    value = f"{len(value)} items"
+                print(f"  {key}: {value}")
+        else:
+            print(f"  {section}")
+    for name, info in snapshot.collectors.items():
+        print(f"{name:<22}{info['status']:<9}{info['duration'] * 1000:.1f} ms")
+    return 0 if not snapshot.failed_sections() else 1
+
+
+def cmd_health(args) -> int:
+    from core.device_settings import DeviceSettings
+
+    settings = DeviceSettings()
+    if args.sample > 0:
+        time.sleep(args.sample)
+        settings.cpu_sampler.sample()
+    report = settings.get_system_health_report()
+    suggestions = settings.get_optimization_suggestions()
+    if args.json:
+        _print_json({"health": report, "suggestions": suggestions})
+    else:
+        print(_percent_line("CPU", report["cpu_usage"]["percent"]))
+        print(_percent_line("Memory", report["memory_usage"]["percent"]))
+        print(_percent_line("Disk", report["disk_usage"]["percent"]))
+        print(f"{'Mode':<16}{report['performance_mode']}")
+        for suggestion in suggestions:
+            print(f"! {suggestion['issue']}: {suggestion['suggestion']}")
+    return 1 if suggestions else 0
+
+
+def _load_config(template: str, customizations=None, template_dir=None):
+    from core.agent_designer import AgentDesigner
+
+    designer = AgentDesigner(template_dir)
+    if template not in designer.get_templates():
+        available = ", ".join(designer.get_templates())
+        print(f"Unknown template '{template}'. Available: {available}", file=sys.stderr)
+        return designer, None
+    return designer, designer.create_agent_config(template, customizations or {})
+
+
+def cmd_validate(args) -> int:
+    from core.system_scanner import SystemScanner
+
+    designer, config = _load_config(args.template, template_dir=args.templates)
+    if config is None:
+        return 2
+    snapshot = SystemScanner().scan_system(sections=["hardware_info"])
+    issues = designer.validate_system_compatibility(config, snapshot)
+    if args.json:
+        _print_json({"template": args.template, "compatible": not issues, "issues": issues})
+    elif issues:
+        print("System does not meet requirements:")
+        for issue in issues:
+            print(f"- {issue}")
+    else:
+        print(f"System meets all requirements for '{args.template}'")
+    return 1 if issues else 0
+
+
+def cmd_generate(args) -> int:
+    customizations = {"name": args.agent_name} if args.agent_name else {}
+    if args.runtime:
+        customizations["runtime"] = args.runtime
+    designer, config = _load_config(args.template, customizations, args.templates)
+    if config is None:
+        return 2
+    path = designer.save_agent(args.file_name, config, args.output_dir)
+    checklist = designer.get_deployment_checklist(config)
+    if args.json:
+        _print_json({"path": path, "config": config, "checklist": checklist})
+    else:
+        print(f"Agent written to {path}")
+        print("\n".join(checklist))
+    return 0
+
+
+def cmd_batch(args) -> int:
+    from core.batch_generator import BatchGenerator
+
+    generator = BatchGenerator(args.output_dir, template_dir=args.templates, workers=args.workers)
+    try:
+        result = generator.run_manifest(args.manifest)
+    except (OSError, ValueError) as e:
+        print(f"Invalid manifest {args.manifest}: {e}", file=sys.stderr)
+        return 2
+    if args.json:
+        _print_json(result)
+    else:
+        print(f"{result['total']} agents: {result['written']} written, {result['unchanged']} unchanged, "
+              f"{len(result['failed'])} failed in {result['duration']:.1f}s")
+        for failure in result["failed"]:
+            print(f"! {failure['file_name']}: {failure['error']}")
+    return 1 if result["failed"] else 0
+
+
+def cmd_templates(args) -> int:
+    from core.template_registry import TemplateRegistry, default_template_dir
+
+    registry = TemplateRegistry(args.templates or default_template_dir())
+    conditions = {
+        "max_memory": args.max_memory,
+        "max_cores": args.max_cores,
+        "packages": args.package,
+        "exclude_packages": args.without,
+        "features": args.feature
+    }
+    if args.fits:
+        from core.system_scanner import SystemScanner
+
+        snapshot = SystemScanner().scan_system(sections=["hardware_info"])
+        conditions.pop("max_memory")
+        conditions.pop("max_cores")
+        names = registry.compatible(snapshot, **conditions)
+    else:
+        names = registry.find(**conditions)
+    if args.json:
+        _print_json({"templates": {name: registry.get(name) for name in names},
+                     "errors": registry.errors})
+    else:
+        for name in names:
+            requirements = registry.get(name)["requirements"]
+            print(f"{name:<24}{requirements['memory']:>8}{requirements['cpu_cores']:>4} cores  "
+                  f"{registry.get(name)['name']}")
+    return 0 if names else 1
+
+
+def cmd_daemon(args) -> int:
+    from core.daemon import main as daemon_main
+
+    return daemon_main(args.daemon_args)
+
+
+def cmd_fleet_serve(args) -> int:
+    from core.fleet import FleetServer
+
+    server = FleetServer(host=args.bind, port=args.port)
+    print(f"Fleet collector listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_fleet_agent(args) -> int:
+    from core.fleet import FleetAgent, http_sender
+
+    agent = FleetAgent(
+        http_sender(args.server),
+        host_id=args.host_id,
+        interval=args.interval,
+        batch_interval=args.batch_interval
+    )
+    try:
+        agent.run(iterations=1 if args.once else None)
+    except KeyboardInterrupt:
+        agent.build_batch()
+        agent.flush()
+    return 0
+
+
+def cmd_fleet_status(args) -> int:
+    from core.fleet import fetch_fleet
+
+    try:
+        fleet = fetch_fleet(args.server)
+    except OSError as e:
+        print(f"Cannot reach fleet collector at {args.server}: {e}", file=sys.stderr)
+        return 2
+    if args.json:
+        _print_json(fleet)
+        return 0
+    print(f"{'HOST':<24}{'STATUS':<9}{'CPU':>7}{'MEM':>7}{'DISK':>7}  TEMPLATES")
+    for host in fleet["hosts"]:
+        cells = [f"{host[key]:>6.1f}%" if host[key] is not None else f"{'-':>7}"
+                 for key in ("cpu_percent", "memory_percent", "disk_percent")]
+        templates = ", ".join(host["compatible_templates"]) or "-"
+        print(f"{host['host']:<24}{host['status']:<9}{''.join(cells)}  {templates}")
+        for alert in host["alerts"]:
+            print(f"  ! {alert}")
+    summary = fleet["summary"]
+    print(f"{summary['online']}/{summary['hosts']} online, {summary['alerting']} alerting")
+    return 1 if summary["alerting"] else 0
+
+
+def cmd_gui(args) -> int:
+    from main import main as gui_main
+
+    gui_main()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="ai-agent-assistant",
+        description="Analyze system usage and design AI agents. Starts the GUI when no command is given."
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    scan = sub.add_parser("scan", help="run a system scan")
+    scan.add_argument("--section", action="append", help="only collect this section (repeatable)")
+    scan.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    scan.add_argument("--trace", metavar="FILE", help="write a Chrome trace (chrome://tracing) of the scan")
+    scan.add_argument("--profile", metavar="SECTION", help="print a cProfile report for one section")
+    scan.set_defaults(func=cmd_scan)
+
+    health = sub.add_parser("health", help="print a system health report")
+    health.add_argument("--sample", type=float, default=0.0, metavar="SECONDS",
+                        help="measure CPU over this window (default: average since boot)")
+    health.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    health.set_defaults(func=cmd_health)
+
+    validate = sub.add_parser("validate", help="check this machine against an agent template")
+    validate.add_argument("template")
+    validate.add_argument("--templates", metavar="DIR", help="directory of YAML templates to use")
+    validate.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    validate.set_defaults(func=cmd_validate)
+
+    generate = sub.add_parser("generate", help="generate agent code from a template")
+    generate.add_argument("template")
+    generate.add_argument("--templates", metavar="DIR", help="directory of YAML templates to use")
+    generate.add_argument("--name", dest="agent_name", help="agent display name")
+    generate.add_argument("--runtime", choices=["sync", "async"],
+                          help="async generates an asyncio service with run_many() (default: the template's)")
+    generate.add_argument("--file-name", default="custom_agent", help="output file stem (default: custom_agent)")
+    generate.add_argument("--output-dir", default=".", help="directory to write to (default: current)")
+    generate.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    generate.set_defaults(func=cmd_generate)
+
+    batch = sub.add_parser("batch", help="generate every agent listed in a manifest")
+    batch.add_argument("manifest", help="YAML or JSON manifest of agents")
+    batch.add_argument("--output-dir", default=".", help="directory to write to (default: current)")
+    batch.add_argument("--templates", metavar="DIR", help="directory of YAML templates to use")
+    batch.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    batch.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    batch.set_defaults(func=cmd_batch)
+
+    templates = sub.add_parser("templates", help="list agent templates matching requirements")
+    templates.add_argument("--templates", metavar="DIR", help="directory of YAML templates to use")
+    templates.add_argument("--max-memory", metavar="SIZE", help="only templates needing at most this much memory (e.g. 8GB)")
+    templates.add_argument("--max-cores", type=int, metavar="N", help="only templates needing at most N cores")
+    templates.add_argument("--fits", action="store_true", help="only templates this machine can run")
+    templates.add_argument("--package", action="append", help="only templates requiring this package (repeatable)")
+    templates.add_argument("--without", action="append", metavar="PACKAGE",
+                           help="skip templates requiring this package (repeatable)")
+    templates.add_argument("--feature", action="append", help="only templates offering this feature (repeatable)")
+    templates.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    templates.set_defaults(func=cmd_templates)
+
+    daemon = sub.add_parser("daemon", help="run the headless monitoring daemon", add_help=False)
+    daemon.add_argument("daemon_args", nargs=argparse.REMAINDER)
+    daemon.set_defaults(func=cmd_daemon)
+
+    fleet = sub.add_parser("fleet", help="collect health from many hosts")
+    fleet_sub = fleet.add_subparsers(dest="fleet_command", required=True)
+    serve = fleet_sub.add_parser("serve", help="run the central collector")
+    serve.add_argument("--bind", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="port to listen on (default: 8765)")
+    serve.set_defaults(func=cmd_fleet_serve)
+    agent = fleet_sub.add_parser("agent", help="report this host to a collector")
+    agent.add_argument("--server", required=True, help="collector URL, e.g. http://central:8765")
+    agent.add_argument("--host-id", help="name to report as (default: hostname)")
+    agent.add_argument("--interval", type=float, default=5.0, help="seconds between samples (default: 5)")
+    agent.add_argument("--batch-interval", type=float, default=30.0, help="seconds between uploads (default: 30)")
+    agent.add_argument("--once", action="store_true", help="send one sample and exit")
+    agent.set_defaults(func=cmd_fleet_agent)
+    status = fleet_sub.add_parser("status", help="show the fleet view of a collector")
+    status.add_argument("--server", default="http://127.0.0.1:8765", help="collector URL")
+    status.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    status.set_defaults(func=cmd_fleet_status)
+
+    gui = sub.add_parser("gui", help="start the desktop application (default)")
+    gui.set_defaults(func=cmd_gui)
+    return parser
+
+
+def main(argv=None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["daemon"]:
+        # argparse.REMAINDER skips arguments starting with "-", so pass them on untouched
+        return cmd_daemon(argparse.Namespace(daemon_args=argv[1:]))
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        return cmd_gui(args)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
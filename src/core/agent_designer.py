@@ -1,56 +1,34 @@
-from typing import List, Dict, Any
-import yaml
+from typing import List, Dict, Any, Optional
+import copy
 import os
+from .codegen import get_code_generator
+from .fileio import write_if_changed
+from .template_registry import TemplateRegistry, get_template_registry, memory_gb
+from .tracing import span, traced
 
 class AgentDesigner:
-    def __init__(self):
-        self.templates = {
-            "basic": {
-                "name": "Basic Agent",
-                "description": "Simple agent with basic capabilities",
-                "requirements": {
-                    "memory": "2GB",
-                    "cpu_cores": 2,
-                    "python_packages": ["requests", "python-dotenv"]
-                },
-                "features": [
-                    "HTTP requests",
-                    "Environment variable management",
-                    "Basic error handling"
-                ]
-            },
-            "advanced": {
-                "name": "Advanced Agent",
-                "description": "Advanced agent with ML capabilities",
-                "requirements": {
-                    "memory": "8GB",
-                    "cpu_cores": 4,
-                    "python_packages": [
-                        "torch",
-                        "transformers",
-                        "numpy",
-                        "pandas"
-                    ]
-                },
-                "features": [
-                    "Machine learning inference",
-                    "Data processing",
-                    "Advanced error handling",
-                    "Logging and monitoring"
-                ]
-            }
-        }
+    def __init__(self, template_dir: Optional[str] = None, registry: Optional[TemplateRegistry] = None):
+        """Templates come from ``registry``, a registry for ``template_dir``,
+        or the shared registry of the default template directory"""
+        if registry is None:
+            registry = TemplateRegistry(template_dir) if template_dir else get_template_registry()
+        self.registry = registry
+
+    @property
+    def templates(self) -> Dict[str, Any]:
+        return self.registry.templates
 
     def get_templates(self) -> Dict[str, Any]:
         """Get available agent templates"""
         return self.templates
 
+    @traced("designer.create_config")
     def create_agent_config(self, template_name: str, customizations: Dict[str, Any]) -> Dict[str, Any]:
         """Create agent configuration based on template and customizations"""
         if template_name not in self.templates:
             raise ValueError(f"Template {template_name} not found")
 
-        base_config = self.templates[template_name].copy()
+        base_config = copy.deepcopy(self.templates[template_name])
         for key, value in customizations.items():
             if key in base_config:
                 if isinstance(base_config[key], dict):
@@ -60,63 +38,36 @@ class AgentDesigner:
 
         return base_config
 
+    @traced("designer.generate_code")
     def generate_agent_code(self, config: Dict[str, Any]) -> str:
-        """Generate Python code for the agent based on configuration"""
-        code = f"""
-import os
-import logging
-from typing import Any, Dict
-
-class {config['name'].replace(' ', '')}:
-    def __init__(self):
-        self.name = "{config['name']}"
-        self.logger = self._setup_logging()
-        
-    def _setup_logging(self) -> logging.Logger:
-        logger = logging.getLogger(self.name)
-        logger.setLevel(logging.INFO)
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        return logger
-
-    def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        self.logger.info(f"Processing input: {{input_data}}")
-        try:
-            # Add custom processing logic here
-            result = {{"status": "success", "data": input_data}}
-            return result
-        except Exception as e:
-            self.logger.error(f"Error processing input: {{str(e)}}")
-            return {{"status": "error", "message": str(e)}}
-
-if __name__ == "__main__":
-    agent = {config['name'].replace(' ', '')}()
-    result = agent.run({{"test": "data"}})
-    print(result)
-"""
-        return code
+        """Generate Python code for the agent based on configuration (cached by config hash)"""
+        return get_code_generator().render(config)
 
+    @traced("designer.save_agent")
     def save_agent(self, name: str, config: Dict[str, Any], output_dir: str) -> str:
         """Save agent configuration and code to files"""
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Save configuration
-        config_path = os.path.join(output_dir, f"{name}_config.yaml")
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f)
-        
-        # Save agent code
+        return self.write_agent(name, config, output_dir)["code_path"]
+
+    def write_agent(self, name: str, config: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+        """Write ``<name>_config.yaml`` and ``<name>.py`` atomically, skipping files whose content is unchanged"""
+        import yaml  # only needed here; keeps `import core.agent_designer` cheap
+
+        config_text = yaml.dump(config, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
         code = self.generate_agent_code(config)
+        config_path = os.path.join(output_dir, f"{name}_config.yaml")
         code_path = os.path.join(output_dir, f"{name}.py")
-        with open(code_path, 'w') as f:
-            f.write(code)
-            
-        return code_path
+        with span("designer.write_config"):
+            config_written = write_if_changed(config_path, config_text)
+        with span("designer.write_code"):
+            code_written = write_if_changed(code_path, code)
+        return {
+            "config_path": config_path,
+            "code_path": code_path,
+            "written": [path for path, written in ((config_path, config_written), (code_path, code_written))
+                        if written]
+        }
 
+    @traced("designer.checklist")
     def get_deployment_checklist(self, config: Dict[str, Any]) -> List[str]:
         """Generate deployment checklist based on agent configuration"""
         checklist = [
@@ -142,12 +93,20 @@ if __name__ == "__main__":
         
         return checklist
 
-    def validate_system_compatibility(self, config: Dict[str, Any], system_info: Dict[str, Any]) -> List[str]:
-        """Validate if the system meets agent requirements"""
+    @traced("designer.validate")
+    def validate_system_compatibility(self, config: Dict[str, Any], system_info: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Validate if the system meets agent requirements
+
+        system_info is a scan result or ScanSnapshot; when omitted the shared
+        cached snapshot is used instead of triggering a fresh scan.
+        """
+        if system_info is None:
+            from .system_scanner import SystemScanner
+            system_info = SystemScanner().get_snapshot()
         issues = []
         
         # Check memory
-        required_memory = float(config['requirements']['memory'].replace('GB', ''))
+        required_memory = memory_gb(config['requirements']['memory'])
         system_memory = system_info['hardware_info']['total_memory'] / (1024 ** 3)
         if system_memory < required_memory:
             issues.append(f"Insufficient memory: {system_memory:.1f}GB available, {required_memory}GB required")
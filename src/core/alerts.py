@@ -0,0 +1,201 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+OK = "ok"
+PENDING = "pending"
+FIRING = "firing"
+RESOLVED = "resolved"
+
+
+class AlertRule:
+    """Threshold on one metric.
+
+    The rule fires once the metric has been past ``threshold`` for
+    ``sustain`` seconds, and resolves only after it comes back past
+    ``threshold - hysteresis`` (or ``+`` for "below" rules), so a value
+    hovering around the threshold does not flap. After firing, the rule will
+    not fire again for ``cooldown`` seconds.
+    """
+
+    def __init__(self, name: str, metric: str, threshold: float,
+                 direction: str = "above", sustain: float = 0.0,
+                 hysteresis: float = 0.0, cooldown: float = 0.0,
+                 severity: str = "high", message: Optional[str] = None):
+        if direction not in ("above", "below"):
+            raise ValueError(f"Unknown direction: {direction}")
+        self.name = name
+        self.metric = metric
+        self.threshold = float(threshold)
+        self.direction = direction
+        self.sustain = max(float(sustain), 0.0)
+        self.hysteresis = max(float(hysteresis), 0.0)
+        self.cooldown = max(float(cooldown), 0.0)
+        self.severity = severity
+        self.message = message or f"{metric} {direction} {threshold:g}"
+
+        self.state = OK
+        self.pending_since: Optional[float] = None
+        self.last_fired: Optional[float] = None
+        self.last_value: Optional[float] = None
+
+    def breached(self, value: float) -> bool:
+        if self.direction == "above":
+            return value > self.threshold
+        return value < self.threshold
+
+    def recovered(self, value: float) -> bool:
+        if self.direction == "above":
+            return value < self.threshold - self.hysteresis
+        return value > self.threshold + self.hysteresis
+
+    def evaluate(self, value: float, timestamp: float) -> Optional[str]:
+        """Advance the state machine by one sample; returns FIRING or RESOLVED on a transition"""
+        self.last_value = value
+        if self.state == FIRING:
+            if self.recovered(value):
+                self.state = OK
+                self.pending_since = None
+                return RESOLVED
+            return None
+
+        if not self.breached(value):
+            self.state = OK
+            self.pending_since = None
+            return None
+        if self.state == OK:
+            self.state = PENDING
+            self.pending_since = timestamp
+        if timestamp - self.pending_since < self.sustain:
+            return None
+        if self.last_fired is not None and timestamp - self.last_fired < self.cooldown:
+            return None  # stays pending; fires once the cooldown has passed
+        self.state = FIRING
+        self.last_fired = timestamp
+        return FIRING
+
+    def reset(self) -> None:
+        self.state = OK
+        self.pending_since = None
+        self.last_value = None
+
+
+class AlertEvent:
+    """A rule starting or stopping to fire"""
+
+    def __init__(self, rule: AlertRule, kind: str, value: float, timestamp: float):
+        self.rule = rule.name
+        self.metric = rule.metric
+        self.kind = kind
+        self.value = value
+        self.threshold = rule.threshold
+        self.severity = rule.severity
+        self.message = rule.message
+        self.timestamp = timestamp
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "rule": self.rule,
+            "metric": self.metric,
+            "kind": self.kind,
+            "value": self.value,
+            "threshold": self.threshold,
+            "severity": self.severity,
+            "message": self.message,
+            "timestamp": self.timestamp
+        }
+
+    def __repr__(self) -> str:
+        return f"AlertEvent({self.rule!r}, {self.kind}, value={self.value})"
+
+
+class AlertEngine:
+    """Evaluates threshold rules against a stream of metric samples.
+
+    Rules are indexed by metric name, so a sample only touches the rules
+    watching that metric and each of those does constant work. Listeners
+    are only notified while ``enabled`` is true (the notification_enabled
+    setting); rule state keeps advancing either way.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._rules: Dict[str, AlertRule] = {}
+        self._by_metric: Dict[str, List[AlertRule]] = {}
+        self._listeners: List[Callable[[AlertEvent], None]] = []
+        self._lock = threading.Lock()
+
+    def add_rule(self, rule: AlertRule) -> None:
+        """Add a rule, replacing any rule with the same name"""
+        with self._lock:
+            self._remove(rule.name)
+            self._rules[rule.name] = rule
+            self._by_metric.setdefault(rule.metric, []).append(rule)
+
+    def remove_rule(self, name: str) -> None:
+        with self._lock:
+            self._remove(name)
+
+    def _remove(self, name: str) -> None:
+        rule = self._rules.pop(name, None)
+        if rule is None:
+            return
+        watchers = self._by_metric[rule.metric]
+        watchers.remove(rule)
+        if not watchers:
+            del self._by_metric[rule.metric]
+
+    def get_rule(self, name: str) -> Optional[AlertRule]:
+        return self._rules.get(name)
+
+    def rules(self) -> List[AlertRule]:
+        return list(self._rules.values())
+
+    def add_listener(self, callback: Callable[[AlertEvent], None]) -> None:
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[AlertEvent], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def observe(self, metric: str, value: float, timestamp: Optional[float] = None) -> List[AlertEvent]:
+        """Feed one sample; returns the events it triggered"""
+        watchers = self._by_metric.get(metric)
+        if not watchers:
+            return []
+        return self.observe_many({metric: value}, timestamp)
+
+    def observe_many(self, values: Dict[str, float], timestamp: Optional[float] = None) -> List[AlertEvent]:
+        """Feed several metrics sampled at the same moment"""
+        ts = time.time() if timestamp is None else timestamp
+        events = []
+        with self._lock:
+            for metric, value in values.items():
+                for rule in self._by_metric.get(metric, ()):
+                    kind = rule.evaluate(value, ts)
+                    if kind is not None:
+                        events.append(AlertEvent(rule, kind, value, ts))
+        if events and self.enabled:
+            for event in events:
+                for callback in list(self._listeners):
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        print(f"Error in alert listener: {e}")
+        return events
+
+    def active(self) -> List[AlertRule]:
+        """Get the rules that are currently firing"""
+        return [rule for rule in self._rules.values() if rule.state == FIRING]
+
+
+def default_alert_rules(settings: Dict[str, Any]) -> List[AlertRule]:
+    """Rules for the max_cpu_usage / max_memory_usage device settings"""
+    return [
+        AlertRule("cpu", "cpu.percent", settings["max_cpu_usage"],
+                  sustain=10, hysteresis=5, cooldown=300,
+                  message=f"CPU usage above {settings['max_cpu_usage']}%"),
+        AlertRule("memory", "memory.percent", settings["max_memory_usage"],
+                  sustain=10, hysteresis=5, cooldown=300,
+                  message=f"Memory usage above {settings['max_memory_usage']}%")
+    ]
@@ -0,0 +1,186 @@
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+import psutil
+from .collectors import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+
+def choose_mode(cpu_percent: float, memory_percent: float) -> str:
+    """Pick a performance mode for the given load (same bands as "Optimize System")"""
+    if cpu_percent > 80 or memory_percent > 80:
+        return "performance"
+    if cpu_percent < 20 and memory_percent < 40:
+        return "power_save"
+    return "balanced"
+
+
+class AutoOptimizer:
+    """Switches ``performance_mode`` from smoothed load while auto_optimize is on.
+
+    CPU and memory usage are smoothed with a time-based EWMA fed by every
+    background CPU sample, so one spike never decides anything. A mode
+    change is held back until the current mode has been in effect for
+    ``min_dwell`` seconds. Automatic switches go through
+    ``DeviceSettings.apply_runtime_mode``: they change the sampling interval,
+    scan pool size and monitoring interval for the session only, and leave
+    the saved settings and alert thresholds alone. They are applied on the
+    optimizer's own worker thread so the shared sampler is never held up.
+    ``optimize_now`` is a user action and applies the mode like choosing it
+    by hand. Every decision is logged with the values that triggered it.
+    """
+
+    def __init__(self, settings, half_life: float = 30.0, min_dwell: float = 300.0,
+                 warmup: Optional[float] = None):
+        self.settings = settings
+        self.half_life = half_life
+        self.min_dwell = min_dwell
+        self.warmup = half_life if warmup is None else warmup
+        self.cpu_ewma: Optional[float] = None
+        self.memory_ewma: Optional[float] = None
+        self._first_sample: Optional[float] = None
+        self._last_sample: Optional[float] = None
+        self._last_switch: Optional[float] = None
+        self._held_target: Optional[str] = None
+        self.decisions: deque = deque(maxlen=100)
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+        self._worker = WorkerPool(1, name="auto-optimizer")
+
+    def start(self) -> None:
+        """Seed from the sampler's history and follow new samples"""
+        sampler = self.settings.cpu_sampler
+        memory = psutil.virtual_memory().percent
+        for timestamp, per_core in sampler.history(self.half_life * 4):
+            self._smooth(_average(per_core), memory, timestamp)
+        sampler.remove_listener(self._on_sample)
+        sampler.add_listener(self._on_sample)
+
+    def stop(self) -> None:
+        self.settings.cpu_sampler.remove_listener(self._on_sample)
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback for every mode switch (called from the optimizer's worker thread)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _on_sample(self, timestamp: float, per_core) -> None:
+        self.update(_average(per_core), psutil.virtual_memory().percent, timestamp)
+
+    def _smooth(self, cpu_percent: float, memory_percent: float, timestamp: float) -> None:
+        if self.cpu_ewma is None or self._last_sample is None:
+            self.cpu_ewma = cpu_percent
+            self.memory_ewma = memory_percent
+            self._first_sample = timestamp
+        else:
+            elapsed = max(timestamp - self._last_sample, 0.0)
+            weight = 1 - math.exp(-elapsed * math.log(2) / self.half_life)
+            self.cpu_ewma += weight * (cpu_percent - self.cpu_ewma)
+            self.memory_ewma += weight * (memory_percent - self.memory_ewma)
+        self._last_sample = timestamp
+
+    def update(self, cpu_percent: float, memory_percent: float,
+               timestamp: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Feed one sample; returns the decision if a switch was started
+
+        The switch itself is applied on the optimizer's worker thread, which
+        fills in ``decision["applied"]`` and then notifies listeners.
+        """
+        ts = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._smooth(cpu_percent, memory_percent, ts)
+            current = self.settings.get_runtime_settings()
+            if not current["auto_optimize"]:
+                self._held_target = None
+                return None
+            target = choose_mode(self.cpu_ewma, self.memory_ewma)
+            mode = current["performance_mode"]
+            if target == mode:
+                self._held_target = None
+                return None
+            if ts - self._first_sample < self.warmup:
+                return None
+            if self._last_switch is not None and ts - self._last_switch < self.min_dwell:
+                if self._held_target != target:
+                    self._held_target = target
+                    logger.info(
+                        "Holding %s mode instead of %s: last switch %.0fs ago, dwell is %.0fs "
+                        "(cpu ewma %.1f%%, memory ewma %.1f%%)",
+                        mode, target, ts - self._last_switch, self.min_dwell,
+                        self.cpu_ewma, self.memory_ewma
+                    )
+                return None
+            decision = self._switch(mode, target, ts, "auto")
+        self._worker.submit(self._apply, decision)
+        return decision
+
+    def optimize_now(self) -> Dict[str, Any]:
+        """Apply the mode for the current smoothed load right away, ignoring dwell time"""
+        with self._lock:
+            if self.cpu_ewma is None:
+                self._smooth(self.settings.cpu_sampler.percent(),
+                             psutil.virtual_memory().percent, time.time())
+            mode = self.settings.get_runtime_settings()["performance_mode"]
+            target = choose_mode(self.cpu_ewma, self.memory_ewma)
+            decision = self._switch(mode, target, time.time(), "manual")
+        self._apply(decision)
+        return decision
+
+    def _switch(self, mode: str, target: str, timestamp: float, trigger: str) -> Dict[str, Any]:
+        decision = {
+            "timestamp": timestamp,
+            "trigger": trigger,
+            "from": mode,
+            "to": target,
+            "cpu_ewma": round(self.cpu_ewma, 1),
+            "memory_ewma": round(self.memory_ewma, 1)
+        }
+        logger.info(
+            "Performance mode %s -> %s (%s; cpu ewma %.1f%%, memory ewma %.1f%%)",
+            mode, target, trigger, self.cpu_ewma, self.memory_ewma
+        )
+        self._last_switch = timestamp
+        self._held_target = None
+        self.decisions.append(decision)
+        return decision
+
+    def _apply(self, decision: Dict[str, Any]) -> None:
+        if decision["trigger"] == "auto":
+            apply = self.settings.apply_runtime_mode
+        else:
+            apply = self.settings.apply_optimization
+        try:
+            decision["applied"] = apply(decision["to"])
+        except Exception as e:
+            print(f"Error applying {decision['to']} mode: {e}")
+            decision["applied"] = False
+        self._notify(decision)
+
+    def _notify(self, decision: Dict[str, Any]) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(decision)
+            except Exception as e:
+                print(f"Error in auto-optimizer listener: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get controller state for diagnostics"""
+        return {
+            "enabled": self.settings.get_runtime_settings()["auto_optimize"],
+            "mode": self.settings.get_runtime_settings()["performance_mode"],
+            "cpu_ewma": None if self.cpu_ewma is None else round(self.cpu_ewma, 1),
+            "memory_ewma": None if self.memory_ewma is None else round(self.memory_ewma, 1),
+            "last_switch": self._last_switch,
+            "decisions": list(self.decisions)
+        }
+
+
+def _average(values) -> float:
+    return sum(values) / len(values) if values else 0.0
@@ -0,0 +1,207 @@
+"""Generate many agents from a manifest on a process pool.
+
+A manifest is a YAML (or JSON) file::
+
+    template_dir: ./templates     # optional, relative to the manifest
+    defaults:                     # optional, applied to every agent
+      template: basic
+      customizations: {requirements: {memory: 4GB}}
+    agents:
+      - file_name: acme_agent
+        customizations: {name: Acme Agent}
+      - file_name: globex_agent
+        template: advanced
+
+Each entry produces ``<file_name>_config.yaml`` and ``<file_name>.py`` in
+the output directory. Files are written atomically, and files whose
+content would not change are left alone, so re-running a manifest only
+rewrites the agents that differ.
+"""
+import math
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Union
+from .tracing import span
+
+# Below this many agents, generating in-process beats starting workers
+MIN_PARALLEL = 64
+
+_FILE_NAME = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.-]*$")
+
+
+def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _default_file_name(customizations: Dict[str, Any], index: int) -> str:
+    name = str(customizations.get("name") or f"agent_{index}")
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_") or f"agent_{index}"
+
+
+def parse_manifest(data: Any) -> Dict[str, Any]:
+    """Check a parsed manifest and expand defaults; raises ValueError"""
+    if isinstance(data, list):
+        data = {"agents": data}
+    if not isinstance(data, dict) or not isinstance(data.get("agents"), list):
+        raise ValueError("manifest must be a list of agents or a mapping with an 'agents' list")
+    defaults = data.get("defaults") or {}
+    if not isinstance(defaults, dict):
+        raise ValueError("'defaults' must be a mapping")
+
+    entries = []
+    seen = set()
+    for index, agent in enumerate(data["agents"]):
+        if not isinstance(agent, dict):
+            raise ValueError(f"agent #{index + 1} is not a mapping")
+        customizations = _merge(defaults.get("customizations") or {}, agent.get("customizations") or {})
+        template = agent.get("template") or defaults.get("template")
+        if not template:
+            raise ValueError(f"agent #{index + 1} has no template")
+        file_name = str(agent.get("file_name") or _default_file_name(customizations, index + 1))
+        if not _FILE_NAME.match(file_name):
+            raise ValueError(f"agent #{index + 1}: invalid file name {file_name!r}")
+        if file_name in seen:
+            raise ValueError(f"agent #{index + 1}: duplicate file name {file_name!r}")
+        seen.add(file_name)
+        entries.append({"file_name": file_name, "template": str(template),
+                        "customizations": customizations})
+    return {"template_dir": data.get("template_dir"), "agents": entries}
+
+
+def load_manifest(path: Union[str, os.PathLike]) -> Dict[str, Any]:
+    """Read and check a manifest file; raises ValueError if it is invalid.
+
+    A relative ``template_dir`` is resolved against the manifest's directory.
+    """
+    import yaml
+
+    with open(path, "rb") as f:
+        try:
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        except yaml.YAMLError as e:
+            raise ValueError(str(e))
+    manifest = parse_manifest(data)
+    if manifest["template_dir"]:
+        base = os.path.dirname(os.path.abspath(path))
+        manifest["template_dir"] = os.path.join(base, os.path.expanduser(str(manifest["template_dir"])))
+    return manifest
+
+
+def _generate(designer, entry: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+    try:
+        config = designer.create_agent_config(entry["template"], entry["customizations"])
+        result = designer.write_agent(entry["file_name"], config, output_dir)
+    except Exception as e:
+        return {"file_name": entry["file_name"], "status": "error", "error": str(e)}
+    return {
+        "file_name": entry["file_name"],
+        "status": "written" if result["written"] else "unchanged",
+        "code_path": result["code_path"]
+    }
+
+
+_worker_designer = None
+
+
+def _init_worker(template_dir: Optional[str]) -> None:
+    global _worker_designer
+    from .agent_designer import AgentDesigner
+
+    _worker_designer = AgentDesigner(template_dir)
+
+
+def _generate_chunk(entries: List[Dict[str, Any]], output_dir: str) -> List[Dict[str, Any]]:
+    return [_generate(_worker_designer, entry, output_dir) for entry in entries]
+
+
+class BatchGenerator:
+    """Creates, renders and writes many agents, fanning out over worker processes.
+
+    Each worker builds its own AgentDesigner (and template registry) once
+    and then handles chunks of entries, writing the files itself so that
+    rendering and disk I/O both run in parallel. Workers are started with
+    the "spawn" method, which is safe in a process that has threads
+    running (the GUI, the daemon). Small batches run in-process.
+    """
+
+    def __init__(self, output_dir: Union[str, os.PathLike], template_dir: Optional[str] = None,
+                 workers: Optional[int] = None, chunk_size: Optional[int] = None):
+        self.output_dir = os.fspath(output_dir)
+        self.template_dir = template_dir
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+
+    def run(self, entries: List[Dict[str, Any]],
+            progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Generate every entry; ``progress(done, total)`` is called as results arrive"""
+        return self._run(entries, progress, self.template_dir)
+
+    def run_manifest(self, path: Union[str, os.PathLike],
+                     progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """Load a manifest file and generate its agents
+
+        The manifest's ``template_dir`` applies to this run only, and only
+        when the generator was not given one.
+        """
+        manifest = load_manifest(path)
+        return self._run(manifest["agents"], progress, self.template_dir or manifest["template_dir"])
+
+    def _run(self, entries, progress, template_dir) -> Dict[str, Any]:
+        started = time.perf_counter()
+        os.makedirs(self.output_dir, exist_ok=True)
+        with span("batch.generate", agents=len(entries)):
+            if self.workers == 1 or len(entries) < MIN_PARALLEL:
+                results = self._run_local(entries, progress, template_dir)
+            else:
+                results = self._run_pool(entries, progress, template_dir)
+        return {
+            "total": len(entries),
+            "written": sum(1 for r in results if r["status"] == "written"),
+            "unchanged": sum(1 for r in results if r["status"] == "unchanged"),
+            "failed": [r for r in results if r["status"] == "error"],
+            "results": results,
+            "duration": round(time.perf_counter() - started, 3)
+        }
+
+    def _run_local(self, entries, progress, template_dir) -> List[Dict[str, Any]]:
+        from .agent_designer import AgentDesigner
+
+        designer = AgentDesigner(template_dir)
+        results = []
+        for entry in entries:
+            results.append(_generate(designer, entry, self.output_dir))
+            if progress is not None:
+                progress(len(results), len(entries))
+        return results
+
+    def _run_pool(self, entries, progress, template_dir) -> List[Dict[str, Any]]:
+        workers = min(self.workers, len(entries))
+        # Several chunks per worker keeps the pool busy when chunks take uneven time
+        size = self.chunk_size or max(1, min(256, math.ceil(len(entries) / (workers * 4))))
+        chunks = [entries[i:i + size] for i in range(0, len(entries), size)]
+        ordered: List[Optional[List[Dict[str, Any]]]] = [None] * len(chunks)
+        done = 0
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker, initargs=(template_dir,)) as pool:
+            futures = {pool.submit(_generate_chunk, chunk, self.output_dir): index
+                       for index, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    ordered[index] = future.result()
+                except Exception as e:
+                    ordered[index] = [{"file_name": entry["file_name"], "status": "error", "error": str(e)}
+                                      for entry in chunks[index]]
+                done += len(chunks[index])
+                if progress is not None:
+                    progress(done, len(entries))
+        return [result for chunk in ordered for result in chunk]
@@ -0,0 +1,721 @@
+"""Agent source code generation from precompiled fragments.
+
+Each known template feature ("HTTP requests", "Data processing", ...)
+maps to a ``Feature``: the imports, ``__init__`` lines, methods and
+``run()`` steps it contributes to the generated agent. Features a template
+declares that have no fragment get a ``handle_<feature>`` hook method, so
+every declared feature has a code path in the output.
+
+Fragments use ``$name`` placeholders and are compiled to ``str.format``
+strings once, at import time. Rendered modules are cached by a hash of the
+config, so regenerating an unchanged agent is a dictionary lookup.
+"""
+import builtins
+import hashlib
+import json
+import keyword
+import re
+import string
+import textwrap
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class Fragment:
+    """Source text with ``$name`` placeholders, compiled once to a format string"""
+
+    def __init__(self, source: str, indent: int = 0):
+        text = textwrap.dedent(source).strip("\n")
+        if indent:
+            text = textwrap.indent(text, " " * indent)
+        parts = []
+        position = 0
+        for match in string.Template.pattern.finditer(text):
+            parts.append(text[position:match.start()].replace("{", "{{").replace("}", "}}"))
+            if match.group("escaped") is not None:
+                parts.append("$")
+            else:
+                name = match.group("named") or match.group("braced")
+                if name is None:
+                    raise ValueError(f"Invalid placeholder in fragment at offset {match.start()}")
+                parts.append("{" + name + "}")
+            position = match.end()
+        parts.append(text[position:].replace("{", "{{").replace("}", "}}"))
+        self._format = "".join(parts)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        return self._format.format_map(values)
+
+
+class Feature:
+    """Code one template feature contributes to a generated agent"""
+
+    def __init__(self, key: str, aliases: Iterable[str] = (), imports: Iterable[str] = (),
+                 init: str = "", methods: str = "", steps: str = "", finish: str = "",
+                 call: str = "", helpers: Iterable[str] = (), order: int = 0,
+                 stdlib: Iterable[str] = ()):
+        self.key = key
+        # Steps run in ascending order, then in the order the template lists features
+        self.order = order
+        self.aliases = [feature_slug(alias) for alias in aliases] or [feature_slug(key)]
+        # Third-party imports and extra standard library imports
+        self.imports = list(imports)
+        self.stdlib = list(stdlib)
+        self.init = Fragment(init, 8) if init else None
+        self.methods = Fragment(methods, 4) if methods else None
+        self.steps = Fragment(steps, 12) if steps else None
+        self.finish = Fragment(finish, 8) if finish else None
+        # Replaces the agent's _call() wrapper (at most one feature should)
+        self.call = Fragment(call, 4) if call else None
+        # Module-level functions the fragments use
+        self.helpers = [textwrap.dedent(helper).strip("\n") for helper in helpers]
+
+
+def feature_slug(feature: str) -> str:
+    """Normalised feature name ("Logging and monitoring" -> "logging-and-monitoring")"""
+    return re.sub(r"[^a-z0-9]+", "-", feature.casefold()).strip("-")
+
+
+def class_name(name: str, reserved: Iterable[str] = ()) -> str:
+    """Python class name for an agent display name ("my agent 2" -> "MyAgent2")
+
+    A name that is a keyword ("none" -> "None"), a builtin or in ``reserved``
+    (names the generated module already binds) gets an "Agent" suffix.
+    """
+    words = re.findall(r"[A-Za-z0-9]+", name)
+    result = "".join(word[:1].upper() + word[1:] for word in words)
+    if not result or result[0].isdigit():
+        result = "Agent" + result
+    reserved = set(reserved)
+    while keyword.iskeyword(result) or hasattr(builtins, result) or result in reserved:
+        result += "Agent"
+    return result
+
+
+# Module-level names every generated agent binds besides its imports and helpers
+_MODULE_NAMES = ("FEATURES", "REQUIREMENTS")
+_TOP_LEVEL_NAME = re.compile(r"^(?:class\s+|def\s+|async\s+def\s+)?([A-Za-z_]\w*)\b(?=\s*[(:=])", re.M)
+
+
+def _bound_names(imports: Iterable[str], helpers: Iterable[str]) -> List[str]:
+    """Names bound at module level by import lines and helper source"""
+    names = list(_MODULE_NAMES)
+    for line in imports:
+        imported = line.split(" import ", 1)[1] if line.startswith("from ") else line[len("import "):]
+        names += [part.split(" as ")[-1].strip().split(".")[0] for part in imported.split(",")]
+    for helper in helpers:
+        names += _TOP_LEVEL_NAME.findall(helper)
+    return names
+
+
+def _docstring_text(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+
+
+_HEADER = Fragment('''
+    """$title
+
+    $description
+    Generated by AI Agent Assistant.
+    Requires $memory of memory and $cpu_cores CPU core(s).$install
+    """
+''')
+
+_MODULE = Fragment('''
+    $header
+    $stdlib$imports
+
+
+    ${helpers}FEATURES = $features
+    REQUIREMENTS = $requirements
+
+
+    class $class_name:
+        def __init__(self):
+            self.name = $name
+            self.logger = self._setup_logging()$init
+
+        def _setup_logging(self) -> logging.Logger:
+            logger = logging.getLogger(self.name)
+            logger.setLevel(logging.INFO)
+            if not logger.handlers:
+                handler = logging.StreamHandler()
+                formatter = logging.Formatter(
+                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+                )
+                handler.setFormatter(formatter)
+                logger.addHandler(handler)
+            return logger
+
+    $call$methods
+
+        def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+            started = time.perf_counter()
+            self.logger.info("Processing input: %s", input_data)
+            try:
+                result = {"status": "success", "data": input_data}$steps
+            except Exception as e:
+                self.logger.error("Error processing input: %s", e)
+                result = {"status": "error", "message": str(e)}$finish
+            self.logger.info("Finished in %.3fs", time.perf_counter() - started)
+            return result
+
+
+
+    $main
+''')
+
+_BASE_IMPORTS = ["import logging", "import os", "import time"]
+
+
+def _import_order(line: str):
+    """Plain imports first, then from-imports, each alphabetically"""
+    return line.startswith("from "), line
+
+
+_DEFAULT_CALL = Fragment('''
+    def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run one step of the pipeline"""
+        return func(*args, **kwargs)
+''', 4)
+
+_HOOK = Fragment('''
+    def handle_$slug(self, input_data: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """$feature: implement this feature here"""
+''', 4)
+
+_HOOK_STEP = Fragment('''
+    self.handle_$slug(input_data, result)
+''', 12)
+
+_HTTP_CLIENT = '''
+    _session = None
+    _session_lock = threading.Lock()
+
+
+    def http_session(pool_size: int = 10) -> requests.Session:
+        """Process-wide keep-alive session; retries connection errors and 429/5xx with backoff"""
+        global _session
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=int(os.environ.get("AGENT_HTTP_RETRIES", "3")),
+                    backoff_factor=float(os.environ.get("AGENT_HTTP_BACKOFF", "0.5")),
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=frozenset({"GET", "HEAD"}),
+                    raise_on_status=False
+                )
+                adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+            return _session
+
+
+    class CachedResponse:
+        def __init__(self, body: str, is_json: bool, expires: float, validators: Dict[str, str]):
+            self.body = body
+            self.is_json = is_json
+            self.expires = expires
+            self.validators = validators
+
+        def value(self) -> Any:
+            return json.loads(self.body) if self.is_json else self.body
+
+
+    class ResponseCache:
+        """LRU cache of GET responses; entry lifetimes follow Cache-Control, Expires and Age.
+
+        Responses without caching headers live for ``default_ttl`` seconds
+        (by default they are not stored).
+        Expired entries that carry an ETag or Last-Modified are kept and
+        revalidated with a conditional request.
+        """
+
+        def __init__(self, max_entries: int = 256, default_ttl: float = 0.0):
+            self.max_entries = max_entries
+            self.default_ttl = default_ttl
+            self.hits = 0
+            self.misses = 0
+            self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+            self._lock = threading.Lock()
+
+        def lifetime(self, headers) -> Optional[float]:
+            """Seconds a response may be reused, or None if it must not be stored"""
+            directives = {}
+            for part in headers.get("Cache-Control", "").split(","):
+                name, _, value = part.strip().partition("=")
+                if name:
+                    directives[name.lower()] = value.strip('"')
+            if "no-store" in directives:
+                return None
+            if "no-cache" in directives:
+                return 0.0
+            try:
+                age = max(float(headers.get("Age") or 0), 0.0)
+            except ValueError:
+                age = 0.0  # a malformed Age header must not break the request
+            if "max-age" in directives:
+                try:
+                    return max(float(directives["max-age"]) - age, 0.0)
+                except ValueError:
+                    return 0.0
+            if "Expires" in headers:
+                try:
+                    return max(parsedate_to_datetime(headers["Expires"]).timestamp() - time.time(), 0.0)
+                except (TypeError, ValueError):
+                    return 0.0
+            return self.default_ttl
+
+        def get(self, key: str) -> Optional[CachedResponse]:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                return entry
+
+        def record_hit(self) -> None:
+            with self._lock:
+                self.hits += 1
+
+        def record_miss(self) -> None:
+            with self._lock:
+                self.misses += 1
+
+        def store(self, key: str, response: requests.Response) -> None:
+            lifetime = self.lifetime(response.headers)
+            validators = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            if lifetime is None or (lifetime <= 0 and not validators):
+                return
+            entry = CachedResponse(response.text, "json" in response.headers.get("Content-Type", ""),
+                                   time.monotonic() + lifetime, validators)
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        def refresh(self, entry: CachedResponse, response: requests.Response) -> None:
+            """Extend an entry after the server answered 304 Not Modified"""
+            lifetime = self.lifetime(response.headers)
+            entry.expires = time.monotonic() + (lifetime or 0.0)
+'''
+
+_JSON_SAFE = '''
+    def json_safe(value: Any) -> Any:
+        """Replace NaN and numpy scalars so a result can be serialised"""
+        if isinstance(value, dict):
+            return {str(k): json_safe(v) for k, v in value.items()}
+        if hasattr(value, "item"):
+            value = value.item()
+        if isinstance(value, float) and value != value:
+            return None
+        return value
+'''
+
+BUILTIN_FEATURES = [
+    Feature(
+        "http",
+        aliases=["HTTP requests", "HTTP client"],
+        imports=["import requests", "from requests.adapters import HTTPAdapter",
+                 "from urllib3.util.retry import Retry"],
+        stdlib=["import json", "import threading", "from collections import OrderedDict",
+                "from email.utils import parsedate_to_datetime"],
+        helpers=[_HTTP_CLIENT],
+        init='''
+            self.http_timeout = float(os.environ.get("AGENT_HTTP_TIMEOUT", "10"))
+            self.session = http_session(int(os.environ.get("AGENT_MAX_CONCURRENCY", "10")))
+            # AGENT_CACHE_SIZE=0 turns the response cache off
+            cache_size = int(os.environ.get("AGENT_CACHE_SIZE", "256"))
+            self.cache = ResponseCache(cache_size, float(os.environ.get("AGENT_CACHE_TTL", "0"))) if cache_size else None
+        ''',
+        methods='''
+            def fetch(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+                """GET a URL; returns the decoded JSON body, or the text for other content.
+
+                Plain GETs (no extra request options) are answered from the
+                response cache while fresh, and revalidated once stale.
+                """
+                key = entry = None
+                headers = dict(kwargs.pop("headers", None) or {})
+                if self.cache is not None and not kwargs and not headers:
+                    key = requests.Request("GET", url, params=params).prepare().url
+                    entry = self.cache.get(key)
+                    if entry is not None:
+                        if entry.expires > time.monotonic():
+                            self.cache.record_hit()
+                            return entry.value()
+                        headers.update(entry.validators)
+                    self.cache.record_miss()
+                response = self.session.get(url, params=params, headers=headers,
+                                            timeout=self.http_timeout, **kwargs)
+                if response.status_code == 304 and entry is not None:
+                    self.cache.refresh(entry, response)
+                    return entry.value()
+                response.raise_for_status()
+                if key is not None:
+                    self.cache.store(key, response)
+                if "json" in response.headers.get("Content-Type", ""):
+                    return response.json()
+                return response.text
+        ''',
+        steps='''
+            if "url" in input_data:
+                result["response"] = self._call(self.fetch, input_data["url"])
+        '''
+    ),
+    Feature(
+        "environment",
+        aliases=["Environment variable management", "Configuration management"],
+        imports=["from dotenv import load_dotenv"],
+        init='''
+            load_dotenv()
+            self.env_prefix = os.environ.get("AGENT_ENV_PREFIX", "AGENT_")
+        ''',
+        methods='''
+            def get_setting(self, key: str, default: Any = None) -> Any:
+                """Read a setting from the environment (or .env), with the agent prefix"""
+                return os.environ.get(self.env_prefix + key, default)
+        '''
+    ),
+    Feature(
+        "validation",
+        aliases=["Basic error handling", "Input validation"],
+        methods='''
+            def _validate_input(self, input_data: Any) -> None:
+                if not isinstance(input_data, dict):
+                    raise TypeError(f"input must be a dict, got {type(input_data).__name__}")
+        ''',
+        steps='''
+            self._validate_input(input_data)
+        ''',
+        order=-1
+    ),
+    Feature(
+        "retries",
+        aliases=["Advanced error handling", "Retries"],
+        init='''
+            self.max_retries = int(os.environ.get("AGENT_MAX_RETRIES", "3"))
+            self.retry_backoff = float(os.environ.get("AGENT_RETRY_BACKOFF", "0.5"))
+        ''',
+        call='''
+            def _call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+                """Run one step of the pipeline, retrying failures with exponential backoff"""
+                for attempt in range(self.max_retries + 1):
+                    try:
+                        return func(*args, **kwargs)
+                    except (ImportError, TypeError, ValueError):
+                        raise  # missing package or bad input; retrying will not help
+                    except Exception as e:
+                        if attempt == self.max_retries:
+                            raise
+                        delay = self.retry_backoff * 2 ** attempt
+                        self.logger.warning("%s failed (%s), retrying in %.1fs",
+                                            getattr(func, "__name__", func), e, delay)
+                        time.sleep(delay)
+        '''
+    ),
+    Feature(
+        "monitoring",
+        aliases=["Logging and monitoring", "Monitoring"],
+        stdlib=["import threading"],
+        init='''
+            self.metrics = {"runs": 0, "errors": 0, "seconds": 0.0}
+            self._metrics_lock = threading.Lock()
+        ''',
+        methods='''
+            def get_metrics(self) -> Dict[str, Any]:
+                """Run counters and the mean run time in seconds"""
+                with self._metrics_lock:
+                    metrics = dict(self.metrics)
+                runs = metrics["runs"]
+                return {**metrics, "mean_seconds": metrics["seconds"] / runs if runs else 0.0}
+        ''',
+        finish='''
+            with self._metrics_lock:
+                self.metrics["runs"] += 1
+                self.metrics["seconds"] += time.perf_counter() - started
+                if result["status"] == "error":
+                    self.metrics["errors"] += 1
+        '''
+    ),
+    Feature(
+        "inference",
+        aliases=["Machine learning inference", "Model inference"],
+        init='''
+            self.model_name = os.environ.get("AGENT_MODEL", "distilbert-base-uncased-finetuned-sst-2-english")
+            self._pipeline = None
+        ''',
+        methods='''
+            def predict(self, text: str) -> Any:
+                """Run the model on one input; the model is loaded on first use"""
+                if self._pipeline is None:
+                    from transformers import pipeline
+
+                    self.logger.info("Loading model %s", self.model_name)
+                    self._pipeline = pipeline(model=self.model_name)
+                return self._pipeline(text)
+        ''',
+        steps='''
+            if "text" in input_data:
+                result["prediction"] = self._call(self.predict, input_data["text"])
+        '''
+    ),
+    Feature(
+        "data",
+        aliases=["Data processing"],
+        helpers=[_JSON_SAFE],
+        methods='''
+            def process_records(self, records: Any) -> Dict[str, Any]:
+                """Summarise a list of records (dicts) column by column"""
+                import pandas as pd
+
+                frame = pd.DataFrame(records)
+                return {
+                    "rows": len(frame),
+                    "columns": list(frame.columns),
+                    "summary": json_safe(frame.describe(include="all").to_dict())
+                }
+        ''',
+        steps='''
+            if "records" in input_data:
+                result["summary"] = self._call(self.process_records, input_data["records"])
+        '''
+    )
+]
+
+# Added for configs with runtime: async. The synchronous pipeline runs on a
+# thread pool sized to the concurrency limit, so blocking I/O in one request
+# (requests, model calls) does not hold up the others.
+ASYNC_RUNTIME = Feature(
+    "async-runtime",
+    stdlib=["import asyncio", "import weakref", "from concurrent.futures import ThreadPoolExecutor"],
+    init='''
+        self.max_concurrency = int(os.environ.get("AGENT_MAX_CONCURRENCY", "10"))
+        self.request_timeout = float(os.environ.get("AGENT_REQUEST_TIMEOUT", "30"))
+        self._executor = ThreadPoolExecutor(self.max_concurrency, thread_name_prefix="agent")
+        # One semaphore per event loop; each run_batch() call runs a new loop
+        self._semaphores = weakref.WeakKeyDictionary()
+    ''',
+    methods='''
+        async def arun(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+            """Process one input without blocking the event loop.
+
+            At most ``max_concurrency`` inputs are processed at once; an input
+            still running ``request_timeout`` seconds after it started is
+            reported as an error (its worker thread finishes in the background).
+            """
+            loop = asyncio.get_running_loop()
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+            async with semaphore:
+                started = asyncio.Event()
+                future = loop.run_in_executor(self._executor, self._run_started, loop, started, input_data)
+                try:
+                    # Time spent queued behind timed-out calls that still hold a thread does not count
+                    await started.wait()
+                    return await asyncio.wait_for(future, self.request_timeout)
+                except asyncio.TimeoutError:
+                    self.logger.error("Timed out after %.1fs", self.request_timeout)
+                    return {"status": "error", "message": f"timed out after {self.request_timeout}s"}
+
+        def _run_started(self, loop: asyncio.AbstractEventLoop, started: asyncio.Event,
+                         input_data: Dict[str, Any]) -> Dict[str, Any]:
+            """Run on a worker thread, telling arun() when the call actually starts"""
+            loop.call_soon_threadsafe(started.set)
+            return self.run(input_data)
+
+        async def run_many(self, inputs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            """Process many inputs concurrently; results are in input order"""
+            return list(await asyncio.gather(*(self.arun(input_data) for input_data in inputs)))
+
+        def run_batch(self, inputs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            """Synchronous entry point for ``run_many``"""
+            return asyncio.run(self.run_many(inputs))
+
+        def close(self) -> None:
+            self._executor.shutdown(wait=False)
+    '''
+)
+
+_SYNC_MAIN = Fragment('''
+    if __name__ == "__main__":
+        agent = $class_name()
+        result = agent.run({"test": "data"})
+        print(result)
+''')
+
+_ASYNC_MAIN = Fragment('''
+    if __name__ == "__main__":
+        agent = $class_name()
+        results = agent.run_batch([{"test": "data", "index": i} for i in range(3)])
+        print(results)
+        agent.close()
+''')
+
+
+class CodeGenerator:
+    """Renders agent modules from configs, caching results by config hash"""
+
+    def __init__(self, features: Optional[Iterable[Feature]] = None, cache_size: int = 512):
+        self._features: Dict[str, Feature] = {}
+        for feature in BUILTIN_FEATURES if features is None else features:
+            self.register_feature(feature)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def register_feature(self, feature: Feature) -> None:
+        """Add or replace the fragment for a feature (by any of its aliases)"""
+        for alias in feature.aliases:
+            self._features[alias] = feature
+        if hasattr(self, "_cache"):
+            self.clear_cache()
+
+    def feature_for(self, name: str) -> Optional[Feature]:
+        return self._features.get(feature_slug(name))
+
+    @staticmethod
+    def config_hash(config: Dict[str, Any]) -> str:
+        data = json.dumps(config, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    def render(self, config: Dict[str, Any]) -> str:
+        """Source code of the agent for a config (cached)"""
+        return self._render_cached(config, self.config_hash(config))
+
+    def render_many(self, configs: Iterable[Dict[str, Any]]) -> List[str]:
+        """Render many configs; identical configs are rendered once"""
+        rendered: Dict[str, str] = {}
+        result = []
+        for config in configs:
+            key = self.config_hash(config)
+            code = rendered.get(key)
+            if code is None:
+                code = rendered[key] = self._render_cached(config, key)
+            result.append(code)
+        return result
+
+    def _render_cached(self, config: Dict[str, Any], key: str) -> str:
+        with self._lock:
+            code = self._cache.get(key)
+            if code is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return code
+        code = self._render(config)
+        with self._lock:
+            self.misses += 1
+            if self.cache_size > 0:
+                self._cache[key] = code
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return code
+
+    def _render(self, config: Dict[str, Any]) -> str:
+        requirements = config.get("requirements", {})
+        packages = [str(p) for p in requirements.get("python_packages", [])]
+        declared = [str(f) for f in config.get("features", [])]
+
+        features: List[Feature] = []
+        hooks: Dict[str, Dict[str, str]] = {}
+        hooked = set()
+        for name in declared:
+            feature = self.feature_for(name)
+            if feature is not None:
+                if feature not in features:
+                    features.append(feature)
+                continue
+            if name.strip().casefold() in hooked:
+                continue
+            hooked.add(name.strip().casefold())
+            slug = feature_slug(name).replace("-", "_")
+            if not slug or slug in hooks:
+                # Non-ASCII names, or names differing only in punctuation; the hash keeps them apart
+                slug = f"{slug or 'feature'}_{hashlib.sha1(name.encode('utf-8')).hexdigest()[:8]}"
+            hooks[slug] = {"slug": slug, "feature": _docstring_text(name)}
+
+        runtime = config.get("runtime", "sync")
+        if runtime == "async":
+            features.append(ASYNC_RUNTIME)
+        elif runtime != "sync":
+            raise ValueError(f"Unknown runtime: {runtime}")
+
+        imports = sorted({line for feature in features for line in feature.imports}, key=_import_order)
+        stdlib = sorted({*_BASE_IMPORTS, *(line for feature in features for line in feature.stdlib)},
+                        key=_import_order)
+        typing_names = ["Any", "Callable", "Dict"]
+        if runtime == "async":
+            typing_names += ["Iterable", "List"]
+        if any(feature.key == "http" for feature in features):
+            typing_names.append("Optional")
+        helpers = [helper for feature in features for helper in feature.helpers]
+        call = next((feature.call for feature in features if feature.call), _DEFAULT_CALL)
+        methods = [feature.methods.render({}) for feature in features if feature.methods]
+        methods += [_HOOK.render(values) for values in hooks.values()]
+        steps = [feature.steps.render({}) for feature in sorted(features, key=lambda f: f.order)
+                 if feature.steps]
+        steps += [_HOOK_STEP.render(values) for values in hooks.values()]
+
+        name = str(config.get("name") or "Agent")
+        typing_line = f"from typing import {', '.join(sorted(typing_names))}"
+        agent_class = class_name(name, _bound_names([*stdlib, typing_line, *imports], helpers))
+        header = _HEADER.render({
+            "title": _docstring_text(name),
+            "description": _docstring_text(str(config.get("description") or "AI agent")),
+            "memory": _docstring_text(str(requirements.get("memory", "?"))),
+            "cpu_cores": requirements.get("cpu_cores", 1),
+            "install": ("\nInstall dependencies with: pip install " + _docstring_text(" ".join(packages)))
+            if packages else ""
+        })
+        return _MODULE.render({
+            "header": header,
+            "stdlib": "\n".join(stdlib + [typing_line]),
+            "main": (_ASYNC_MAIN if runtime == "async" else _SYNC_MAIN).render({"class_name": agent_class}),
+            "imports": "".join("\n" + line for line in (["", *imports] if imports else [])),
+            "helpers": "".join(helper + "\n\n\n" for helper in helpers),
+            # JSON strings, lists and numbers are valid Python literals
+            "features": json.dumps(declared, ensure_ascii=False),
+            "requirements": json.dumps({
+                "memory": str(requirements.get("memory", "")),
+                "cpu_cores": int(requirements.get("cpu_cores", 1)),
+                "python_packages": packages
+            }, indent=4, ensure_ascii=False),
+            "class_name": agent_class,
+            "name": json.dumps(name, ensure_ascii=False),
+            "init": "".join("\n" + feature.init.render({}) for feature in features if feature.init),
+            "call": call.render({}),
+            "methods": "".join("\n\n" + method for method in methods),
+            "steps": "".join("\n" + step for step in steps),
+            "finish": "".join("\n" + feature.finish.render({}) for feature in features if feature.finish)
+        }) + "\n"
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get cache statistics for diagnostics"""
+        return {"cached": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+_shared_generator: Optional[CodeGenerator] = None
+_shared_lock = threading.Lock()
+
+
+def get_code_generator() -> CodeGenerator:
+    """Get the process-wide code generator"""
+    global _shared_generator
+    with _shared_lock:
+        if _shared_generator is None:
+            _shared_generator = CodeGenerator()
+        return _shared_generator
@@ -0,0 +1,237 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from .tracing import span
+
+
+class WorkerPool:
+    """Small resizable pool of daemon worker threads.
+
+    Unlike ``ThreadPoolExecutor`` the workers are daemon threads, so a probe
+    that hangs past its timeout can never block interpreter shutdown.
+    """
+
+    def __init__(self, max_workers: int = 4, name: str = "collector"):
+        self.name = name
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers: List[threading.Thread] = []
+        self._idle = 0
+        self._pending = 0
+        self._spawned = 0
+        self._running: Dict[Future, threading.Thread] = {}
+        self._max_workers = max(1, max_workers)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def resize(self, max_workers: int) -> None:
+        """Change the worker limit; surplus workers exit once idle"""
+        with self._lock:
+            self._max_workers = max(1, max_workers)
+            surplus = len(self._workers) - self._max_workers
+        for _ in range(max(0, surplus)):
+            self._queue.put(None)
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._pending += 1
+            worker = self._spawn_if_needed()
+        self._queue.put((future, func, args, kwargs))
+        if worker is not None:
+            worker.start()
+        return future
+
+    def detach(self, future: Future) -> None:
+        """Give up on a call that overran its timeout.
+
+        The worker running it stops counting against the limit and exits
+        as soon as the call returns, and a replacement is started if work
+        is queued, so a hung probe cannot hold a slot in the pool forever.
+        """
+        with self._lock:
+            worker = self._running.pop(future, None)
+            if worker is None or worker not in self._workers:
+                return
+            self._workers.remove(worker)
+            replacement = self._spawn_if_needed()
+        if replacement is not None:
+            replacement.start()
+
+    def _spawn_if_needed(self) -> Optional[threading.Thread]:
+        # Called with the lock held; the caller starts the returned thread
+        if self._pending <= self._idle or len(self._workers) >= self._max_workers:
+            return None
+        self._spawned += 1
+        worker = threading.Thread(target=self._work, name=f"{self.name}-{self._spawned}", daemon=True)
+        self._workers.append(worker)
+        return worker
+
+    def _work(self) -> None:
+        current = threading.current_thread()
+        while True:
+            with self._lock:
+                self._idle += 1
+            item = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+                if item is None:
+                    self._workers.remove(current)
+                    return
+                self._pending -= 1
+            future, func, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._lock:
+                self._running[future] = current
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            with self._lock:
+                self._running.pop(future, None)
+                if current not in self._workers:
+                    # Detached after a timeout; a replacement has taken our place
+                    return
+
+
+_shared_pool: Optional[WorkerPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_worker_pool() -> WorkerPool:
+    """Get the process-wide collector pool shared by every scanner"""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = WorkerPool(4)
+        return _shared_pool
+
+
+class Collector:
+    """One named section of a scan"""
+
+    def __init__(self, name: str, func: Callable[[], Any], timeout: float = 10.0):
+        self.name = name
+        self.func = func
+        self.timeout = timeout
+
+
+class CollectorResult:
+    """Outcome of running one collector"""
+
+    def __init__(self, name: str, status: str, data: Any = None,
+                 error: Optional[str] = None, duration: float = 0.0):
+        self.name = name
+        self.status = status  # ok, error, timeout
+        self.data = data
+        self.error = error
+        self.duration = duration
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def section(self) -> Any:
+        """Get the data to store in the scan, or an error marker"""
+        if self.ok:
+            return self.data
+        return {"error": self.error}
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "duration": round(self.duration, 6),
+            "error": self.error
+        }
+
+
+class CollectorRegistry:
+    """Ordered registry of scan collectors run concurrently on a worker pool"""
+
+    def __init__(self, pool: Optional[WorkerPool] = None):
+        self._collectors: Dict[str, Collector] = {}
+        self.pool = pool or get_worker_pool()
+
+    def register(self, name: str, func: Callable[[], Any], timeout: float = 10.0) -> Collector:
+        """Add or replace a collector"""
+        collector = Collector(name, func, timeout)
+        self._collectors[name] = collector
+        return collector
+
+    def unregister(self, name: str) -> None:
+        self._collectors.pop(name, None)
+
+    def get(self, name: str) -> Optional[Collector]:
+        return self._collectors.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._collectors)
+
+    def iter_results(self, names: Optional[List[str]] = None) -> Iterator[CollectorResult]:
+        """Run collectors concurrently and yield each result as soon as it is ready
+
+        A collector's timeout counts from when it starts running, not from
+        when it was queued behind other work on the shared pool.
+        """
+        collectors = [self._collectors[n] for n in (names or self._collectors)]
+        started: Dict[str, float] = {}
+        wake = threading.Event()
+        pending = {}
+        for collector in collectors:
+            future = self.pool.submit(self._timed, collector.func, collector.name, started, wake)
+            future.add_done_callback(lambda _: wake.set())
+            pending[future] = collector
+
+        while pending:
+            wake.clear()
+            now = time.perf_counter()
+            deadlines = {f: started[c.name] + c.timeout
+                         for f, c in pending.items() if c.name in started}
+            finished = [f for f in pending if f.done()]
+            expired = [f for f, deadline in deadlines.items()
+                       if not f.done() and deadline <= now]
+            for future in finished:
+                yield self._result(pending.pop(future), future)
+            for future in expired:
+                collector = pending.pop(future)
+                self.pool.detach(future)
+                yield CollectorResult(
+                    collector.name, "timeout",
+                    error=f"Timed out after {collector.timeout}s",
+                    duration=collector.timeout
+                )
+            if pending and not finished and not expired:
+                waiting = [deadline - now for f, deadline in deadlines.items() if f in pending]
+                # Also woken when a queued collector starts, to arm its deadline
+                wake.wait(max(0.0, min(waiting)) if waiting else None)
+
+    def run(self, names: Optional[List[str]] = None) -> Dict[str, CollectorResult]:
+        """Run collectors and return results in registration order"""
+        results = {r.name: r for r in self.iter_results(names)}
+        return {name: results[name] for name in (names or self._collectors) if name in results}
+
+    @staticmethod
+    def _timed(func: Callable[[], Any], name: str, started: Dict[str, float], wake: threading.Event):
+        start = started[name] = time.perf_counter()
+        wake.set()
+        try:
+            with span(f"collector.{name}"):
+                return func(), None, time.perf_counter() - start
+        except Exception as e:
+            return None, e, time.perf_counter() - start
+
+    @staticmethod
+    def _result(collector: Collector, future: Future) -> CollectorResult:
+        data, error, duration = future.result()
+        if error is not None:
+            return CollectorResult(
+                collector.name, "error",
+                error=f"{type(error).__name__}: {error}",
+                duration=duration
+            )
+        return CollectorResult(collector.name, "ok", data=data, duration=duration)
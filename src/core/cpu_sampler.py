@@ -0,0 +1,152 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+import psutil
+
+# Fields of psutil.cpu_times() that count as "not busy"
+_IDLE_FIELDS = ("idle", "iowait")
+
+
+def _busy_percent(before, after) -> float:
+    """Compute busy percentage between two cpu_times samples"""
+    total = sum(after) - sum(before)
+    if total <= 0:
+        return 0.0
+    idle = sum(
+        getattr(after, field, 0.0) - getattr(before, field, 0.0)
+        for field in _IDLE_FIELDS
+    )
+    busy = (total - idle) / total * 100
+    return round(min(max(busy, 0.0), 100.0), 1)
+
+
+class CpuSampler:
+    """Background CPU sampler keeping a per-core ring buffer.
+
+    The sampler thread diffs ``psutil.cpu_times(percpu=True)`` at a fixed
+    interval, so readers never sleep and never disturb psutil's own
+    ``cpu_percent`` bookkeeping.
+    """
+
+    def __init__(self, interval: float = 1.0, history: int = 600):
+        self.interval = interval
+        self._samples: Deque[Tuple[float, Tuple[float, ...]]] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._sample_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[float, Tuple[float, ...]], None]] = []
+        self._last_times = psutil.cpu_times(percpu=True)
+
+    def start(self) -> None:
+        """Start the sampling thread if it is not already running"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cpu-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_interval(self, interval: float) -> None:
+        """Change the sampling interval; takes effect immediately"""
+        self.interval = max(0.05, float(interval))
+        self._wakeup.set()
+
+    def add_listener(self, callback: Callable[[float, Tuple[float, ...]], None]) -> None:
+        """Register a callback invoked from the sampler thread for every sample"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[float, Tuple[float, ...]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            self.sample()
+
+    def sample(self) -> Tuple[float, ...]:
+        """Take one sample now and append it to the ring buffer"""
+        with self._sample_lock:
+            now = time.time()
+            times = psutil.cpu_times(percpu=True)
+            per_core = tuple(
+                _busy_percent(before, after)
+                for before, after in zip(self._last_times, times)
+            )
+            self._last_times = times
+            with self._lock:
+                self._samples.append((now, per_core))
+        for callback in list(self._listeners):
+            try:
+                callback(now, per_core)
+            except Exception as e:
+                print(f"Error in CPU sampler listener: {e}")
+        return per_core
+
+    def per_core(self) -> List[float]:
+        """Get the most recent per-core CPU usage without blocking"""
+        with self._lock:
+            if self._samples:
+                return list(self._samples[-1][1])
+        # No sample yet: report the average since boot rather than waiting
+        times = psutil.cpu_times(percpu=True)
+        return [_busy_percent(type(t)(*([0.0] * len(t))), t) for t in times]
+
+    def percent(self) -> float:
+        """Get the most recent overall CPU usage without blocking"""
+        cores = self.per_core()
+        return round(sum(cores) / len(cores), 1) if cores else 0.0
+
+    def history(self, seconds: Optional[float] = None) -> List[Tuple[float, Tuple[float, ...]]]:
+        """Get buffered (timestamp, per-core) samples, optionally only the last N seconds"""
+        with self._lock:
+            samples = list(self._samples)
+        if seconds is None:
+            return samples
+        cutoff = time.time() - seconds
+        return [sample for sample in samples if sample[0] >= cutoff]
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get sampler state for diagnostics"""
+        with self._lock:
+            count = len(self._samples)
+            last = self._samples[-1][0] if self._samples else None
+        return {
+            "running": self.is_running(),
+            "interval": self.interval,
+            "samples": count,
+            "capacity": self._samples.maxlen,
+            "last_sample": last
+        }
+
+
+_shared_sampler: Optional[CpuSampler] = None
+_shared_lock = threading.Lock()
+
+
+def get_cpu_sampler(interval: Optional[float] = None) -> CpuSampler:
+    """Get the process-wide CPU sampler, starting it on first use"""
+    global _shared_sampler
+    with _shared_lock:
+        if _shared_sampler is None:
+            _shared_sampler = CpuSampler(interval or 1.0)
+        elif interval is not None:
+            _shared_sampler.set_interval(interval)
+        _shared_sampler.start()
+        return _shared_sampler
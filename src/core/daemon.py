@@ -0,0 +1,219 @@
+"""Headless monitoring daemon.
+
+Runs the same sampling and threshold checks as the GUI
+on an asyncio loop, without importing PyQt6. Each tick is appended as one
+JSON line to an output file and/or streamed to clients of a local Unix
+socket. Alert rule transitions and automatic mode switches seen since the
+previous tick are included in each record under "events".
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+from .alerts import AlertEvent
+from .auto_optimizer import AutoOptimizer
+from .device_settings import DeviceSettings
+from .metrics_store import MetricsStore
+
+
+class MonitorDaemon:
+    def __init__(self, settings: Optional[DeviceSettings] = None,
+                 output_path: Optional[str] = None,
+                 socket_path: Optional[str] = None,
+                 interval: Optional[float] = None,
+                 exporter=None):
+        self.settings = settings or DeviceSettings()
+        self.exporter = exporter
+        self.output_path = output_path
+        self.socket_path = socket_path
+        self._interval = interval
+        self._clients: Set[asyncio.StreamWriter] = set()
+        self._latest: Optional[bytes] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._server = None
+        self._events: deque = deque(maxlen=1000)
+        self.settings.alerts.add_listener(self._on_alert)
+        self.optimizer = AutoOptimizer(self.settings)
+        self.optimizer.add_listener(self._on_mode_switch)
+
+    @property
+    def interval(self) -> float:
+        """Seconds between ticks; follows monitoring_interval unless overridden"""
+        if self._interval is not None:
+            return self._interval
+        return float(self.settings.get_runtime_settings()["monitoring_interval"])
+
+    def _on_alert(self, event: AlertEvent) -> None:
+        # Called from the sampler thread; deque appends are thread-safe
+        self._events.append(event.as_dict())
+
+    def _on_mode_switch(self, decision: Dict[str, Any]) -> None:
+        self._events.append({"kind": "mode_switch", **decision})
+
+    def collect(self) -> Dict[str, Any]:
+        """Take one health sample and evaluate thresholds"""
+        report = self.settings.get_system_health_report()
+        alerts = self.settings.get_optimization_suggestions()
+        events = []
+        while self._events:
+            events.append(self._events.popleft())
+        return {
+            "timestamp": time.time(),
+            "health": report,
+            "alerts": alerts,
+            "events": events
+        }
+
+    async def tick(self) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        # psutil calls can stall on hung mounts; keep the loop responsive
+        record = await loop.run_in_executor(None, self.collect)
+        line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode()
+        self._latest = line
+        if self.output_path:
+            with open(self.output_path, "ab") as f:
+                f.write(line)
+        await self._broadcast(line)
+        return record
+
+    async def _broadcast(self, line: bytes) -> None:
+        for writer in list(self._clients):
+            try:
+                writer.write(line)
+                await writer.drain()
+            except (ConnectionError, OSError):
+                self._drop_client(writer)
+
+    def _drop_client(self, writer: asyncio.StreamWriter) -> None:
+        self._clients.discard(writer)
+        writer.close()
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Send the latest record, then stream new ones until the client disconnects"""
+        self._clients.add(writer)
+        if self._latest is not None:
+            writer.write(self._latest)
+        try:
+            await reader.read()
+        finally:
+            self._drop_client(writer)
+
+    async def start_socket(self) -> None:
+        if not self.socket_path:
+            return
+        if not hasattr(asyncio, "start_unix_server"):
+            raise RuntimeError("Unix sockets are not supported on this platform")
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+
+    def stop(self) -> None:
+        if self._stop is not None:
+            self._stop.set()
+
+    async def run(self, iterations: Optional[int] = None) -> None:
+        """Sample every interval until stopped (or for a fixed number of ticks)"""
+        self._stop = asyncio.Event()
+        self.settings.start_alerts()
+        self.optimizer.start()
+        await self.start_socket()
+        try:
+            count = 0
+            while not self._stop.is_set():
+                started = time.monotonic()
+                try:
+                    await self.tick()
+                except Exception as e:
+                    print(f"Error collecting metrics: {e}", file=sys.stderr)
+                count += 1
+                if iterations is not None and count >= iterations:
+                    break
+                delay = max(0.0, self.interval - (time.monotonic() - started))
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self) -> None:
+        self.settings.close()
+        self.optimizer.stop()
+        if self.exporter is not None:
+            self.exporter.stop()
+        for writer in list(self._clients):
+            self._drop_client(writer)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if self.socket_path and os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        if self.settings.metrics_store is not None:
+            self.settings.metrics_store.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="AI Agent Assistant headless monitoring daemon")
+    parser.add_argument("--interval", type=float, help="seconds between samples (default: monitoring_interval setting)")
+    parser.add_argument("--output", help="append one JSON line per sample to this file")
+    parser.add_argument("--socket", help="stream samples to clients of this Unix socket")
+    parser.add_argument("--no-history", action="store_true", help="do not record samples in the metrics store")
+    parser.add_argument("--once", action="store_true", help="take a single sample, print it and exit")
+    parser.add_argument("--metrics-port", type=int, help="serve Prometheus metrics on this port at /metrics")
+    parser.add_argument("--metrics-bind", default="127.0.0.1", help="address for --metrics-port (default: 127.0.0.1)")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(format="%(asctime)s %(name)s %(levelname)s: %(message)s")
+    store = None if args.no_history else MetricsStore()
+    settings = DeviceSettings(metrics_store=store)
+    logging.getLogger().setLevel(settings.get_current_settings()["log_level"])
+    exporter = None
+    if args.metrics_port is not None:
+        from .prometheus import MetricsExporter
+        exporter = MetricsExporter(settings)
+        exporter.start()
+        url = exporter.serve(args.metrics_bind, args.metrics_port)
+        print(f"Serving Prometheus metrics at {url}", file=sys.stderr)
+    daemon = MonitorDaemon(
+        settings,
+        output_path=args.output,
+        socket_path=args.socket,
+        interval=args.interval,
+        exporter=exporter
+    )
+    if args.once:
+        record = asyncio.run(_run_once(daemon))
+        print(json.dumps(record, indent=2, default=str))
+        return 0
+
+    async def _serve():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, daemon.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+        await daemon.run()
+
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+async def _run_once(daemon: MonitorDaemon) -> Dict[str, Any]:
+    try:
+        return await daemon.tick()
+    finally:
+        await daemon.shutdown()
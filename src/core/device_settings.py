@@ -1,55 +1,146 @@
+import copy
 import os
-import json
-from typing import Dict, List, Any
+import time
+import threading
+from typing import Dict, List, Any, Optional
 import psutil
 import platform
+from .alerts import AlertEngine, default_alert_rules
+from .collectors import get_worker_pool
+from .cpu_sampler import get_cpu_sampler
+from .io_rates import get_io_rate_tracker
+from .metrics_store import MetricsStore, health_report_metrics
+from .process_profiler import describe_processes, get_process_profiler
+from .settings_store import SettingsStore
+from .tracing import traced
+
+DEFAULT_SETTINGS = {
+    "performance_mode": "balanced",  # balanced, performance, power_save
+    "monitoring_interval": 60,  # seconds
+    "sample_interval": 1.0,  # seconds between background CPU samples
+    "scan_workers": 4,  # threads in the shared scan pool
+    "log_level": "INFO",
+    "max_memory_usage": 80,  # percentage
+    "max_cpu_usage": 80,  # percentage
+    "auto_optimize": True,
+    "notification_enabled": True,
+    "backup_enabled": True,
+    "update_check": True
+}
+
+SETTINGS_SCHEMA = {
+    "performance_mode": {"type": str, "choices": ["balanced", "performance", "power_save"]},
+    "monitoring_interval": {"type": int, "min": 1, "max": 86400},
+    "sample_interval": {"type": (int, float), "min": 0.05, "max": 3600},
+    "scan_workers": {"type": int, "min": 1, "max": 64},
+    "log_level": {"type": str, "choices": ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]},
+    "max_memory_usage": {"type": (int, float), "min": 0, "max": 100},
+    "max_cpu_usage": {"type": (int, float), "min": 0, "max": 100},
+    "auto_optimize": {"type": bool},
+    "notification_enabled": {"type": bool},
+    "backup_enabled": {"type": bool},
+    "update_check": {"type": bool}
+}
+
+# Runtime settings of each performance mode; automatic switches change only these
+MODE_RUNTIME_SETTINGS = {
+    "performance": {"sample_interval": 0.5, "scan_workers": 8, "monitoring_interval": 30},
+    "balanced": {"sample_interval": 1.0, "scan_workers": 4, "monitoring_interval": 60},
+    "power_save": {"sample_interval": 2.0, "scan_workers": 2, "monitoring_interval": 120}
+}
+
+# Alert metrics fed by every background CPU sample; health reports feed the rest
+SAMPLED_ALERT_METRICS = ("cpu.percent", "memory.percent")
+
+# Older versions kept settings next to wherever the app was launched from
+LEGACY_SETTINGS_FILE = "device_settings.json"
+
 
 class DeviceSettings:
-    def __init__(self):
-        self.settings_file = "device_settings.json"
-        self.default_settings = {
-            "performance_mode": "balanced",  # balanced, performance, power_save
-            "monitoring_interval": 60,  # seconds
-            "log_level": "INFO",
-            "max_memory_usage": 80,  # percentage
-            "max_cpu_usage": 80,  # percentage
-            "auto_optimize": True,
-            "notification_enabled": True,
-            "backup_enabled": True,
-            "update_check": True
-        }
+    def __init__(self, metrics_store: Optional[MetricsStore] = None,
+                 store: Optional[SettingsStore] = None):
+        self.metrics_store = metrics_store
+        self.store = store or get_settings_store()
+        self.settings_file = str(self.store.path)
+        self.default_settings = copy.deepcopy(DEFAULT_SETTINGS)
         self.current_settings = self.load_settings()
+        # Set by apply_runtime_mode(); never saved
+        self.runtime_overrides: Dict[str, Any] = {}
+        self.cpu_sampler = get_cpu_sampler(self.current_settings["sample_interval"])
+        self.io_rates = get_io_rate_tracker()
+        self.process_profiler = get_process_profiler()
+        self.alerts = AlertEngine()
+        self._sync_alert_rules()
+        self.store.add_listener(self._on_settings_changed)
+
+    def close(self) -> None:
+        """Stop alerts and detach from the shared settings store"""
+        self.stop_alerts()
+        self.store.remove_listener(self._on_settings_changed)
 
     def load_settings(self) -> Dict[str, Any]:
-        """Load settings from file or create with defaults"""
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, 'r') as f:
-                    return {**self.default_settings, **json.load(f)}
-            except Exception as e:
-                print(f"Error loading settings: {e}")
-                return self.default_settings.copy()
-        return self.default_settings.copy()
+        """Get the live settings dict, loaded from the config file or defaults"""
+        return self.store.values
 
     def save_settings(self) -> bool:
-        """Save current settings to file"""
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.current_settings, f, indent=4)
-            return True
-        except Exception as e:
-            print(f"Error saving settings: {e}")
-            return False
+        """Write current settings to disk now"""
+        self.store.save()
+        return self.store.flush()
+
+    def _on_settings_changed(self, values: Dict[str, Any]) -> None:
+        """The settings file was edited outside this process"""
+        self._sync_alert_rules()
+        self._apply_runtime_settings()
+
+    def _sync_alert_rules(self) -> None:
+        """Keep the built-in alert rules in line with the current thresholds"""
+        self.alerts.enabled = self.current_settings["notification_enabled"]
+        for rule in default_alert_rules(self.current_settings):
+            existing = self.alerts.get_rule(rule.name)
+            if existing is None or existing.threshold != rule.threshold:
+                self.alerts.add_rule(rule)
+
+    def start_alerts(self) -> None:
+        """Evaluate alert rules on every background CPU sample"""
+        self.cpu_sampler.remove_listener(self._on_sample)
+        self.cpu_sampler.add_listener(self._on_sample)
+
+    def stop_alerts(self) -> None:
+        self.cpu_sampler.remove_listener(self._on_sample)
+
+    def _on_sample(self, timestamp: float, per_core) -> None:
+        cpu_percent = sum(per_core) / len(per_core) if per_core else 0.0
+        self.alerts.observe_many({
+            "cpu.percent": cpu_percent,
+            "memory.percent": psutil.virtual_memory().percent
+        }, timestamp)
 
     def get_current_settings(self) -> Dict[str, Any]:
         """Get current settings"""
         return self.current_settings
 
+    def get_runtime_settings(self) -> Dict[str, Any]:
+        """Get current settings with the mode chosen by automatic switching applied"""
+        overrides = self.runtime_overrides
+        if not overrides:
+            return self.current_settings
+        return {**self.current_settings, **overrides}
+
     def update_settings(self, new_settings: Dict[str, Any]) -> bool:
-        """Update settings with new values"""
-        self.current_settings.update(new_settings)
-        return self.save_settings()
+        """Update settings with new values; the write is coalesced with other updates"""
+        try:
+            self.store.update(new_settings)
+        except ValueError as e:
+            print(f"Error saving settings: {e}")
+            return False
+        self._sync_alert_rules()
+        if self.runtime_overrides and "performance_mode" in new_settings:
+            # Choosing a mode by hand ends the automatic one
+            self.runtime_overrides = {}
+            self._apply_runtime_settings()
+        return True
 
+    @traced("device_settings.suggestions")
     def get_optimization_suggestions(self) -> List[Dict[str, Any]]:
         """Generate optimization suggestions based on system analysis"""
         suggestions = []
@@ -57,21 +148,27 @@ class DeviceSettings:
         # Memory optimization
         memory = psutil.virtual_memory()
         if memory.percent > self.current_settings['max_memory_usage']:
+            top = self.process_profiler.top(5, "memory_rss")
             suggestions.append({
                 "type": "memory",
                 "severity": "high",
                 "issue": "High memory usage detected",
-                "suggestion": "Consider closing unused applications or increasing virtual memory"
+                "suggestion": "Consider closing unused applications or increasing virtual memory. "
+                              f"Largest processes: {describe_processes(top[:3], 'memory_rss')}",
+                "top_processes": top
             })
 
         # CPU optimization
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = self.cpu_sampler.percent()
         if cpu_percent > self.current_settings['max_cpu_usage']:
+            top = self.process_profiler.top(5, "cpu_percent")
             suggestions.append({
                 "type": "cpu",
                 "severity": "high",
                 "issue": "High CPU usage detected",
-                "suggestion": "Check for resource-intensive processes and consider optimization"
+                "suggestion": "Check for resource-intensive processes and consider optimization. "
+                              f"Top consumers: {describe_processes(top[:3])}",
+                "top_processes": top
             })
 
         # Disk optimization
@@ -87,63 +184,106 @@ class DeviceSettings:
         return suggestions
 
     def apply_optimization(self, optimization_type: str) -> bool:
-        """Apply specific optimization settings"""
+        """Apply and save a performance mode with its thresholds (an explicit user choice)"""
         if optimization_type == "performance":
-            self.current_settings.update({
+            self.store.update({
                 "performance_mode": "performance",
-                "monitoring_interval": 30,
+                **MODE_RUNTIME_SETTINGS["performance"],
                 "max_memory_usage": 90,
                 "max_cpu_usage": 90,
                 "auto_optimize": True
             })
         elif optimization_type == "balanced":
-            self.current_settings.update({
+            self.store.update({
                 "performance_mode": "balanced",
-                "monitoring_interval": 60,
+                **MODE_RUNTIME_SETTINGS["balanced"],
                 "max_memory_usage": 80,
                 "max_cpu_usage": 80,
                 "auto_optimize": True
             })
         elif optimization_type == "power_save":
-            self.current_settings.update({
+            self.store.update({
                 "performance_mode": "power_save",
-                "monitoring_interval": 120,
+                **MODE_RUNTIME_SETTINGS["power_save"],
                 "max_memory_usage": 70,
                 "max_cpu_usage": 70,
                 "auto_optimize": True
             })
         else:
             return False
-        
-        return self.save_settings()
 
+        self.runtime_overrides = {}
+        self._sync_alert_rules()
+        self._apply_runtime_settings()
+        return True
+
+    def apply_runtime_mode(self, mode: str) -> bool:
+        """Switch performance mode for this session only (used by automatic switching)
+
+        Changes the sampling interval, scan pool size and monitoring interval
+        without saving anything; thresholds stay as the user set them.
+        """
+        runtime = MODE_RUNTIME_SETTINGS.get(mode)
+        if runtime is None:
+            return False
+        self.runtime_overrides = {"performance_mode": mode, **runtime}
+        self._apply_runtime_settings()
+        return True
+
+    def _apply_runtime_settings(self) -> None:
+        """Make the sampling interval and scan pool size follow the current mode"""
+        settings = self.get_runtime_settings()
+        self.cpu_sampler.set_interval(settings["sample_interval"])
+        get_worker_pool().resize(settings["scan_workers"])
+
+    @traced("device_settings.health_report")
     def get_system_health_report(self) -> Dict[str, Any]:
-        """Generate system health report"""
-        return {
+        """Generate system health report and record it in the metrics store"""
+        report = {
             "memory_usage": psutil.virtual_memory()._asdict(),
             "cpu_usage": {
-                "percent": psutil.cpu_percent(interval=1),
+                "percent": self.cpu_sampler.percent(),
                 "cores": psutil.cpu_count(),
                 "frequency": psutil.cpu_freq()._asdict() if psutil.cpu_freq() else None
             },
             "disk_usage": psutil.disk_usage('/')._asdict(),
             "network": psutil.net_io_counters()._asdict(),
-            "performance_mode": self.current_settings["performance_mode"],
+            "io_rates": self.io_rates.sample(),
+            "performance_mode": self.get_runtime_settings()["performance_mode"],
             "optimization_status": self.get_optimization_status()
         }
+        metrics = health_report_metrics(report)
+        self.alerts.observe_many({
+            name: value for name, value in metrics.items() if name not in SAMPLED_ALERT_METRICS
+        })
+        if self.metrics_store is not None:
+            try:
+                self.metrics_store.record_many(metrics)
+            except Exception as e:
+                print(f"Error recording metrics: {e}")
+        return report
+
+    def get_metric_history(self, metric: str, seconds: float = 3600,
+                           resolution: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get recorded history of one metric (e.g. "cpu.percent") for the last N seconds"""
+        if self.metrics_store is None:
+            return []
+        return self.metrics_store.query(metric, time.time() - seconds, resolution=resolution)
 
     def get_optimization_status(self) -> Dict[str, Any]:
         """Get current optimization status"""
+        runtime = self.get_runtime_settings()
         return {
             "auto_optimize": self.current_settings["auto_optimize"],
-            "current_mode": self.current_settings["performance_mode"],
-            "monitoring_interval": self.current_settings["monitoring_interval"],
+            "current_mode": runtime["performance_mode"],
+            "monitoring_interval": runtime["monitoring_interval"],
             "thresholds": {
                 "memory": self.current_settings["max_memory_usage"],
                 "cpu": self.current_settings["max_cpu_usage"]
             }
         }
 
+    @traced("device_settings.compatibility_report")
     def get_compatibility_report(self) -> Dict[str, Any]:
         """Generate compatibility report for AI workloads"""
         compatibility = {
@@ -170,3 +310,20 @@ class DeviceSettings:
             compatibility["issues"].append("Insufficient CPU cores (minimum 4 cores required)")
 
         return compatibility
+
+
+_shared_store: Optional[SettingsStore] = None
+_shared_lock = threading.Lock()
+
+
+def get_settings_store() -> SettingsStore:
+    """Get the process-wide settings store ($XDG_CONFIG_HOME/ai-agent-assistant/settings.json)"""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = SettingsStore(
+                defaults=DEFAULT_SETTINGS,
+                schema=SETTINGS_SCHEMA,
+                legacy_paths=[os.path.abspath(LEGACY_SETTINGS_FILE)]
+            )
+        return _shared_store
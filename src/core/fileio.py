@@ -0,0 +1,142 @@
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Iterable, Optional, Tuple, Union
+
+
+def atomic_write(path: Union[str, os.PathLike], data: Union[str, bytes]) -> None:
+    """Replace a file's contents so readers see either the old or the new file.
+
+    The data goes to a temporary file in the same directory, which is
+    fsynced and then renamed over the target. A crash mid-write leaves the
+    old file untouched.
+    """
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Persist the rename itself; not possible (or needed) on Windows
+    if hasattr(os, "O_DIRECTORY"):
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+
+def write_if_changed(path: Union[str, os.PathLike], data: Union[str, bytes]) -> bool:
+    """Atomically write a file unless it already holds exactly ``data``; returns True if written"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
+def file_signature(path: Union[str, os.PathLike]) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def directory_signature(path: Union[str, os.PathLike],
+                        suffixes: Iterable[str] = ("",)) -> Optional[Tuple[Any, ...]]:
+    """Signatures of every file below a directory whose name ends in one of ``suffixes``
+
+    Catches in-place edits as well as added, removed and renamed files.
+    Returns None if the directory does not exist.
+    """
+    suffixes = tuple(suffixes)
+    if not os.path.isdir(path):
+        return None
+    entries = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(suffixes):
+                full = os.path.join(root, name)
+                entries.append((full, file_signature(full)))
+    return tuple(entries)
+
+
+class FileWatcher:
+    """Calls back when a file changes on disk.
+
+    Polls the file's signature with one ``stat`` per interval from a daemon
+    thread, so nothing is read until something actually changed. Changes
+    made by this process can be excluded with ``acknowledge()``. Pass
+    ``signature=lambda p: directory_signature(p, (".yaml",))`` to watch a
+    whole directory instead.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], callback: Callable[[str], None],
+                 interval: float = 2.0,
+                 signature: Callable[[str], Any] = file_signature):
+        self.path = os.fspath(path)
+        self.callback = callback
+        self.interval = interval
+        self._get_signature = signature
+        self._signature = signature(self.path)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="file-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def acknowledge(self) -> None:
+        """Treat the file's current state as already seen (e.g. after writing it ourselves)"""
+        self._signature = self._get_signature(self.path)
+
+    def check(self) -> bool:
+        """Check once; returns True and calls back if the file changed"""
+        signature = self._get_signature(self.path)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            self.callback(self.path)
+        except Exception as e:
+            print(f"Error handling change of {self.path}: {e}")
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
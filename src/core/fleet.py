@@ -0,0 +1,506 @@
+"""Fleet collection: many hosts reporting to one central instance.
+
+Each host runs a FleetAgent that samples the same health metrics as the
+daemon and POSTs them in gzip-compressed JSON batches to a FleetCollector
+served over HTTP. Metrics are delta-encoded: after one full sample, a
+sample only carries the metrics that changed, as differences from the
+previous value, and the names of metrics that are no longer reported
+(e.g. an unplugged disk). Scan sections are sent only when their content
+changes.
+
+Payload::
+
+    {"v": 1, "host": "box-1", "session": "3f2a...", "seq": 7, "t0": 1700000000.0,
+     "samples": [{"t": 0.0, "v": {...all metrics...}},
+                 {"t": 5.0, "d": {"cpu.percent": -3.5, ...}, "r": ["disk.sdb.percent"]}],
+     "scan": {"hardware_info": {...}}}
+
+The collector answers ``{"ok": true}``, or ``{"ok": false, "resync": true}``
+when it cannot apply a delta batch (e.g. after it restarted); the agent then
+starts over with a full sample and a full scan. A malformed batch is
+answered with HTTP 400 and ``{"error": "..."}``.
+"""
+import gzip
+import hashlib
+import json
+import socket
+import threading
+import time
+import urllib.request
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+PROTOCOL_VERSION = 1
+SCAN_SECTIONS = ["system_info", "hardware_info", "installed_software"]
+MAX_BODY = 8 * 1024 * 1024
+
+
+def encode_payload(payload: Dict[str, Any]) -> bytes:
+    return gzip.compress(json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def decode_payload(body: bytes, encoding: Optional[str] = "gzip") -> Dict[str, Any]:
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    return json.loads(body.decode("utf-8"))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def check_payload(payload: Any) -> None:
+    """Check the shape and field types of a decoded batch; raises ValueError"""
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be a JSON object")
+    if not isinstance(payload.get("host"), str) or not payload["host"]:
+        raise ValueError("host must be a non-empty string")
+    if not isinstance(payload.get("seq"), int) or isinstance(payload["seq"], bool):
+        raise ValueError("seq must be an integer")
+    if payload.get("session") is not None and not isinstance(payload["session"], str):
+        raise ValueError("session must be a string")
+    if "t0" in payload and not _is_number(payload["t0"]):
+        raise ValueError("t0 must be a number")
+    if payload.get("scan") is not None and not isinstance(payload["scan"], dict):
+        raise ValueError("scan must be an object")
+    samples = payload.get("samples", [])
+    if not isinstance(samples, list):
+        raise ValueError("samples must be a list")
+    for index, sample in enumerate(samples):
+        if not isinstance(sample, dict):
+            raise ValueError(f"samples[{index}] must be an object")
+        if "t" in sample and not _is_number(sample["t"]):
+            raise ValueError(f"samples[{index}].t must be a number")
+        for field in ("v", "d"):
+            values = sample.get(field, {})
+            if not isinstance(values, dict) or not all(_is_number(value) for value in values.values()):
+                raise ValueError(f"samples[{index}].{field} must map metric names to numbers")
+        removed = sample.get("r", [])
+        if not isinstance(removed, list) or not all(isinstance(key, str) for key in removed):
+            raise ValueError(f"samples[{index}].r must be a list of metric names")
+
+
+class DeltaEncoder:
+    """Encodes successive metric dicts as changes from the previous one.
+
+    Values are rounded to ``precision`` decimals before differencing, so the
+    receiver rebuilds exactly the rounded values the sender saw.
+    """
+
+    def __init__(self, precision: int = 2):
+        self.precision = precision
+        self._last: Optional[Dict[str, float]] = None
+
+    def encode(self, values: Dict[str, float]) -> Dict[str, Any]:
+        rounded = {key: round(float(value), self.precision) for key, value in values.items()}
+        previous = self._last
+        self._last = rounded
+        if previous is None:
+            return {"v": rounded}
+        delta = {}
+        for key, value in rounded.items():
+            old = previous.get(key)
+            if old is None:
+                delta[key] = value  # new metric; the receiver treats a missing base as 0
+            elif value != old:
+                delta[key] = round(value - old, self.precision)
+        removed = [key for key in previous if key not in rounded]
+        if removed:
+            return {"d": delta, "r": removed}
+        return {"d": delta}
+
+    def reset(self) -> None:
+        self._last = None
+
+
+def apply_sample(values: Dict[str, float], sample: Dict[str, Any], precision: int = 2) -> Dict[str, float]:
+    """Rebuild the full metric dict from the previous one and an encoded sample"""
+    if "v" in sample:
+        return dict(sample["v"])
+    current = dict(values)
+    for key in sample.get("r", ()):
+        current.pop(key, None)
+    for key, change in sample.get("d", {}).items():
+        current[key] = round(current.get(key, 0.0) + change, precision)
+    return current
+
+
+def _section_hash(data: Any) -> str:
+    return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def http_sender(url: str, timeout: float = 10.0) -> Callable[[bytes], Dict[str, Any]]:
+    """Transport that POSTs an encoded payload to a collector's /ingest endpoint"""
+    endpoint = url.rstrip("/") + "/ingest"
+
+    def send(body: bytes) -> Dict[str, Any]:
+        request = urllib.request.Request(endpoint, data=body, method="POST", headers={
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip"
+        })
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+
+    return send
+
+
+class FleetAgent:
+    """Samples this host and ships batches to a collector.
+
+    A batch is sent every ``batch_interval`` seconds. Batches that fail to
+    send are kept (up to ``max_pending``) and retried in order; if too many
+    pile up, they are dropped and the next batch starts from a full sample.
+    """
+
+    def __init__(self, send: Callable[[bytes], Dict[str, Any]], host_id: Optional[str] = None,
+                 settings=None, scanner=None, interval: float = 5.0,
+                 batch_interval: float = 30.0, scan_interval: float = 600.0,
+                 max_pending: int = 20):
+        self.send = send
+        self.host_id = host_id or socket.gethostname()
+        self._settings = settings
+        self._scanner = scanner
+        self.interval = interval
+        self.batch_interval = batch_interval
+        self.scan_interval = scan_interval
+        self.max_pending = max_pending
+        self.encoder = DeltaEncoder()
+        # Sequence numbers restart with every agent process
+        self.session = uuid.uuid4().hex
+        self._seq = 0
+        self._samples: List[Dict[str, Any]] = []
+        self._batch_start: Optional[float] = None
+        self._scan: Dict[str, Any] = {}
+        self._scan_hashes: Dict[str, str] = {}
+        self._last_scan = 0.0
+        self._pending: Deque[bytes] = deque()
+        self.bytes_sent = 0
+        self._stop = threading.Event()
+
+    @property
+    def settings(self):
+        if self._settings is None:
+            from .device_settings import DeviceSettings
+            self._settings = DeviceSettings()
+        return self._settings
+
+    @property
+    def scanner(self):
+        if self._scanner is None:
+            from .system_scanner import SystemScanner
+            self._scanner = SystemScanner()
+        return self._scanner
+
+    def read_metrics(self) -> Dict[str, float]:
+        from .metrics_store import health_report_metrics
+        return health_report_metrics(self.settings.get_system_health_report())
+
+    def sample(self, now: Optional[float] = None, metrics: Optional[Dict[str, float]] = None) -> None:
+        """Add one sample to the current batch"""
+        now = time.time() if now is None else now
+        if self._batch_start is None:
+            self._batch_start = now
+        encoded = self.encoder.encode(self.read_metrics() if metrics is None else metrics)
+        encoded["t"] = round(now - self._batch_start, 1)
+        self._samples.append(encoded)
+
+    def refresh_scan(self, sections: Optional[Dict[str, Any]] = None) -> None:
+        """Queue the scan sections that changed since they were last sent"""
+        if sections is None:
+            sections = dict(self.scanner.scan_system(sections=SCAN_SECTIONS).to_dict())
+        for name, data in sections.items():
+            digest = _section_hash(data)
+            if self._scan_hashes.get(name) != digest:
+                self._scan_hashes[name] = digest
+                self._scan[name] = data
+        self._last_scan = time.monotonic()
+
+    def build_batch(self) -> Optional[bytes]:
+        """Close the current batch and queue it for sending"""
+        if not self._samples and not self._scan:
+            return None
+        self._seq += 1
+        payload = {
+            "v": PROTOCOL_VERSION,
+            "host": self.host_id,
+            "session": self.session,
+            "seq": self._seq,
+            "t0": self._batch_start or time.time(),
+            "samples": self._samples
+        }
+        if self._scan:
+            payload["scan"] = self._scan
+        body = encode_payload(payload)
+        self._samples = []
+        self._scan = {}
+        self._batch_start = None
+        self._pending.append(body)
+        if len(self._pending) > self.max_pending:
+            print(f"Fleet collector unreachable; dropping {len(self._pending)} batches")
+            self._pending.clear()
+            self.resync()
+        return body
+
+    def resync(self) -> None:
+        """Start over with a full sample and a full scan"""
+        self.encoder.reset()
+        self._scan_hashes.clear()
+        self._last_scan = 0.0
+
+    def flush(self) -> bool:
+        """Send queued batches in order; returns True when nothing is left"""
+        while self._pending:
+            body = self._pending[0]
+            try:
+                reply = self.send(body)
+            except Exception as e:
+                print(f"Error sending fleet batch: {e}")
+                return False
+            self.bytes_sent += len(body)
+            if reply.get("resync"):
+                # Everything queued is relative to state the collector no longer has
+                self._pending.clear()
+                self.resync()
+                return False
+            self._pending.popleft()
+        return True
+
+    def run(self, iterations: Optional[int] = None) -> None:
+        """Sample every interval and send a batch every batch_interval"""
+        count = 0
+        last_batch = time.monotonic()
+        while not self._stop.is_set():
+            started = time.monotonic()
+            if started - self._last_scan >= self.scan_interval or not self._scan_hashes:
+                try:
+                    self.refresh_scan()
+                except Exception as e:
+                    print(f"Error scanning system: {e}")
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"Error collecting metrics: {e}")
+            count += 1
+            done = iterations is not None and count >= iterations
+            if done or time.monotonic() - last_batch >= self.batch_interval:
+                self.build_batch()
+                self.flush()
+                last_batch = time.monotonic()
+            if done:
+                break
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class HostState:
+    def __init__(self, host: str):
+        self.host = host
+        self.session: Optional[str] = None
+        self.seq = 0
+        self.metrics: Dict[str, float] = {}
+        self.metrics_time: Optional[float] = None
+        self.scan: Dict[str, Any] = {}
+        self.last_seen = 0.0
+        self.bytes_received = 0
+        self._compatibility: Optional[Dict[str, List[str]]] = None
+
+
+class FleetCollector:
+    """Central state for every reporting host"""
+
+    def __init__(self, stale_after: float = 60.0, designer=None,
+                 thresholds: Optional[Dict[str, float]] = None):
+        self.stale_after = stale_after
+        self._designer = designer
+        self.thresholds = thresholds or {"cpu.percent": 80, "memory.percent": 80, "disk.percent": 90}
+        self.hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def designer(self):
+        if self._designer is None:
+            from .agent_designer import AgentDesigner
+            self._designer = AgentDesigner()
+        return self._designer
+
+    def ingest(self, payload: Dict[str, Any], size: int = 0) -> Dict[str, Any]:
+        """Apply one batch; asks for a resync when deltas have no base to apply to
+
+        Raises ValueError for a malformed batch, before any state is changed.
+        """
+        if isinstance(payload, dict) and payload.get("v") != PROTOCOL_VERSION:
+            return {"ok": False, "error": f"unsupported protocol version {payload.get('v')}"}
+        check_payload(payload)
+        host = payload["host"]
+        session = payload.get("session")
+        seq = payload["seq"]
+        samples = payload.get("samples", [])
+        with self._lock:
+            state = self.hosts.get(host)
+            same_session = state is not None and state.session == session
+            if same_session and seq <= state.seq:
+                return {"ok": True, "duplicate": True}  # a retry of a batch already applied
+            starts_full = bool(samples) and "v" in samples[0]
+            in_order = same_session and seq == state.seq + 1
+            if not starts_full and not in_order:
+                return {"ok": False, "resync": True}
+            if state is None:
+                state = self.hosts[host] = HostState(host)
+            state.session = session
+            t0 = float(payload.get("t0", time.time()))
+            for sample in samples:
+                state.metrics = apply_sample(state.metrics, sample)
+                state.metrics_time = t0 + sample.get("t", 0.0)
+            if payload.get("scan"):
+                state.scan.update(payload["scan"])
+                state._compatibility = None
+            state.seq = seq
+            state.last_seen = time.time()
+            state.bytes_received += size
+        return {"ok": True}
+
+    def compatibility(self, state: HostState) -> Dict[str, List[str]]:
+        """Issues per template for one host, cached until its scan changes"""
+        if state._compatibility is None:
+            results = {}
+            if "hardware_info" in state.scan:
+                for name in self.designer.get_templates():
+                    config = self.designer.create_agent_config(name, {})
+                    try:
+                        results[name] = self.designer.validate_system_compatibility(config, state.scan)
+                    except Exception as e:
+                        results[name] = [f"Cannot validate: {e}"]
+            state._compatibility = results
+        return state._compatibility
+
+    def host_view(self, state: HostState, now: float) -> Dict[str, Any]:
+        metrics = state.metrics
+        age = now - state.last_seen
+        alerts = [
+            f"{metric} {metrics[metric]:.1f} > {limit}"
+            for metric, limit in self.thresholds.items()
+            if metrics.get(metric, 0.0) > limit
+        ]
+        compatibility = self.compatibility(state)
+        return {
+            "host": state.host,
+            "status": "stale" if age > self.stale_after else "online",
+            "last_seen": state.last_seen,
+            "age": round(age, 1),
+            "cpu_percent": metrics.get("cpu.percent"),
+            "memory_percent": metrics.get("memory.percent"),
+            "disk_percent": metrics.get("disk.percent"),
+            "alerts": alerts,
+            "compatible_templates": sorted(name for name, issues in compatibility.items() if not issues),
+            "compatibility": compatibility,
+            "bytes_received": state.bytes_received
+        }
+
+    def fleet_view(self) -> Dict[str, Any]:
+        """Per-host health and template compatibility for the whole fleet"""
+        now = time.time()
+        with self._lock:
+            hosts = [self.host_view(state, now) for state in self.hosts.values()]
+        hosts.sort(key=lambda host: host["host"])
+        return {
+            "generated_at": now,
+            "hosts": hosts,
+            "summary": {
+                "hosts": len(hosts),
+                "online": sum(1 for host in hosts if host["status"] == "online"),
+                "alerting": sum(1 for host in hosts if host["alerts"])
+            }
+        }
+
+    def host_detail(self, host: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            state = self.hosts.get(host)
+            if state is None:
+                return None
+            view = self.host_view(state, time.time())
+            view["metrics"] = dict(state.metrics)
+            view["scan"] = state.scan
+        return view
+
+
+def _make_handler(collector: FleetCollector):
+    class FleetRequestHandler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, data: Any) -> None:
+            body = json.dumps(data, default=str).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if self.path != "/ingest":
+                self._reply(404, {"error": "not found"})
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            if length <= 0 or length > MAX_BODY:
+                self._reply(413, {"error": "bad content length"})
+                return
+            try:
+                payload = decode_payload(self.rfile.read(length), self.headers.get("Content-Encoding"))
+                self._reply(200, collector.ingest(payload, size=length))
+            except (ValueError, KeyError, OSError) as e:
+                self._reply(400, {"error": str(e)})
+
+        def do_GET(self):
+            if self.path in ("/", "/fleet"):
+                self._reply(200, collector.fleet_view())
+            elif self.path.startswith("/fleet/"):
+                detail = collector.host_detail(self.path[len("/fleet/"):])
+                if detail is None:
+                    self._reply(404, {"error": "unknown host"})
+                else:
+                    self._reply(200, detail)
+            else:
+                self._reply(404, {"error": "not found"})
+
+        def log_message(self, format, *args):
+            pass  # one line per 5 s per host is noise
+
+    return FleetRequestHandler
+
+
+class FleetServer:
+    """HTTP front end for a FleetCollector (POST /ingest, GET /fleet, GET /fleet/<host>)"""
+
+    def __init__(self, collector: Optional[FleetCollector] = None,
+                 host: str = "127.0.0.1", port: int = 8765):
+        self.collector = collector or FleetCollector()
+        self.httpd = ThreadingHTTPServer((host, port), _make_handler(self.collector))
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        self.httpd.serve_forever()
+
+    def start(self) -> None:
+        """Serve from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name="fleet-server", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+def fetch_fleet(url: str, timeout: float = 10.0) -> Dict[str, Any]:
+    """Get the fleet view from a running collector"""
+    with urllib.request.urlopen(url.rstrip("/") + "/fleet", timeout=timeout) as response:
+        return json.loads(response.read().decode("utf-8"))
@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+import psutil
+
+TOTAL = "total"
+
+# counter field -> name of the reported rate
+DISK_FIELDS = {
+    "read_bytes": "read_bytes_per_sec",
+    "write_bytes": "write_bytes_per_sec",
+    "read_count": "read_ops_per_sec",
+    "write_count": "write_ops_per_sec",
+}
+NETWORK_FIELDS = {
+    "bytes_sent": "bytes_sent_per_sec",
+    "bytes_recv": "bytes_recv_per_sec",
+    "packets_sent": "packets_sent_per_sec",
+    "packets_recv": "packets_recv_per_sec",
+    "errin": "errors_in_per_sec",
+    "errout": "errors_out_per_sec",
+    "dropin": "drops_in_per_sec",
+    "dropout": "drops_out_per_sec",
+}
+
+
+def counter_delta(old: int, new: int) -> Optional[int]:
+    """Increase of a cumulative counter, allowing for 32/64-bit wraparound.
+
+    Returns None when the counter went backwards for another reason
+    (device reset or re-created); that interval has no meaningful rate.
+    """
+    if new >= old:
+        return new - old
+    for bits in (32, 64):
+        modulus = 1 << bits
+        if old < modulus:
+            delta = new + modulus - old
+            # A genuine wrap means the old value was close to the limit
+            if delta < modulus // 2:
+                return delta
+            return None
+    return None
+
+
+def _read_disks() -> Dict[str, Any]:
+    counters = dict(psutil.disk_io_counters(perdisk=True) or {})
+    total = psutil.disk_io_counters()
+    if total is not None:
+        counters[TOTAL] = total
+    return counters
+
+
+def _read_nics() -> Dict[str, Any]:
+    counters = dict(psutil.net_io_counters(pernic=True) or {})
+    total = psutil.net_io_counters()
+    if total is not None:
+        counters[TOTAL] = total
+    return counters
+
+
+class CounterRates:
+    """Turns per-device cumulative counters into per-second rates.
+
+    Keeps only the previous sample. Devices that appear get rates from
+    their second sample on; devices that disappear are dropped.
+    """
+
+    def __init__(self, read: Callable[[], Dict[str, Any]], fields: Dict[str, str]):
+        self.read = read
+        self.fields = fields
+        self._previous: Dict[str, Tuple[float, Tuple[int, ...]]] = {}
+
+    def sample(self) -> Dict[str, Dict[str, float]]:
+        now = time.monotonic()
+        counters = self.read()
+        rates = {}
+        current = {}
+        for device, counter in counters.items():
+            values = tuple(getattr(counter, field, 0) for field in self.fields)
+            current[device] = (now, values)
+            previous = self._previous.get(device)
+            if previous is None or now <= previous[0]:
+                continue
+            elapsed = now - previous[0]
+            device_rates = {}
+            for rate_name, old, new in zip(self.fields.values(), previous[1], values):
+                delta = counter_delta(old, new)
+                device_rates[rate_name] = round(delta / elapsed, 2) if delta is not None else 0.0
+            rates[device] = device_rates
+        self._previous = current
+        return rates
+
+
+class IORateTracker:
+    """Shared disk and network rate engine.
+
+    Calls closer together than ``min_interval`` reuse the last result, so the
+    scanner, the health report and the charts can all ask for rates without
+    turning each other's intervals into noise.
+    """
+
+    def __init__(self, min_interval: float = 0.5):
+        self.min_interval = min_interval
+        self.disk = CounterRates(_read_disks, DISK_FIELDS)
+        self.network = CounterRates(_read_nics, NETWORK_FIELDS)
+        self._lock = threading.Lock()
+        self._last: Optional[Dict[str, Any]] = None
+        self._last_time = 0.0
+        self.sample()
+
+    def sample(self) -> Dict[str, Any]:
+        """Get current rates: {"disk": {device: rates}, "network": {nic: rates}}
+
+        Each mapping also has a "total" entry aggregated by psutil.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._last is not None and now - self._last_time < self.min_interval:
+                return self._last
+            try:
+                disk = self.disk.sample()
+            except Exception:
+                disk = {}
+            try:
+                network = self.network.sample()
+            except Exception:
+                network = {}
+            self._last = {"disk": disk, "network": network}
+            self._last_time = now
+            return self._last
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """Get only the aggregated disk and network rates"""
+        rates = self.sample()
+        return {
+            "disk": rates["disk"].get(TOTAL, {}),
+            "network": rates["network"].get(TOTAL, {})
+        }
+
+
+_shared_tracker: Optional[IORateTracker] = None
+_shared_lock = threading.Lock()
+
+
+def get_io_rate_tracker() -> IORateTracker:
+    """Get the process-wide I/O rate tracker"""
+    global _shared_tracker
+    with _shared_lock:
+        if _shared_tracker is None:
+            _shared_tracker = IORateTracker()
+        return _shared_tracker
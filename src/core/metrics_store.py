@@ -0,0 +1,215 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from .paths import data_dir
+
+# Rollup tables: name -> (bucket width in seconds, default retention in seconds)
+RESOLUTIONS = {
+    "1s": (1, 10 * 60),
+    "1m": (60, 24 * 60 * 60),
+    "1h": (60 * 60, 90 * 24 * 60 * 60),
+}
+
+
+class MetricsStore:
+    """Embedded SQLite time-series store for sampled metrics.
+
+    Samples are buffered in memory and written in one transaction per
+    flush. Every flush folds the batch into 1s, 1m and 1h rollup tables
+    (min/max/sum/count per bucket), and old buckets are pruned per
+    resolution, so the database size is bounded by the retention settings
+    rather than by uptime.
+    """
+
+    def __init__(self, path: Optional[str] = None, batch_size: int = 500,
+                 flush_interval: float = 5.0, retention: Optional[Dict[str, int]] = None):
+        self.path = path or str(data_dir() / "metrics.db")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retention = {name: spec[1] for name, spec in RESOLUTIONS.items()}
+        self.retention.update(retention or {})
+        self._buffer: List[Tuple[str, float, float]] = []
+        self._metric_ids: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._last_flush = time.monotonic()
+        self._last_prune = 0.0
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        conn = self._conn
+        # auto_vacuum only takes effect on a new database; lets pruning shrink the file
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS metrics ("
+            "id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)"
+        )
+        for resolution in RESOLUTIONS:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS samples_{resolution} ("
+                "metric_id INTEGER NOT NULL, ts INTEGER NOT NULL, "
+                "min REAL NOT NULL, max REAL NOT NULL, sum REAL NOT NULL, "
+                "count INTEGER NOT NULL, PRIMARY KEY (metric_id, ts)) WITHOUT ROWID"
+            )
+        for metric_id, name in conn.execute("SELECT id, name FROM metrics"):
+            self._metric_ids[name] = metric_id
+
+    def record(self, name: str, value: float, timestamp: Optional[float] = None) -> None:
+        """Buffer one sample; written on the next flush"""
+        self.record_many({name: value}, timestamp)
+
+    def record_many(self, values: Dict[str, float], timestamp: Optional[float] = None) -> None:
+        """Buffer several samples taken at the same time"""
+        ts = time.time() if timestamp is None else timestamp
+        with self._lock:
+            self._buffer.extend(
+                (name, ts, float(value)) for name, value in values.items()
+                if value is not None
+            )
+            if (len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+
+    def _metric_id(self, name: str) -> int:
+        metric_id = self._metric_ids.get(name)
+        if metric_id is None:
+            self._conn.execute("INSERT OR IGNORE INTO metrics (name) VALUES (?)", (name,))
+            metric_id = self._conn.execute(
+                "SELECT id FROM metrics WHERE name = ?", (name,)
+            ).fetchone()[0]
+            self._metric_ids[name] = metric_id
+        return metric_id
+
+    def flush(self) -> int:
+        """Write buffered samples to all rollup tables; returns samples written"""
+        with self._lock:
+            batch, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+            if not batch:
+                return 0
+            conn = self._conn
+            conn.execute("BEGIN")
+            try:
+                for resolution, (width, _) in RESOLUTIONS.items():
+                    buckets: Dict[Tuple[int, int], List[float]] = {}
+                    for name, ts, value in batch:
+                        key = (self._metric_id(name), int(ts // width * width))
+                        agg = buckets.get(key)
+                        if agg is None:
+                            buckets[key] = [value, value, value, 1]
+                        else:
+                            agg[0] = min(agg[0], value)
+                            agg[1] = max(agg[1], value)
+                            agg[2] += value
+                            agg[3] += 1
+                    conn.executemany(
+                        f"INSERT INTO samples_{resolution} (metric_id, ts, min, max, sum, count) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (metric_id, ts) DO UPDATE SET "
+                        "min = MIN(min, excluded.min), max = MAX(max, excluded.max), "
+                        "sum = sum + excluded.sum, count = count + excluded.count",
+                        [(mid, ts, a[0], a[1], a[2], a[3]) for (mid, ts), a in buckets.items()]
+                    )
+                prune = time.monotonic() - self._last_prune >= 60
+                if prune:
+                    self._prune()
+                conn.execute("COMMIT")
+                if prune:
+                    # Return pages freed by pruning to the filesystem
+                    conn.executescript("PRAGMA incremental_vacuum;")
+            except Exception:
+                conn.execute("ROLLBACK")
+                # Metric ids assigned inside the failed transaction are gone
+                self._metric_ids = dict(
+                    (name, metric_id) for metric_id, name in conn.execute("SELECT id, name FROM metrics")
+                )
+                raise
+            return len(batch)
+
+    def _prune(self) -> None:
+        now = time.time()
+        for resolution, keep in self.retention.items():
+            self._conn.execute(
+                f"DELETE FROM samples_{resolution} WHERE ts < ?", (int(now - keep),)
+            )
+        self._last_prune = time.monotonic()
+
+    def _pick_resolution(self, start: float) -> str:
+        age = time.time() - start
+        for resolution in RESOLUTIONS:
+            if age <= self.retention[resolution]:
+                return resolution
+        return list(RESOLUTIONS)[-1]
+
+    def query(self, name: str, start: float, end: Optional[float] = None,
+              resolution: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get rollup buckets for one metric in [start, end]
+
+        When resolution is omitted the finest rollup still covering start is used.
+        """
+        end = time.time() if end is None else end
+        resolution = resolution or self._pick_resolution(start)
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution {resolution}")
+        width = RESOLUTIONS[resolution][0]
+        with self._lock:
+            self.flush()
+            metric_id = self._metric_ids.get(name)
+            if metric_id is None:
+                return []
+            rows = self._conn.execute(
+                f"SELECT ts, min, max, sum, count FROM samples_{resolution} "
+                "WHERE metric_id = ? AND ts BETWEEN ? AND ? ORDER BY ts",
+                (metric_id, int(start // width * width), int(end))
+            ).fetchall()
+        return [
+            {"timestamp": ts, "min": lo, "max": hi, "avg": total / count, "count": count}
+            for ts, lo, hi, total, count in rows
+        ]
+
+    def latest(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get the most recent 1s bucket of a metric"""
+        rows = self.query(name, time.time() - RESOLUTIONS["1s"][1], resolution="1s")
+        return rows[-1] if rows else None
+
+    def metric_names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._metric_ids)
+
+    def close(self) -> None:
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+
+def flatten_metrics(data: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """Flatten a nested report into dotted metric names, keeping numbers only"""
+    flat: Dict[str, float] = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_metrics(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def health_report_metrics(report: Dict[str, Any]) -> Dict[str, float]:
+    """Pick the numeric gauges of a health report worth keeping as history"""
+    return {
+        "memory.percent": report["memory_usage"]["percent"],
+        "memory.used": report["memory_usage"]["used"],
+        "cpu.percent": report["cpu_usage"]["percent"],
+        "disk.percent": report["disk_usage"]["percent"],
+        "disk.used": report["disk_usage"]["used"],
+        **flatten_metrics(report["network"], "network."),
+        **flatten_metrics(report.get("io_rates", {}).get("disk", {}).get("total", {}), "disk."),
+        **flatten_metrics(report.get("io_rates", {}).get("network", {}).get("total", {}), "network.")
+    }
+
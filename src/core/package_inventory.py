@@ -0,0 +1,160 @@
+import os
+import re
+import sys
+import threading
+from importlib import metadata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Distributions the scanner reports as AI/ML related (PEP 503 normalised names)
+AI_ML_PACKAGES = frozenset({
+    "accelerate", "anthropic", "bitsandbytes", "catboost", "datasets",
+    "diffusers", "faiss-cpu", "faiss-gpu", "fastai", "gensim", "huggingface-hub",
+    "jax", "jaxlib", "keras", "langchain", "langchain-core", "lightgbm",
+    "llama-cpp-python", "matplotlib", "mlflow", "nltk", "numpy", "onnx",
+    "onnxruntime", "onnxruntime-gpu", "openai", "opencv-python", "optuna",
+    "pandas", "peft", "pytorch-lightning", "lightning", "safetensors",
+    "scikit-learn", "scipy", "sentence-transformers", "sentencepiece", "spacy",
+    "statsmodels", "tensorflow", "tensorflow-cpu", "tensorflow-gpu", "tiktoken",
+    "tokenizers", "torch", "torchaudio", "torchvision", "transformers", "triton",
+    "vllm", "xgboost",
+})
+
+_METADATA_SUFFIXES = (".dist-info", ".egg-info")
+_DIST_INFO_NAME = re.compile(r"^(?P<name>[^-]+)-(?P<version>[^-]+)\.dist-info$")
+
+
+def normalize_name(name: str) -> str:
+    """Normalise a distribution name the way PEP 503 (and pkg_resources keys) do"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+class _DirectoryCache:
+    """Cached distributions of one site-packages directory"""
+
+    def __init__(self):
+        self.mtime: Optional[float] = None
+        # metadata entry name -> (entry mtime, package dict)
+        self.entries: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+
+class PackageInventory:
+    """Installed-package inventory built on importlib.metadata.
+
+    Each directory on ``sys.path`` is cached separately and keyed by its
+    mtime. When a directory changes only the ``*.dist-info``/``*.egg-info``
+    entries that were added or modified are read again, so repeated scans of
+    a large virtualenv cost a handful of ``stat`` calls.
+    """
+
+    def __init__(self, paths: Optional[Iterable[str]] = None):
+        self._paths = list(paths) if paths is not None else None
+        self._cache: Dict[str, _DirectoryCache] = {}
+        self._lock = threading.Lock()
+
+    def _search_paths(self) -> List[str]:
+        paths = self._paths if self._paths is not None else sys.path
+        seen = set()
+        result = []
+        for path in paths:
+            path = os.path.abspath(path or os.getcwd())
+            if path not in seen and os.path.isdir(path):
+                seen.add(path)
+                result.append(path)
+        return result
+
+    def _read_entry(self, directory: str, entry: str) -> Optional[Dict[str, str]]:
+        match = _DIST_INFO_NAME.match(entry)
+        if match:
+            # dist-info directory names are normalised "name-version" (PEP 427),
+            # so no file needs to be opened for the common case
+            return {"name": normalize_name(match.group("name")), "version": match.group("version")}
+        try:
+            dist = metadata.PathDistribution.at(os.path.join(directory, entry))
+            name = dist.metadata["Name"]
+        except Exception:
+            return None
+        if not name:
+            return None
+        return {"name": normalize_name(name), "version": dist.version}
+
+    def _refresh_directory(self, directory: str) -> _DirectoryCache:
+        cache = self._cache.setdefault(directory, _DirectoryCache())
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            cache.entries.clear()
+            cache.mtime = None
+            return cache
+        if cache.mtime == mtime:
+            return cache
+
+        entries = {}
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    if not item.name.endswith(_METADATA_SUFFIXES):
+                        continue
+                    try:
+                        entry_mtime = item.stat().st_mtime
+                    except OSError:
+                        continue
+                    cached = cache.entries.get(item.name)
+                    if cached is not None and cached[0] == entry_mtime:
+                        entries[item.name] = cached
+                        continue
+                    package = self._read_entry(directory, item.name)
+                    if package is not None:
+                        entries[item.name] = (entry_mtime, package)
+        except OSError:
+            pass
+        cache.entries = entries
+        cache.mtime = mtime
+        return cache
+
+    def get_packages(self) -> List[Dict[str, str]]:
+        """Get all installed distributions, first match on sys.path wins"""
+        with self._lock:
+            packages = {}
+            for directory in self._search_paths():
+                cache = self._refresh_directory(directory)
+                for _, package in cache.entries.values():
+                    packages.setdefault(package["name"], package)
+            return sorted((dict(p) for p in packages.values()), key=lambda p: p["name"])
+
+    def get_ai_ml_packages(self) -> List[Dict[str, str]]:
+        """Get installed distributions that are known AI/ML packages"""
+        return [p for p in self.get_packages() if p["name"] in AI_ML_PACKAGES]
+
+    def find(self, name: str) -> Optional[Dict[str, str]]:
+        """Look up one installed distribution by name"""
+        wanted = normalize_name(name)
+        for package in self.get_packages():
+            if package["name"] == wanted:
+                return package
+        return None
+
+    def invalidate(self) -> None:
+        """Forget all cached directories"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get cache statistics for diagnostics"""
+        with self._lock:
+            return {
+                "directories": len(self._cache),
+                "entries": sum(len(c.entries) for c in self._cache.values())
+            }
+
+
+_shared_inventory: Optional[PackageInventory] = None
+_shared_lock = threading.Lock()
+
+
+def get_package_inventory() -> PackageInventory:
+    """Get the process-wide package inventory"""
+    global _shared_inventory
+    with _shared_lock:
+        if _shared_inventory is None:
+            _shared_inventory = PackageInventory()
+        return _shared_inventory
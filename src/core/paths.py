@@ -0,0 +1,29 @@
+import os
+from pathlib import Path
+
+APP_NAME = "ai-agent-assistant"
+
+
+def _base_dir(env_var: str, fallback: str) -> Path:
+    value = os.environ.get(env_var)
+    if value and os.path.isabs(value):
+        return Path(value)
+    if os.name == "nt" and os.environ.get("APPDATA"):
+        return Path(os.environ["APPDATA"])
+    return Path.home() / fallback
+
+
+def data_dir(create: bool = True) -> Path:
+    """Get the per-user data directory ($XDG_DATA_HOME/ai-agent-assistant)"""
+    path = _base_dir("XDG_DATA_HOME", ".local/share") / APP_NAME
+    if create:
+        path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def config_dir(create: bool = True) -> Path:
+    """Get the per-user config directory ($XDG_CONFIG_HOME/ai-agent-assistant)"""
+    path = _base_dir("XDG_CONFIG_HOME", ".config") / APP_NAME
+    if create:
+        path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -0,0 +1,101 @@
+import heapq
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import psutil
+
+# Everything needed comes from /proc/<pid>/stat and statm on Linux, which
+# process_iter reads once per process inside oneshot()
+PROCESS_ATTRS = ["pid", "name", "cpu_times", "memory_info", "create_time"]
+
+
+class ProcessProfiler:
+    """Top-N process profiler.
+
+    CPU usage is computed from the change in each process's CPU time
+    between two ticks, so no call ever blocks on an interval. Per-process
+    state is keyed by (pid, create_time), which survives across ticks and
+    ignores reused pids. Results are reused for ``min_interval`` seconds so
+    several consumers in the same tick share one pass over the process
+    table.
+    """
+
+    def __init__(self, min_interval: float = 2.0):
+        self.min_interval = min_interval
+        self._previous: Dict[int, Tuple[float, float]] = {}  # pid -> (create_time, cpu seconds)
+        self._previous_time: Optional[float] = None
+        self._processes: List[Dict[str, Any]] = []
+        self._sampled_at = 0.0
+        self._lock = threading.Lock()
+
+    def sample(self, force: bool = False) -> List[Dict[str, Any]]:
+        """Get resource usage of every process, refreshing if the cache is stale"""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._processes and now - self._sampled_at < self.min_interval:
+                return self._processes
+            self._processes = self._collect(now)
+            self._sampled_at = now
+            return self._processes
+
+    def _collect(self, now: float) -> List[Dict[str, Any]]:
+        wall_now = time.time()
+        elapsed = None if self._previous_time is None else now - self._previous_time
+        total_memory = psutil.virtual_memory().total or 1
+        previous = self._previous
+        current: Dict[int, Tuple[float, float]] = {}
+        processes = []
+        for proc in psutil.process_iter(attrs=PROCESS_ATTRS, ad_value=None):
+            info = proc.info
+            times = info["cpu_times"]
+            memory = info["memory_info"]
+            if times is None or memory is None:
+                continue  # access denied or process vanished mid-read
+            pid = info["pid"]
+            created = info["create_time"] or 0.0
+            cpu_total = times.user + times.system
+            current[pid] = (created, cpu_total)
+
+            before = previous.get(pid)
+            if elapsed and before is not None and before[0] == created:
+                cpu_percent = (cpu_total - before[1]) / elapsed * 100
+            else:
+                # First sighting: average over the process lifetime
+                lifetime = wall_now - created if created else 0
+                cpu_percent = cpu_total / lifetime * 100 if lifetime > 0 else 0.0
+            processes.append({
+                "pid": pid,
+                "name": info["name"] or "",
+                "cpu_percent": round(max(cpu_percent, 0.0), 1),
+                "memory_rss": memory.rss,
+                "memory_percent": round(memory.rss / total_memory * 100, 1)
+            })
+        self._previous = current
+        self._previous_time = now
+        return processes
+
+    def top(self, n: int = 5, by: str = "cpu_percent") -> List[Dict[str, Any]]:
+        """Get the n heaviest processes by cpu_percent, memory_rss or memory_percent"""
+        return heapq.nlargest(n, self.sample(), key=lambda p: p[by])
+
+
+_shared_profiler: Optional[ProcessProfiler] = None
+_shared_lock = threading.Lock()
+
+
+def get_process_profiler() -> ProcessProfiler:
+    """Get the process-wide profiler"""
+    global _shared_profiler
+    with _shared_lock:
+        if _shared_profiler is None:
+            _shared_profiler = ProcessProfiler()
+        return _shared_profiler
+
+
+def describe_processes(processes: List[Dict[str, Any]], by: str = "cpu_percent") -> str:
+    """Short human-readable list such as 'python (pid 42, 85.0%)'"""
+    return ", ".join(
+        f"{p['name']} (pid {p['pid']}, {p[by]}%)" if by != "memory_rss"
+        else f"{p['name']} (pid {p['pid']}, {p['memory_rss'] / (1024 ** 2):.0f}MB)"
+        for p in processes
+    )
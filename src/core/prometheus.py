@@ -0,0 +1,207 @@
+"""Prometheus text exposition of the sampled metrics.
+
+The exposition is rendered on the exporter's own thread once per sampling
+interval and kept as bytes, so a scrape only copies a buffer: it never
+calls psutil and never waits on a slow mount. Rendering stays off the
+shared CPU sampler thread, so a slow disk query cannot delay samples.
+"""
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+import psutil
+from .alerts import FIRING
+from .io_rates import TOTAL
+from .system_scanner import SystemScanner
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "ai_agent_"
+
+# io_rates field -> (metric name, help text)
+DISK_RATES = {
+    "read_bytes_per_sec": ("disk_read_bytes_per_second", "Disk read throughput"),
+    "write_bytes_per_sec": ("disk_write_bytes_per_second", "Disk write throughput"),
+    "read_ops_per_sec": ("disk_reads_per_second", "Disk read operations per second"),
+    "write_ops_per_sec": ("disk_writes_per_second", "Disk write operations per second"),
+}
+NETWORK_RATES = {
+    "bytes_recv_per_sec": ("network_receive_bytes_per_second", "Network receive throughput"),
+    "bytes_sent_per_sec": ("network_transmit_bytes_per_second", "Network transmit throughput"),
+    "errors_in_per_sec": ("network_receive_errors_per_second", "Network receive errors per second"),
+    "errors_out_per_sec": ("network_transmit_errors_per_second", "Network transmit errors per second"),
+    "drops_in_per_sec": ("network_receive_drops_per_second", "Network receive drops per second"),
+    "drops_out_per_sec": ("network_transmit_drops_per_second", "Network transmit drops per second"),
+}
+
+Sample = Tuple[Dict[str, str], float]
+
+
+def escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_value(value: float) -> str:
+    """A sample value as the text format spells it (NaN, +Inf and -Inf included)"""
+    value = float(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+def format_family(name: str, help_text: str, samples: Iterable[Sample], kind: str = "gauge") -> List[str]:
+    """Lines for one metric family in the text exposition format"""
+    full_name = PREFIX + name
+    lines = [f"# HELP {full_name} {help_text}", f"# TYPE {full_name} {kind}"]
+    for labels, value in samples:
+        if labels:
+            label_text = ",".join(f'{key}="{escape_label(val)}"' for key, val in labels.items())
+            lines.append(f"{full_name}{{{label_text}}} {format_value(value)}")
+        else:
+            lines.append(f"{full_name} {format_value(value)}")
+    return lines
+
+
+class MetricsExporter:
+    """Keeps a pre-rendered /metrics body up to date and optionally serves it"""
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._body = b""
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._render_thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Render now and then once per sampling interval from a background thread"""
+        self.refresh()
+        if self._render_thread is not None and self._render_thread.is_alive():
+            return
+        self._stop.clear()
+        self._render_thread = threading.Thread(target=self._run, name="metrics-render", daemon=True)
+        self._render_thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._render_thread is not None:
+            self._render_thread.join(timeout=5)
+            self._render_thread = None
+        self.stop_server()
+
+    def _run(self) -> None:
+        # Follows the sampler's interval, which changes with the performance mode
+        while not self._stop.wait(self.settings.cpu_sampler.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error rendering metrics: {e}")
+
+    def body(self) -> bytes:
+        """The current exposition; never does any sampling work"""
+        return self._body
+
+    def refresh(self, per_core=None, timestamp: Optional[float] = None) -> None:
+        started = time.perf_counter()
+        text = self.render(per_core, timestamp)
+        self.render_seconds = time.perf_counter() - started
+        self.renders += 1
+        with self._lock:
+            self._body = text.encode("utf-8")
+
+    def render(self, per_core=None, timestamp: Optional[float] = None) -> str:
+        settings = self.settings
+        if per_core is None:
+            per_core = settings.cpu_sampler.per_core()
+            timestamp = timestamp or settings.cpu_sampler.get_status()["last_sample"]
+        per_core = list(per_core)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage("/")
+        rates = settings.io_rates.sample()
+        current = settings.get_runtime_settings()
+        lines: List[str] = []
+
+        lines += format_family("cpu_usage_percent", "CPU busy percentage per core",
+                               (({"core": str(i)}, value) for i, value in enumerate(per_core)))
+        lines += format_family("cpu_usage_average_percent", "CPU busy percentage averaged over cores",
+                               [({}, sum(per_core) / len(per_core) if per_core else 0.0)])
+        lines += format_family("memory_usage_percent", "Percentage of memory in use", [({}, memory.percent)])
+        lines += format_family("memory_used_bytes", "Bytes of memory in use", [({}, memory.used)])
+        lines += format_family("memory_total_bytes", "Total physical memory", [({}, memory.total)])
+        lines += format_family("disk_usage_percent", "Percentage of disk space in use", [({"mountpoint": "/"}, disk.percent)])
+        lines += format_family("disk_used_bytes", "Bytes of disk space in use", [({"mountpoint": "/"}, disk.used)])
+        lines += format_family("disk_total_bytes", "Disk size", [({"mountpoint": "/"}, disk.total)])
+        for group, label, fields in (("disk", "device", DISK_RATES), ("network", "interface", NETWORK_RATES)):
+            devices = rates.get(group, {})
+            for field, (name, help_text) in fields.items():
+                lines += format_family(name, help_text, [
+                    ({label: device}, values.get(field, 0.0))
+                    for device, values in sorted(devices.items()) if device != TOTAL  # sum() in PromQL instead
+                ])
+
+        rules = settings.alerts.rules()
+        lines += format_family("alert_firing", "1 while an alert rule is firing", [
+            ({"rule": rule.name, "metric": rule.metric, "severity": rule.severity}, rule.state == FIRING)
+            for rule in rules
+        ])
+        lines += format_family("alert_threshold", "Threshold of each alert rule", [
+            ({"rule": rule.name, "metric": rule.metric}, rule.threshold) for rule in rules
+        ])
+        lines += format_family("performance_mode", "Current performance mode (1 for the active one)", [
+            ({"mode": mode}, mode == current["performance_mode"])
+            for mode in ("balanced", "performance", "power_save")
+        ])
+
+        snapshot = SystemScanner.cached_snapshot()
+        if snapshot is not None:
+            lines += format_family("scan_collector_duration_seconds", "Duration of each probe in the last scan", [
+                ({"collector": name, "status": info["status"]}, info["duration"])
+                for name, info in snapshot.collectors.items()
+            ])
+            lines += format_family("scan_age_seconds", "Age of the last system scan", [({}, snapshot.age())])
+
+        lines += format_family("sample_timestamp_seconds", "Time of the sample this exposition was built from",
+                               [({}, timestamp or time.time())])
+        lines += format_family("exporter_render_seconds", "Time spent rendering the previous exposition",
+                               [({}, self.render_seconds)])
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> str:
+        """Serve GET /metrics from a background thread; returns the URL"""
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.body()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), MetricsHandler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="metrics-exporter", daemon=True)
+        self._thread.start()
+        bound_host, bound_port = self.httpd.server_address[:2]
+        return f"http://{bound_host}:{bound_port}/metrics"
+
+    def stop_server(self) -> None:
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -0,0 +1,82 @@
+from array import array
+from typing import Iterable, List, Sequence
+
+
+class RingBuffer:
+    """Fixed-capacity, multi-channel ring buffer of floats.
+
+    Storage is one preallocated ``array('d')`` laid out row-major
+    (``capacity`` rows of ``channels`` values), so appending writes in place
+    and never allocates.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1):
+        if capacity < 1 or channels < 1:
+            raise ValueError("capacity and channels must be positive")
+        self.capacity = capacity
+        self.channels = channels
+        self._data = array("d", bytes(8 * capacity * channels))
+        self._head = 0  # row the next append writes to
+        self._size = 0
+        self.total = 0  # appends since creation; lets views track scrolling
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, values: Sequence[float]) -> None:
+        """Append one row; extra values are ignored, missing ones become 0"""
+        base = self._head * self.channels
+        data = self._data
+        count = min(len(values), self.channels)
+        for i in range(count):
+            data[base + i] = values[i]
+        for i in range(count, self.channels):
+            data[base + i] = 0.0
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        self.total += 1
+
+    def extend(self, rows: Iterable[Sequence[float]]) -> None:
+        for row in rows:
+            self.append(row)
+
+    def _row_index(self, age: int) -> int:
+        """Storage row of the sample `age` steps back (0 = newest)"""
+        return (self._head - 1 - age) % self.capacity
+
+    def value(self, age: int, channel: int = 0) -> float:
+        """Get one value; age 0 is the newest sample"""
+        if not 0 <= age < self._size:
+            raise IndexError("sample out of range")
+        return self._data[self._row_index(age) * self.channels + channel]
+
+    def latest(self) -> List[float]:
+        """Get the newest row"""
+        if not self._size:
+            return []
+        base = self._row_index(0) * self.channels
+        return self._data[base:base + self.channels].tolist()
+
+    def channel(self, channel: int = 0) -> List[float]:
+        """Get one channel ordered oldest to newest"""
+        start = (self._head - self._size) % self.capacity
+        return [
+            self._data[((start + i) % self.capacity) * self.channels + channel]
+            for i in range(self._size)
+        ]
+
+    def max(self) -> float:
+        """Largest value currently held across all channels"""
+        if not self._size:
+            return 0.0
+        if self._size == self.capacity:
+            return max(self._data)
+        values = []
+        for channel in range(self.channels):
+            values.extend(self.channel(channel))
+        return max(values)
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
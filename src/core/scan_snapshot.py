@@ -0,0 +1,87 @@
+import time
+from typing import Any, Dict, Optional
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError("scan snapshots are read-only")
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation; still JSON-serialisable and ``isinstance(.., dict)``"""
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+    __ior__ = _readonly
+
+    def __hash__(self):
+        # Consistent with dict equality; values are frozen by freeze(), so they hash too
+        return hash(frozenset(self.items()))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDict and lists to tuples"""
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert a frozen structure back into plain dicts and lists"""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class ScanSnapshot(FrozenDict):
+    """Immutable result of one ``SystemScanner.scan_system()`` call.
+
+    Behaves like the plain dict ``scan_system`` used to return, so existing
+    consumers can index it unchanged, but it cannot be modified and carries
+    the time it was taken so it can be cached and shared. ``collectors``
+    holds per-section timing and status (``ok``, ``error`` or ``timeout``).
+    """
+
+    def __init__(self, sections: Dict[str, Any], taken_at: Optional[float] = None,
+                 collectors: Optional[Dict[str, Dict[str, Any]]] = None):
+        super().__init__((name, freeze(data)) for name, data in sections.items())
+        self.taken_at = time.time() if taken_at is None else taken_at
+        self.collectors = freeze(collectors or {})
+        self._monotonic = time.monotonic()
+
+    def __reduce__(self):
+        return (type(self), (dict(self), self.taken_at, self.collectors))
+
+    def failed_sections(self) -> Dict[str, Any]:
+        """Get the status of every collector that did not finish cleanly"""
+        return {name: info for name, info in self.collectors.items() if info["status"] != "ok"}
+
+    def age(self) -> float:
+        """Seconds since the snapshot was taken"""
+        return time.monotonic() - self._monotonic
+
+    def is_fresh(self, ttl: float) -> bool:
+        return self.age() <= ttl
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a mutable deep copy of the snapshot data"""
+        return thaw(self)
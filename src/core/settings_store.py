@@ -0,0 +1,173 @@
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+from .fileio import FileWatcher, atomic_write
+from .paths import config_dir
+
+
+def validate(values: Dict[str, Any], schema: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Check values against a schema; returns one message per problem.
+
+    Schema entries look like ``{"type": int, "min": 1, "max": 10}`` or
+    ``{"type": str, "choices": [...]}``. Keys without an entry are accepted.
+    """
+    errors = []
+    for key, value in values.items():
+        rule = schema.get(key)
+        if rule is None:
+            continue
+        expected = rule.get("type")
+        if expected is not None:
+            types = expected if isinstance(expected, tuple) else (expected,)
+            # bool is an int subclass but never a valid number here
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                names = "/".join(t.__name__ for t in types)
+                errors.append(f"{key}: expected {names}, got {type(value).__name__}")
+                continue
+        if "choices" in rule and value not in rule["choices"]:
+            errors.append(f"{key}: must be one of {', '.join(map(str, rule['choices']))}")
+        if "min" in rule and value < rule["min"]:
+            errors.append(f"{key}: must be at least {rule['min']}")
+        if "max" in rule and value > rule["max"]:
+            errors.append(f"{key}: must be at most {rule['max']}")
+    return errors
+
+
+class SettingsStore:
+    """JSON settings file with validation, coalesced atomic writes and change detection.
+
+    ``values`` is one dict that is updated in place, so callers may keep a
+    reference to it. ``save()`` only schedules a write; saves within
+    ``debounce`` seconds of each other become one write, and any pending
+    write is flushed at interpreter exit. Edits made to the file by other
+    processes are picked up by a FileWatcher and reported to listeners.
+    """
+
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None,
+                 defaults: Optional[Dict[str, Any]] = None,
+                 schema: Optional[Dict[str, Dict[str, Any]]] = None,
+                 debounce: float = 0.5, watch_interval: float = 2.0,
+                 legacy_paths: Optional[List[str]] = None):
+        self.path = Path(path) if path else config_dir() / "settings.json"
+        self.defaults = dict(defaults or {})
+        self.schema = schema or {}
+        self.debounce = debounce
+        self.values: Dict[str, Any] = dict(self.defaults)
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+
+        if not self.path.exists():
+            self._migrate(legacy_paths or [])
+        self.values.update(self._read())
+        self.watcher = FileWatcher(self.path, self._on_file_changed, watch_interval)
+        self.watcher.start()
+        atexit.register(self.flush)
+
+    def _migrate(self, legacy_paths: List[str]) -> None:
+        """Copy settings from an older location into the config directory"""
+        for legacy in legacy_paths:
+            if not os.path.isfile(legacy):
+                continue
+            try:
+                with open(legacy, "r") as f:
+                    data = json.load(f)
+                atomic_write(self.path, json.dumps(self._clean(data, legacy), indent=4))
+                print(f"Migrated settings from {legacy} to {self.path}")
+            except Exception as e:
+                print(f"Error migrating settings from {legacy}: {e}")
+            return
+
+    def _clean(self, data: Any, source: Union[str, os.PathLike]) -> Dict[str, Any]:
+        """Drop invalid entries so one bad value does not discard the whole file"""
+        if not isinstance(data, dict):
+            print(f"Error loading settings from {source}: not a JSON object")
+            return {}
+        clean = {}
+        for key, value in data.items():
+            problems = validate({key: value}, self.schema)
+            if problems:
+                print(f"Ignoring invalid setting in {source}: {problems[0]}")
+            else:
+                clean[key] = value
+        return clean
+
+    def _read(self) -> Dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return self._clean(json.load(f), self.path)
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            return {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+    def update(self, new_values: Dict[str, Any]) -> None:
+        """Validate and apply new values, then schedule a write; raises ValueError if invalid"""
+        errors = validate(new_values, self.schema)
+        if errors:
+            raise ValueError("; ".join(errors))
+        with self._lock:
+            self.values.update(new_values)
+        self.save()
+
+    def save(self) -> None:
+        """Schedule a write of the current values"""
+        with self._lock:
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.debounce, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes now; returns False if the write failed"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return True
+            try:
+                atomic_write(self.path, json.dumps(self.values, indent=4))
+            except Exception as e:
+                print(f"Error saving settings: {e}")
+                return False
+            self._dirty = False
+            self.watcher.acknowledge()
+            return True
+
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Register a callback for edits made to the file outside this process"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _on_file_changed(self, path: str) -> None:
+        with self._lock:
+            if self._dirty:
+                return  # our pending write wins
+            fresh = {**self.defaults, **self._read()}
+            # Update in place without ever leaving the dict empty for readers
+            for key in [key for key in self.values if key not in fresh]:
+                del self.values[key]
+            self.values.update(fresh)
+            values = dict(self.values)
+        for callback in list(self._listeners):
+            try:
+                callback(values)
+            except Exception as e:
+                print(f"Error in settings listener: {e}")
+
+    def close(self) -> None:
+        self.flush()
+        self.watcher.stop()
@@ -2,18 +2,85 @@ import os
 import sys
 import psutil
 import platform
+import threading
 from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from .collectors import CollectorRegistry, CollectorResult
+from .cpu_sampler import get_cpu_sampler
+from .io_rates import get_io_rate_tracker
+from .package_inventory import get_package_inventory
+from .scan_snapshot import ScanSnapshot
+from .tracing import span
 
 class SystemScanner:
-    def scan_system(self):
-        """Perform a comprehensive system scan"""
-        return {
-            "system_info": self._get_system_info(),
-            "hardware_info": self._get_hardware_info(),
-            "performance_metrics": self._get_performance_metrics(),
-            "installed_software": self._get_installed_software(),
-            "python_environment": self._get_python_environment()
-        }
+    # Snapshots are shared by every scanner in the process so that one scan
+    # serves the scan page, the recommendations and template validation.
+    _snapshot: Optional[ScanSnapshot] = None
+    _snapshot_lock = threading.Lock()
+
+    def __init__(self, snapshot_ttl: float = 30.0):
+        self.snapshot_ttl = snapshot_ttl
+        # Created now so the first scan already has a baseline to diff against
+        self.io_rates = get_io_rate_tracker()
+        # Collectors run on the process-wide worker pool, so scanners are cheap to create
+        self.collectors = CollectorRegistry()
+        self.collectors.register("system_info", self._get_system_info, timeout=5.0)
+        self.collectors.register("hardware_info", self._get_hardware_info, timeout=5.0)
+        self.collectors.register("performance_metrics", self._get_performance_metrics, timeout=5.0)
+        self.collectors.register("installed_software", self._get_installed_software, timeout=30.0)
+        self.collectors.register("python_environment", self._get_python_environment, timeout=30.0)
+
+    def scan_system(self, on_section: Optional[Callable[[CollectorResult, int, int], None]] = None,
+                    sections: Optional[List[str]] = None) -> ScanSnapshot:
+        """Perform a comprehensive system scan and cache the result
+
+        Collectors run concurrently; a collector that fails or times out is
+        reported as ``{"error": ...}`` in its section and in
+        ``snapshot.collectors`` instead of aborting the scan. If given,
+        ``on_section(result, done, total)`` is called as soon as each section
+        is collected, from the scanning thread. A partial scan limited to
+        ``sections`` is returned but not cached.
+        """
+        names = sections or self.collectors.names()
+        results = {}
+        with span("scanner.scan_system", sections=len(names)):
+            for result in self.collectors.iter_results(names):
+                results[result.name] = result
+                if on_section is not None:
+                    on_section(result, len(results), len(names))
+        return self._store_snapshot(
+            {name: results[name] for name in names if name in results},
+            cache=sections is None
+        )
+
+    def _store_snapshot(self, results: Dict[str, CollectorResult], cache: bool = True) -> ScanSnapshot:
+        snapshot = ScanSnapshot(
+            {name: result.section() for name, result in results.items()},
+            collectors={name: result.as_dict() for name, result in results.items()}
+        )
+        if cache:
+            with SystemScanner._snapshot_lock:
+                SystemScanner._snapshot = snapshot
+        return snapshot
+
+    def get_snapshot(self, max_age: Optional[float] = None) -> ScanSnapshot:
+        """Get the cached scan if younger than max_age (default: snapshot_ttl), else rescan"""
+        ttl = self.snapshot_ttl if max_age is None else max_age
+        snapshot = SystemScanner._snapshot
+        if snapshot is not None and snapshot.is_fresh(ttl):
+            return snapshot
+        return self.scan_system()
+
+    @classmethod
+    def cached_snapshot(cls) -> Optional[ScanSnapshot]:
+        """Get the last full scan, however old, without ever scanning"""
+        return cls._snapshot
+
+    @classmethod
+    def invalidate_snapshot(cls) -> None:
+        """Drop the cached scan so the next consumer rescans"""
+        with cls._snapshot_lock:
+            cls._snapshot = None
     
     def _get_system_info(self):
         """Get basic system information"""
@@ -47,44 +114,48 @@ class SystemScanner:
     def _get_performance_metrics(self):
         """Get current system performance metrics"""
         return {
-            "cpu_usage": psutil.cpu_percent(interval=1, percpu=True),
+            "cpu_usage": get_cpu_sampler().per_core(),
             "memory_usage": psutil.virtual_memory().percent,
             "disk_io": psutil.disk_io_counters()._asdict() if psutil.disk_io_counters() else None,
-            "network_io": psutil.net_io_counters()._asdict()
+            "network_io": psutil.net_io_counters()._asdict(),
+            "io_rates": self.io_rates.sample()
         }
     
     def _get_installed_software(self):
         """Get list of installed AI/ML related packages"""
         try:
-            import pkg_resources
-            packages = [
-                {"name": pkg.key, "version": pkg.version}
-                for pkg in pkg_resources.working_set
-            ]
-            return packages
+            return get_package_inventory().get_ai_ml_packages()
         except Exception as e:
             return {"error": str(e)}
     
     def _get_python_environment(self):
         """Get Python environment details"""
+        try:
+            packages = get_package_inventory().get_packages()
+        except Exception as e:
+            packages = {"error": str(e)}
         return {
             "python_path": sys.executable,
             "python_version": platform.python_version(),
-            "pip_packages": self._get_installed_software()
+            "pip_packages": packages
         }
 
-    def get_hardware_recommendations(self):
+    def get_hardware_recommendations(self, snapshot: Optional[ScanSnapshot] = None):
         """Generate hardware recommendations based on scan results"""
-        system_info = self.scan_system()
+        system_info = snapshot if snapshot is not None else self.get_snapshot()
         recommendations = []
 
         # CPU recommendations
-        cpu_usage = sum(system_info["performance_metrics"]["cpu_usage"]) / len(system_info["performance_metrics"]["cpu_usage"])
-        if cpu_usage > 80:
-            recommendations.append("High CPU usage detected. Consider upgrading CPU or optimizing workload.")
+        metrics = system_info["performance_metrics"]
+        if "error" not in metrics and metrics["cpu_usage"]:
+            cpu_usage = sum(metrics["cpu_usage"]) / len(metrics["cpu_usage"])
+            if cpu_usage > 80:
+                recommendations.append("High CPU usage detected. Consider upgrading CPU or optimizing workload.")
         
         # Memory recommendations
         memory_info = system_info["hardware_info"]
+        if "error" in memory_info:
+            return recommendations
         if memory_info["memory_percent"] > 80:
             recommendations.append("High memory usage. Consider increasing RAM.")
         
@@ -94,10 +165,12 @@ class SystemScanner:
 
         return recommendations
 
-    def get_ai_agent_recommendations(self):
+    def get_ai_agent_recommendations(self, snapshot: Optional[ScanSnapshot] = None):
         """Generate AI agent recommendations based on system capabilities"""
-        system_info = self.scan_system()
+        system_info = snapshot if snapshot is not None else self.get_snapshot()
         recommendations = []
+        if "error" in system_info["hardware_info"]:
+            return recommendations
 
         # Basic recommendations based on hardware
         memory_gb = system_info["hardware_info"]["total_memory"] / (1024 ** 3)
@@ -0,0 +1,390 @@
+import bisect
+import functools
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from .fileio import FileWatcher, directory_signature, file_signature
+from .package_inventory import normalize_name
+from .paths import config_dir
+from .tracing import span
+
+TEMPLATE_SUFFIXES = (".yaml", ".yml")
+# Generated agent runtimes: a synchronous run(), or an asyncio service (see core.codegen)
+RUNTIMES = ("sync", "async")
+
+BUILTIN_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "basic": {
+        "name": "Basic Agent",
+        "description": "Simple agent with basic capabilities",
+        "requirements": {
+            "memory": "2GB",
+            "cpu_cores": 2,
+            "python_packages": ["requests", "python-dotenv"]
+        },
+        "features": [
+            "HTTP requests",
+            "Environment variable management",
+            "Basic error handling"
+        ]
+    },
+    "advanced": {
+        "name": "Advanced Agent",
+        "description": "Advanced agent with ML capabilities",
+        "requirements": {
+            "memory": "8GB",
+            "cpu_cores": 4,
+            "python_packages": [
+                "torch",
+                "transformers",
+                "numpy",
+                "pandas"
+            ]
+        },
+        "features": [
+            "Machine learning inference",
+            "Data processing",
+            "Advanced error handling",
+            "Logging and monitoring"
+        ]
+    }
+}
+
+_MEMORY = re.compile(r"^\s*(?P<amount>\d+(?:\.\d+)?)\s*(?P<unit>[KMGT]?B?)\s*$", re.IGNORECASE)
+_MEMORY_UNITS = {"K": 1 / 1024 ** 2, "M": 1 / 1024, "G": 1, "T": 1024, "": 1}
+_REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def memory_gb(value: Union[str, int, float]) -> float:
+    """Parse a memory requirement such as "8GB", "512MB" or 4 into gigabytes"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = _MEMORY.match(str(value))
+    if not match:
+        raise ValueError(f"Invalid memory requirement: {value!r}")
+    return float(match.group("amount")) * _MEMORY_UNITS[match.group("unit")[:1].upper()]
+
+
+def requirement_name(requirement: str) -> str:
+    """Normalised distribution name of a requirement string ("torch>=2.0" -> "torch")"""
+    match = _REQUIREMENT_NAME.match(requirement)
+    if not match:
+        raise ValueError(f"Invalid package requirement: {requirement!r}")
+    return normalize_name(match.group(1))
+
+
+def normalize_template(data: Any, key: str) -> Dict[str, Any]:
+    """Check a parsed template and fill in optional fields; raises ValueError"""
+    if not isinstance(data, dict):
+        raise ValueError("template is not a mapping")
+    requirements = data.get("requirements")
+    if not isinstance(requirements, dict) or "memory" not in requirements:
+        raise ValueError("requirements.memory is missing")
+    memory_gb(requirements["memory"])
+    cores = requirements.get("cpu_cores", 1)
+    if not isinstance(cores, int) or isinstance(cores, bool) or cores < 1:
+        raise ValueError(f"requirements.cpu_cores must be a positive integer, got {cores!r}")
+    packages = requirements.get("python_packages") or []
+    features = data.get("features") or []
+    if not isinstance(packages, list) or not isinstance(features, list):
+        raise ValueError("python_packages and features must be lists")
+    for package in packages:
+        requirement_name(str(package))
+    runtime = data.get("runtime", "sync")
+    if runtime not in RUNTIMES:
+        raise ValueError(f"runtime must be one of {', '.join(RUNTIMES)}, got {runtime!r}")
+
+    template = dict(data)
+    template.pop("id", None)
+    template["name"] = str(data.get("name") or key)
+    template["description"] = str(data.get("description") or "")
+    template["requirements"] = {**requirements, "cpu_cores": cores,
+                                "python_packages": [str(p) for p in packages]}
+    template["features"] = [str(f) for f in features]
+    template["runtime"] = runtime
+    return template
+
+
+def _safe_loader():
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_file(path: str, parsed: Dict[str, Any]) -> Tuple[str, str, Any]:
+    """Read one template file; returns (path, digest, (id, template) or exception)
+
+    The result is cached by content digest and shared by every file with
+    the same contents, so it must not depend on the path: ``id`` is None
+    and ``name`` empty when the file does not set them (see ``_keyed``).
+    """
+    import yaml
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha1(raw).hexdigest()
+    if digest in parsed:
+        return path, digest, parsed[digest]
+    try:
+        data = yaml.load(raw, Loader=_safe_loader())
+        template_id = str(data["id"]) if isinstance(data, dict) and data.get("id") else None
+        return path, digest, (template_id, normalize_template(data, ""))
+    except Exception as e:
+        return path, digest, e
+
+
+def _file_key(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _keyed(path: str, parsed: Tuple[Optional[str], Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """Key and template of a cached parse result for the file it was found in"""
+    template_id, template = parsed
+    key = template_id or _file_key(path)
+    if not template["name"]:
+        template = {**template, "name": key}
+    return key, template
+
+
+class _Index:
+    """Lookup tables over one generation of templates (never modified once built)"""
+
+    def __init__(self, templates: Dict[str, Dict[str, Any]]):
+        self.templates = templates
+        self.names = frozenset(templates)
+        self.by_package: Dict[str, Set[str]] = {}
+        self.by_feature: Dict[str, Set[str]] = {}
+        by_memory = []
+        by_cores = []
+        for name, template in templates.items():
+            requirements = template["requirements"]
+            by_memory.append((memory_gb(requirements["memory"]), name))
+            by_cores.append((requirements["cpu_cores"], name))
+            for package in requirements["python_packages"]:
+                self.by_package.setdefault(requirement_name(package), set()).add(name)
+            for feature in template["features"]:
+                self.by_feature.setdefault(feature.casefold(), set()).add(name)
+        by_memory.sort()
+        by_cores.sort()
+        self.memory_keys = [value for value, _ in by_memory]
+        self.memory_names = [name for _, name in by_memory]
+        self.core_keys = [value for value, _ in by_cores]
+        self.core_names = [name for _, name in by_cores]
+
+
+class TemplateRegistry:
+    """Agent templates from the built-in set plus a directory of YAML files.
+
+    Every ``*.yaml``/``*.yml`` file below ``directory`` holds one template,
+    keyed by its ``id`` field or file name; directory templates override
+    built-ins of the same key. Files are read and parsed on a worker pool,
+    and parsed templates are cached by the SHA-1 of the file contents, so a
+    reload only parses files whose contents changed. Templates are indexed
+    by required package, memory, CPU cores and feature, which lets
+    ``find()`` answer queries from the indexes alone.
+
+    The template dicts are shared; copy one before modifying it.
+    """
+
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None,
+                 builtins: Optional[Dict[str, Dict[str, Any]]] = None,
+                 workers: int = 4, watch_interval: float = 2.0):
+        self.directory = os.fspath(directory) if directory else None
+        self.builtins = {key: normalize_template(value, key)
+                         for key, value in (BUILTIN_TEMPLATES if builtins is None else builtins).items()}
+        self.workers = workers
+        self.watch_interval = watch_interval
+        self.errors: Dict[str, str] = {}
+        self.sources: Dict[str, str] = {}
+        self._parsed: Dict[str, Any] = {}
+        self._files: Dict[str, Tuple[Any, str]] = {}
+        self._index = _Index(dict(self.builtins))
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Dict[str, List[str]]], None]] = []
+        self._watcher: Optional[FileWatcher] = None
+        self.reload()
+
+    @property
+    def templates(self) -> Dict[str, Dict[str, Any]]:
+        return self._index.templates
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._index.templates.get(name)
+
+    def names(self) -> List[str]:
+        return list(self._index.templates)
+
+    def _template_files(self) -> List[str]:
+        if not self.directory or not os.path.isdir(self.directory):
+            return []
+        files = []
+        for root, dirs, names in os.walk(self.directory):
+            dirs.sort()
+            files.extend(os.path.join(root, name) for name in sorted(names)
+                         if name.endswith(TEMPLATE_SUFFIXES) and not name.startswith("."))
+        return files
+
+    def reload(self) -> Dict[str, List[str]]:
+        """Re-read the template directory; returns the added, changed and removed keys"""
+        with self._lock, span("templates.reload"):
+            files: Dict[str, Tuple[Any, str]] = {}
+            loaded: Dict[str, Any] = {}
+            pending = []
+            for path in self._template_files():
+                signature = file_signature(path)
+                known = self._files.get(path)
+                if known is not None and known[0] == signature and known[1] in self._parsed:
+                    files[path] = known
+                    loaded[path] = self._parsed[known[1]]
+                else:
+                    pending.append((path, signature))
+
+            if pending:
+                with ThreadPoolExecutor(min(self.workers, len(pending)),
+                                        thread_name_prefix="templates") as pool:
+                    futures = [(signature, pool.submit(_load_file, path, self._parsed))
+                               for path, signature in pending]
+                    for signature, future in futures:
+                        try:
+                            path, digest, result = future.result()
+                        except OSError as e:
+                            print(f"Error reading template: {e}")
+                            continue
+                        files[path] = (signature, digest)
+                        loaded[path] = result
+
+            templates = dict(self.builtins)
+            sources: Dict[str, str] = {}
+            errors: Dict[str, str] = {}
+            for path, result in loaded.items():
+                if isinstance(result, Exception):
+                    if self.errors.get(path) != str(result):
+                        print(f"Error loading template {path}: {result}")
+                    errors[path] = str(result)
+                    continue
+                key, template = _keyed(path, result)
+                if key in sources:
+                    print(f"Template '{key}' in {path} overrides {sources[key]}")
+                templates[key] = template
+                sources[key] = path
+
+            # Only keep parse results that are still on disk
+            self._parsed = {digest: loaded[path] for path, (_, digest) in files.items()
+                            if path in loaded}
+            self._files = files
+            self.errors = errors
+            self.sources = sources
+            previous = self._index.templates
+            self._index = _Index(templates)
+
+        changes = {
+            "added": sorted(key for key in templates if key not in previous),
+            "changed": sorted(key for key in templates
+                              if key in previous and templates[key] is not previous[key]
+                              and templates[key] != previous[key]),
+            "removed": sorted(key for key in previous if key not in templates)
+        }
+        if any(changes.values()):
+            for callback in list(self._listeners):
+                try:
+                    callback(changes)
+                except Exception as e:
+                    print(f"Error in template listener: {e}")
+        return changes
+
+    def find(self, max_memory: Optional[Union[str, float]] = None,
+             max_cores: Optional[int] = None,
+             packages: Optional[Iterable[str]] = None,
+             exclude_packages: Optional[Iterable[str]] = None,
+             features: Optional[Iterable[str]] = None) -> List[str]:
+        """Keys of templates matching every given condition, sorted.
+
+        ``max_memory``/``max_cores`` keep templates that fit on a machine of
+        that size, ``packages`` and ``features`` must all be required or
+        offered, and ``exclude_packages`` drops templates needing any of
+        them. For example, templates for 4 cores and 8GB without torch::
+
+            registry.find(max_memory="8GB", max_cores=4, exclude_packages=["torch"])
+        """
+        index = self._index
+        candidates: Optional[Set[str]] = None
+
+        def narrow(names: Iterable[str]) -> None:
+            nonlocal candidates
+            candidates = set(names) if candidates is None else candidates.intersection(names)
+
+        if max_memory is not None:
+            end = bisect.bisect_right(index.memory_keys, memory_gb(max_memory))
+            narrow(index.memory_names[:end])
+        if max_cores is not None:
+            end = bisect.bisect_right(index.core_keys, max_cores)
+            narrow(index.core_names[:end])
+        for package in packages or ():
+            narrow(index.by_package.get(requirement_name(package), ()))
+        for feature in features or ():
+            narrow(index.by_feature.get(feature.casefold(), ()))
+        if candidates is None:
+            candidates = set(index.names)
+        for package in exclude_packages or ():
+            candidates -= index.by_package.get(requirement_name(package), set())
+        return sorted(candidates)
+
+    def compatible(self, system_info: Dict[str, Any], **conditions) -> List[str]:
+        """Keys of templates whose memory and core requirements a scanned system meets"""
+        hardware = system_info["hardware_info"]
+        return self.find(max_memory=hardware["total_memory"] / (1024 ** 3),
+                         max_cores=hardware["cpu_cores"], **conditions)
+
+    def add_listener(self, callback: Callable[[Dict[str, List[str]]], None]) -> None:
+        """Register a callback for template changes found by ``reload()`` or the watcher"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Dict[str, List[str]]], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def start_watching(self) -> None:
+        """Reload automatically when files in the template directory change"""
+        if not self.directory or self._watcher is not None:
+            return
+        self._watcher = FileWatcher(
+            self.directory, lambda path: self.reload(), self.watch_interval,
+            signature=functools.partial(directory_signature, suffixes=TEMPLATE_SUFFIXES)
+        )
+        self._watcher.start()
+
+    def stop_watching(self) -> None:
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get registry statistics for diagnostics"""
+        return {
+            "directory": self.directory,
+            "templates": len(self._index.templates),
+            "files": len(self._files),
+            "errors": dict(self.errors),
+            "watching": self._watcher is not None
+        }
+
+
+def default_template_dir() -> str:
+    """Template directory used by default ($AI_AGENT_TEMPLATES or <config dir>/templates)"""
+    return os.environ.get("AI_AGENT_TEMPLATES") or str(config_dir(create=False) / "templates")
+
+
+_shared_registry: Optional[TemplateRegistry] = None
+_shared_lock = threading.Lock()
+
+
+def get_template_registry() -> TemplateRegistry:
+    """Get the process-wide registry for the default template directory"""
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = TemplateRegistry(default_template_dir())
+        return _shared_registry
+
@@ -0,0 +1,251 @@
+"""Lightweight spans, latency histograms and Chrome trace export.
+
+Usage::
+
+    from core.tracing import span, traced
+
+    with span("scan.hardware_info"):
+        ...
+
+    @traced("designer.generate_code")
+    def generate(...): ...
+
+While tracing is disabled, ``span()`` returns a shared no-op context
+manager and ``@traced`` functions call straight through after one
+attribute check. Enable with ``get_tracer().enable()`` or by setting
+AI_AGENT_TRACE=1.
+"""
+import functools
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set
+from .fileio import atomic_write
+
+# Histogram buckets are quarter powers of two of a duration in microseconds
+_BUCKETS_PER_OCTAVE = 4
+
+
+class Histogram:
+    """Log-bucketed latency histogram (about 19% bucket width)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        micros = seconds * 1e6
+        index = int(math.log2(micros) * _BUCKETS_PER_OCTAVE) if micros > 1 else 0
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def percentile(self, p: float) -> float:
+        """Approximate percentile in seconds (upper edge of the bucket it falls in)"""
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(2 ** ((index + 1) / _BUCKETS_PER_OCTAVE) / 1e6, self.max)
+        return self.max
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "min": round(self.min, 6) if self.count else 0.0,
+            "p50": round(self.percentile(50), 6),
+            "p95": round(self.percentile(95), 6),
+            "max": round(self.max, 6)
+        }
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "args", "start", "profiler")
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.profiler = None
+
+    def __enter__(self):
+        self.profiler = self.tracer._claim_profile(self.name)
+        self.start = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.tracer._store_profile(self.name, self.profiler)
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.record(self.name, self.start, end - self.start, self.args)
+        return False
+
+
+class Tracer:
+    """Collects span timings into histograms and a bounded event buffer"""
+
+    def __init__(self, max_events: int = 20000):
+        self.enabled = False
+        # True while enabled or while a profile capture is armed; the only
+        # thing checked on the disabled fast path
+        self.active = False
+        self._histograms: Dict[str, Histogram] = {}
+        self._events: Deque[tuple] = deque(maxlen=max_events)
+        self._profile_targets: Set[str] = set()
+        self.profiles: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.active = True
+
+    def disable(self) -> None:
+        self.enabled = False
+        self.active = bool(self._profile_targets)
+
+    def span(self, name: str, **args):
+        if not self.active:
+            return _NULL_SPAN
+        return Span(self, name, args)
+
+    def record(self, name: str, start: float, duration: float,
+               args: Optional[Dict[str, Any]] = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.add(duration)
+            self._events.append((name, start, duration, threading.get_ident(), args or None))
+
+    def profile_next(self, name: str) -> None:
+        """Run the next span called ``name`` under cProfile (works while disabled too)"""
+        with self._lock:
+            self._profile_targets.add(name)
+            self.active = True
+
+    def _claim_profile(self, name: str):
+        if not self._profile_targets:
+            return None
+        with self._lock:
+            if name not in self._profile_targets:
+                return None
+            self._profile_targets.discard(name)
+            self.active = self.enabled or bool(self._profile_targets)
+        import cProfile  # only paid for when a capture is armed
+        return cProfile.Profile()
+
+    def _store_profile(self, name: str, profiler, limit: int = 30) -> None:
+        import io
+        import pstats
+
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+        self.profiles[name] = out.getvalue()
+
+    def histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Get timing statistics (in seconds) per span name"""
+        with self._lock:
+            return {name: h.as_dict() for name, h in sorted(self._histograms.items())}
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Buffered spans in Chrome trace event format (chrome://tracing, Perfetto)"""
+        with self._lock:
+            events = list(self._events)
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": round((start - self._origin) * 1e6, 3),
+                    "dur": round(duration * 1e6, 3),
+                    "pid": pid,
+                    "tid": tid,
+                    **({"args": args} if args else {})
+                }
+                for name, start, duration, tid, args in events
+            ],
+            "displayTimeUnit": "ms"
+        }
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Write the trace to a file; returns the number of events written"""
+        trace = self.chrome_trace()
+        atomic_write(path, json.dumps(trace, default=str))
+        return len(trace["traceEvents"])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._events.clear()
+            self.profiles.clear()
+
+
+_tracer = Tracer()
+if os.environ.get("AI_AGENT_TRACE"):
+    _tracer.enable()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return _tracer
+
+
+def span(name: str, **args):
+    """Time a block as a span; a no-op while tracing is inactive"""
+    if not _tracer.active:
+        return _NULL_SPAN
+    return Span(_tracer, name, args)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator recording every call of a function as a span"""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.active:
+                return func(*args, **kwargs)
+            with Span(_tracer, span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -15,7 +15,7 @@ def install_application():
     
     # Copy application files
     print("Copying application files...")
-    for item in ['main.py', 'core', 'ui', 'assets']:
+    for item in ['main.py', 'cli.py', 'daemon.py', 'core', 'ui', 'assets']:
         src = os.path.join(current_dir, item)
         dst = os.path.join(install_dir, item)
         if os.path.isfile(src):
@@ -1,10 +1,19 @@
+import time
+_START = time.perf_counter()
+
+import logging
+import os
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow
 from PyQt6.QtCore import QLocale
 from ui.main_window import MainWindow
 from ui.utils.i18n import i18n
+from ui.utils.startup import mark_process_start
+
+mark_process_start(_START)
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
     app = QApplication(sys.argv)
     
     # Set locale based on system language
@@ -17,6 +26,11 @@ def main():
     app.installTranslator(translator)
     
     window = MainWindow()
+    if os.environ.get("AI_AGENT_STARTUP_CHECK"):
+        # Exit right after the first frame; status 1 if startup missed its target
+        window.startup_probe.on_first_paint(
+            lambda report: app.exit(0 if report["within_target"] else 1)
+        )
     window.show()
     sys.exit(app.exec())
 
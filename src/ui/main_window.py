@@ -8,13 +8,29 @@ from PyQt6.QtWidgets import (
     QLabel,
     QComboBox
 )
-from PyQt6.QtCore import Qt, QLocale
-from .pages.system_scan import SystemScanPage
-from .pages.agent_design import AgentDesignPage
-from .pages.device_settings import DeviceSettingsPage
+from PyQt6.QtCore import Qt, QLocale, QEvent, QTimer, pyqtSignal
 from .utils.i18n import i18n
+from .utils.startup import FirstPaintProbe
+
+
+def _system_scan_page():
+    from .pages.system_scan import SystemScanPage
+    return SystemScanPage()
+
+
+def _agent_design_page():
+    from .pages.agent_design import AgentDesignPage
+    return AgentDesignPage()
+
+
+def _device_settings_page(settings_manager, auto_optimizer):
+    from .pages.device_settings import DeviceSettingsPage
+    return DeviceSettingsPage(settings_manager, auto_optimizer)
 
 class MainWindow(QMainWindow):
+    # Alert events arrive on the sampler thread; the signal hands them to the GUI thread
+    alert_event = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(i18n.t('window_title', "AI Agent Assistant"))
@@ -27,16 +43,23 @@ class MainWindow(QMainWindow):
         
         # Create stacked widget for different pages
         self.stacked_widget = QStackedWidget()
+        self.startup_probe = FirstPaintProbe(self)
         
-        # Create pages
-        self.system_scan_page = SystemScanPage()
-        self.agent_design_page = AgentDesignPage()
-        self.device_settings_page = DeviceSettingsPage()
-        
-        # Add pages to stacked widget
-        self.stacked_widget.addWidget(self.system_scan_page)
-        self.stacked_widget.addWidget(self.agent_design_page)
-        self.stacked_widget.addWidget(self.device_settings_page)
+        # Pages are built the first time they are shown
+        self.page_factories = {
+            "system_scan": _system_scan_page,
+            "agent_design": _agent_design_page,
+            "device_settings": lambda: _device_settings_page(self.settings_manager, self.auto_optimizer)
+        }
+        self.pages = {}
+        self._settings_manager = None
+        self._auto_optimizer = None
+        self.alert_event.connect(self.show_alert)
+        # Each access to .emit gives a new object; keep one so remove_listener matches it
+        self._alert_listener = self.alert_event.emit
+        # Alerts and auto-optimization run for the whole session, not only once the settings page is built
+        self.startup_probe.on_first_paint(lambda report: QTimer.singleShot(0, self.start_alerts))
+        self.active_page = None
         
         # Create navigation buttons
         self.nav_layout = QVBoxLayout()
@@ -55,9 +78,9 @@ class MainWindow(QMainWindow):
         self.nav_layout.addWidget(self.settings_button)
         
         # Connect buttons to page changes
-        self.scan_button.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.system_scan_page))
-        self.agent_button.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.agent_design_page))
-        self.settings_button.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.device_settings_page))
+        self.scan_button.clicked.connect(lambda: self.show_page("system_scan"))
+        self.agent_button.clicked.connect(lambda: self.show_page("agent_design"))
+        self.settings_button.clicked.connect(lambda: self.show_page("device_settings"))
         
         # Create main layout with navigation and pages
         main_layout = QHBoxLayout()
@@ -69,6 +92,116 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.stacked_widget)
         
         self.layout.addLayout(main_layout)
+        
+        self.show_page("system_scan")
+
+    @property
+    def settings_manager(self):
+        """Device settings shared by the window and the settings page, created on first use"""
+        if self._settings_manager is None:
+            from core.device_settings import DeviceSettings
+            from core.metrics_store import MetricsStore
+
+            try:
+                metrics_store = MetricsStore()
+            except Exception as e:
+                print(f"Metrics history disabled: {e}")
+                metrics_store = None
+            self._settings_manager = DeviceSettings(metrics_store=metrics_store)
+        return self._settings_manager
+
+    @property
+    def auto_optimizer(self):
+        """Switches performance mode from smoothed load, created on first use"""
+        if self._auto_optimizer is None:
+            from core.auto_optimizer import AutoOptimizer
+
+            self._auto_optimizer = AutoOptimizer(self.settings_manager)
+        return self._auto_optimizer
+
+    def start_alerts(self):
+        """Evaluate alert rules and auto-optimization on every background sample"""
+        settings = self.settings_manager
+        settings.alerts.remove_listener(self._alert_listener)
+        settings.alerts.add_listener(self._alert_listener)
+        settings.start_alerts()
+        self.auto_optimizer.start()
+
+    def show_alert(self, event):
+        """Show the rules that are currently firing in the status bar"""
+        active = self.settings_manager.alerts.active()
+        if active:
+            self.statusBar().showMessage("; ".join(
+                f"{i18n.t('alert', 'Alert')}: {rule.message}" for rule in active
+            ))
+        else:
+            self.statusBar().clearMessage()
+
+    @property
+    def system_scan_page(self):
+        return self.get_page("system_scan")
+
+    @property
+    def agent_design_page(self):
+        return self.get_page("agent_design")
+
+    @property
+    def device_settings_page(self):
+        return self.get_page("device_settings")
+
+    def get_page(self, name: str):
+        """Get a page, constructing it on first use"""
+        page = self.pages.get(name)
+        if page is None:
+            page = self.page_factories[name]()
+            self.pages[name] = page
+            self.stacked_widget.addWidget(page)
+        return page
+
+    def show_page(self, name: str):
+        """Switch to a page; only the visible page runs background work"""
+        page = self.get_page(name)
+        if page is self.active_page:
+            return
+        self._set_page_active(self.active_page, False)
+        self.active_page = page
+        self.stacked_widget.setCurrentWidget(page)
+        if not self.isMinimized():
+            self._set_page_active(page, True)
+
+    def closeEvent(self, event):
+        # Let built pages stop background work and flush what they buffered
+        for page in self.pages.values():
+            hook = getattr(page, "page_closed", None)
+            if hook is not None:
+                hook()
+        if self._auto_optimizer is not None:
+            self._auto_optimizer.stop()
+        if self._settings_manager is not None:
+            settings = self._settings_manager
+            settings.close()
+            settings.alerts.remove_listener(self._alert_listener)
+            # Write out samples buffered since the last flush
+            if settings.metrics_store is not None:
+                try:
+                    settings.metrics_store.close()
+                except Exception as e:
+                    print(f"Error closing metrics history: {e}")
+                settings.metrics_store = None
+        super().closeEvent(event)
+
+    def _set_page_active(self, page, active: bool):
+        if page is None:
+            return
+        hook = getattr(page, "page_activated" if active else "page_deactivated", None)
+        if hook is not None:
+            hook()
+
+    def changeEvent(self, event):
+        # Pause the visible page's timers while the window is minimized
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._set_page_active(self.active_page, not self.isMinimized())
+        super().changeEvent(event)
 
     def change_language(self, language: str):
         """Change the application language"""
@@ -83,7 +216,6 @@ class MainWindow(QMainWindow):
         self.agent_button.setText(i18n.t('agent_design', "Agent Design"))
         self.settings_button.setText(i18n.t('device_settings', "Device Settings"))
         
-        # Update pages
-        self.system_scan_page.update_translations()
-        self.agent_design_page.update_translations()
-        self.device_settings_page.update_translations()
+        # Update pages that have been built; the rest pick up the locale when created
+        for page in self.pages.values():
+            page.update_translations()
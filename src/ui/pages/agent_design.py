@@ -5,13 +5,15 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QLabel,
     QComboBox,
+    QCheckBox,
     QTextEdit,
     QScrollArea,
     QFrame,
     QFileDialog,
-    QMessageBox
+    QMessageBox,
+    QProgressBar
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from ..utils.styles import apply_style
 from ..utils.i18n import i18n
 from core.agent_designer import AgentDesigner
@@ -19,13 +21,40 @@ from core.system_scanner import SystemScanner
 import os
 import json
 
+class BatchWorker(QThread):
+    finished = pyqtSignal(object)
+    progress = pyqtSignal(int)
+
+    def __init__(self, manifest_path, output_dir):
+        super().__init__()
+        self.manifest_path = manifest_path
+        self.output_dir = output_dir
+
+    def run(self):
+        from core.batch_generator import BatchGenerator
+
+        try:
+            result = BatchGenerator(self.output_dir).run_manifest(
+                self.manifest_path,
+                progress=lambda done, total: self.progress.emit(int(done * 100 / total))
+            )
+        except Exception as e:
+            result = {"error": str(e)}
+        self.finished.emit(result)
+
 class AgentDesignPage(QWidget):
+    templates_changed = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.designer = AgentDesigner()
         self.scanner = SystemScanner()
         self.current_template = None
+        self.batch_worker = None
         self.init_ui()
+        # The registry reports edits from its watcher thread
+        self.templates_changed.connect(self.refresh_templates)
+        self.designer.registry.add_listener(self.templates_changed.emit)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -50,8 +79,11 @@ class AgentDesignPage(QWidget):
         self.template_combo.addItems(self.designer.get_templates().keys())
         self.template_combo.currentTextChanged.connect(self.update_template_info)
         
+        self.async_checkbox = QCheckBox(i18n.t('async_runtime', "Async runtime (concurrent requests)"))
+
         template_layout.addWidget(self.template_label)
         template_layout.addWidget(self.template_combo)
+        template_layout.addWidget(self.async_checkbox)
         template_layout.addStretch()
         layout.addLayout(template_layout)
 
@@ -75,13 +107,43 @@ class AgentDesignPage(QWidget):
         self.validate_button = QPushButton(i18n.t('validate_system', "Validate System"))
         self.validate_button.clicked.connect(self.validate_system)
         
+        self.batch_button = QPushButton(i18n.t('generate_from_manifest', "Generate from Manifest"))
+        self.batch_button.clicked.connect(self.generate_from_manifest)
+
         button_layout.addWidget(self.generate_button)
+        button_layout.addWidget(self.batch_button)
         button_layout.addWidget(self.validate_button)
         layout.addLayout(button_layout)
 
+        self.batch_progress = QProgressBar()
+        self.batch_progress.setRange(0, 100)
+        self.batch_progress.hide()
+        layout.addWidget(self.batch_progress)
+
         # Initial template info display
         self.update_template_info(self.template_combo.currentText())
 
+    def page_activated(self):
+        """Called by MainWindow when the page becomes visible"""
+        self.designer.registry.reload()
+        self.designer.registry.start_watching()
+
+    def page_deactivated(self):
+        """Called by MainWindow when the page is hidden or the window minimized"""
+        self.designer.registry.stop_watching()
+
+    def refresh_templates(self, changes=None):
+        """Reload the template list, keeping the current selection if it still exists"""
+        current = self.template_combo.currentText()
+        names = list(self.designer.get_templates())
+        self.template_combo.blockSignals(True)
+        self.template_combo.clear()
+        self.template_combo.addItems(names)
+        if current in names:
+            self.template_combo.setCurrentText(current)
+        self.template_combo.blockSignals(False)
+        self.update_template_info(self.template_combo.currentText())
+
     def update_template_info(self, template_name):
         # Clear previous info
         for i in reversed(range(self.info_layout.count())): 
@@ -150,9 +212,12 @@ class AgentDesignPage(QWidget):
 
         try:
             # Generate agent with basic customizations
+            customizations = {"name": "CustomAgent"}
+            if self.async_checkbox.isChecked():
+                customizations["runtime"] = "async"
             config = self.designer.create_agent_config(
                 self.template_combo.currentText(),
-                {"name": "CustomAgent"}
+                customizations
             )
             
             # Save the agent
@@ -181,6 +246,48 @@ class AgentDesignPage(QWidget):
                 f"{i18n.t('generation_failed', 'Failed to generate agent')}: {str(e)}"
             )
 
+    def generate_from_manifest(self):
+        manifest_path, _ = QFileDialog.getOpenFileName(
+            self, i18n.t('select_manifest', "Select Agent Manifest"), "",
+            "Manifest (*.yaml *.yml *.json)"
+        )
+        if not manifest_path:
+            return
+        output_dir = QFileDialog.getExistingDirectory(
+            self, i18n.t('select_output_dir', "Select Output Directory")
+        )
+        if not output_dir:
+            return
+
+        self.batch_button.setEnabled(False)
+        self.batch_progress.setValue(0)
+        self.batch_progress.show()
+        self.batch_worker = BatchWorker(manifest_path, output_dir)
+        self.batch_worker.progress.connect(self.batch_progress.setValue)
+        self.batch_worker.finished.connect(self.handle_batch_complete)
+        self.batch_worker.start()
+
+    def handle_batch_complete(self, result):
+        self.batch_button.setEnabled(True)
+        self.batch_progress.hide()
+        if "error" in result:
+            QMessageBox.critical(
+                self,
+                i18n.t('error', "Error"),
+                f"{i18n.t('generation_failed', 'Failed to generate agent')}: {result['error']}"
+            )
+            return
+        summary = i18n.t(
+            'batch_generated',
+            "{total} agents: {written} written, {unchanged} unchanged, {failed} failed"
+        ).format(total=result["total"], written=result["written"],
+                 unchanged=result["unchanged"], failed=len(result["failed"]))
+        details = "\n".join(f"- {f['file_name']}: {f['error']}" for f in result["failed"][:20])
+        if result["failed"]:
+            QMessageBox.warning(self, i18n.t('error', "Error"), f"{summary}\n\n{details}")
+        else:
+            QMessageBox.information(self, i18n.t('success', "Success"), summary)
+
     def validate_system(self):
         if not self.current_template:
             QMessageBox.warning(
@@ -190,8 +297,8 @@ class AgentDesignPage(QWidget):
             )
             return
 
-        # Get system info
-        system_info = self.scanner.scan_system()
+        # Reuse the latest scan if it is still fresh
+        system_info = self.scanner.get_snapshot()
         
         # Validate compatibility
         issues = self.designer.validate_system_compatibility(
@@ -217,7 +324,9 @@ class AgentDesignPage(QWidget):
         """Update all translatable text in the page"""
         self.title_label.setText(i18n.t('agent_design', "AI Agent Designer"))
         self.template_label.setText(i18n.t('select_template', "Select Template:"))
+        self.async_checkbox.setText(i18n.t('async_runtime', "Async runtime (concurrent requests)"))
         self.generate_button.setText(i18n.t('generate_agent', "Generate Agent"))
+        self.batch_button.setText(i18n.t('generate_from_manifest', "Generate from Manifest"))
         self.validate_button.setText(i18n.t('validate_system', "Validate System"))
         
         # Update template info if exists
@@ -12,19 +12,46 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QMessageBox
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from ..utils.styles import apply_style
 from ..utils.i18n import i18n
+from ..utils.bound_view import BoundLabelPanel
+from ..widgets.sparkline import SparklineChart, format_rate
+from ..widgets.trace_view import TraceDialog
+from core.auto_optimizer import AutoOptimizer
 from core.device_settings import DeviceSettings
 import json
+import psutil
+
+# Live charts sample once per second and keep ten minutes of history
+CHART_INTERVAL_MS = 1000
+CHART_HISTORY = 600
+
 
 class DeviceSettingsPage(QWidget):
-    def __init__(self):
+    # Alert events arrive on the sampler thread; the signal hands them to the GUI thread
+    alert_event = pyqtSignal(object)
+    mode_switched = pyqtSignal(object)
+
+    def __init__(self, settings_manager: DeviceSettings, auto_optimizer: AutoOptimizer):
+        """Both are owned by the main window, which runs the alerts and the optimizer"""
         super().__init__()
-        self.settings_manager = DeviceSettings()
+        self.settings_manager = settings_manager
+        self.auto_optimizer = auto_optimizer
         self.monitoring_timer = QTimer()
         self.monitoring_timer.timeout.connect(self.update_system_health)
+        self.chart_timer = QTimer()
+        self.chart_timer.setInterval(CHART_INTERVAL_MS)
+        self.chart_timer.timeout.connect(self.update_charts)
         self.init_ui()
+        self.alert_event.connect(self.show_alert)
+        # Each access to .emit gives a new object; keep one so remove_listener matches it
+        self._alert_listener = self.alert_event.emit
+        self.settings_manager.alerts.add_listener(self._alert_listener)
+        self.show_alert(None)
+        self.mode_switched.connect(self.show_mode_switch)
+        self._mode_listener = self.mode_switched.emit
+        self.auto_optimizer.add_listener(self._mode_listener)
         
     def init_ui(self):
         layout = QVBoxLayout()
@@ -99,6 +126,18 @@ class DeviceSettingsPage(QWidget):
         
         self.health_widget = QWidget()
         self.health_info_layout = QVBoxLayout(self.health_widget)
+        self.health_panel = BoundLabelPanel(self.health_info_layout)
+        self.alert_label = QLabel()
+        self.alert_label.setObjectName("alert-label")
+        self.alert_label.setWordWrap(True)
+        apply_style(self.alert_label, """
+            QLabel#alert-label {
+                color: #C62828;
+                font-weight: bold;
+            }
+        """)
+        self.alert_label.hide()
+        health_layout.addWidget(self.alert_label)
         
         scroll.setWidget(self.health_widget)
         health_layout.addWidget(scroll)
@@ -106,6 +145,20 @@ class DeviceSettingsPage(QWidget):
         health_group.setLayout(health_layout)
         layout.addWidget(health_group)
 
+        # Live Charts Section
+        self.charts_group = QGroupBox(i18n.t('live_charts', "Live Charts"))
+        charts_layout = QVBoxLayout()
+        cores = len(self.settings_manager.cpu_sampler.per_core())
+        self.cpu_chart = SparklineChart(i18n.t('cpu_usage_per_core', "CPU Usage (per core)"), channels=cores, capacity=CHART_HISTORY)
+        self.memory_chart = SparklineChart(i18n.t('memory_usage', "Memory Usage"), capacity=CHART_HISTORY)
+        self.disk_chart = SparklineChart(i18n.t('disk_io', "Disk I/O"), channels=2, capacity=CHART_HISTORY, y_max=None, formatter=format_rate)
+        self.network_chart = SparklineChart(i18n.t('network_io', "Network I/O"), channels=2, capacity=CHART_HISTORY, y_max=None, formatter=format_rate)
+        for chart in (self.cpu_chart, self.memory_chart, self.disk_chart, self.network_chart):
+            charts_layout.addWidget(chart)
+        self.charts_group.setLayout(charts_layout)
+        layout.addWidget(self.charts_group)
+        self.prefill_cpu_chart()
+
         # Action Buttons
         button_layout = QHBoxLayout()
         
@@ -121,17 +174,18 @@ class DeviceSettingsPage(QWidget):
         button_layout.addWidget(self.save_button)
         button_layout.addWidget(self.scan_button)
         button_layout.addWidget(self.optimize_button)
+
+        self.trace_button = QPushButton(i18n.t('performance_trace', "Performance Trace"))
+        self.trace_button.clicked.connect(self.show_trace)
+        button_layout.addWidget(self.trace_button)
         
         layout.addLayout(button_layout)
 
-        # Load current settings
+        # Load current settings; monitoring starts when the page is shown
         self.load_current_settings()
-        
-        # Start monitoring
-        self.start_monitoring()
 
     def load_current_settings(self):
-        settings = self.settings_manager.get_current_settings()
+        settings = self.settings_manager.get_runtime_settings()
         
         self.mode_combo.setCurrentText(settings["performance_mode"])
         self.interval_spin.setValue(settings["monitoring_interval"])
@@ -178,44 +232,69 @@ class DeviceSettingsPage(QWidget):
             )
 
     def start_monitoring(self):
-        interval = self.settings_manager.get_current_settings()["monitoring_interval"]
+        interval = self.settings_manager.get_runtime_settings()["monitoring_interval"]
         self.monitoring_timer.start(interval * 1000)  # Convert to milliseconds
         self.update_system_health()
 
+    def stop_monitoring(self):
+        self.monitoring_timer.stop()
+        self.chart_timer.stop()
+
+    def page_activated(self):
+        """Called by MainWindow when the page becomes visible"""
+        self.start_monitoring()
+        self.chart_timer.start()
+
+    def page_deactivated(self):
+        """Called by MainWindow when the page is hidden or the window minimized"""
+        self.stop_monitoring()
+
+    def page_closed(self):
+        """Called by MainWindow when the window closes"""
+        self.stop_monitoring()
+        self.auto_optimizer.remove_listener(self._mode_listener)
+        self.settings_manager.alerts.remove_listener(self._alert_listener)
+
+    def prefill_cpu_chart(self):
+        """Seed the CPU chart from the sampler's history buffer"""
+        for _, per_core in self.settings_manager.cpu_sampler.history(CHART_HISTORY):
+            self.cpu_chart.buffer.append(per_core)
+
+    def update_charts(self):
+        self.cpu_chart.append(self.settings_manager.cpu_sampler.per_core())
+        self.memory_chart.append((psutil.virtual_memory().percent,))
+        totals = self.settings_manager.io_rates.totals()
+        disk, network = totals["disk"], totals["network"]
+        self.disk_chart.append((disk.get("read_bytes_per_sec", 0.0), disk.get("write_bytes_per_sec", 0.0)))
+        self.network_chart.append((network.get("bytes_recv_per_sec", 0.0), network.get("bytes_sent_per_sec", 0.0)))
+
     def update_monitoring_interval(self, value):
         self.monitoring_timer.setInterval(value * 1000)
 
     def update_system_health(self):
-        # Clear previous health info
-        for i in reversed(range(self.health_info_layout.count())): 
-            self.health_info_layout.itemAt(i).widget().setParent(None)
-
         # Get current health status
         health_report = self.settings_manager.get_system_health_report()
         
-        # Display memory usage
-        memory_label = QLabel(
-            f"{i18n.t('memory_usage', 'Memory Usage')}: {health_report['memory_usage']['percent']}%"
-        )
-        self.health_info_layout.addWidget(memory_label)
-        
-        # Display CPU usage
-        cpu_label = QLabel(
-            f"{i18n.t('cpu_usage', 'CPU Usage')}: {health_report['cpu_usage']['percent']}%"
-        )
-        self.health_info_layout.addWidget(cpu_label)
-        
-        # Display disk usage
-        disk_label = QLabel(
-            f"{i18n.t('disk_usage', 'Disk Usage')}: {health_report['disk_usage']['percent']}%"
-        )
-        self.health_info_layout.addWidget(disk_label)
-        
-        # Display performance mode
-        mode_label = QLabel(
-            f"{i18n.t('current_mode', 'Current Mode')}: {health_report['performance_mode']}"
-        )
-        self.health_info_layout.addWidget(mode_label)
+        # Update the persistent labels; unchanged values are not touched
+        self.health_panel.update((
+            ("memory", f"{i18n.t('memory_usage', 'Memory Usage')}: {health_report['memory_usage']['percent']}%"),
+            ("cpu", f"{i18n.t('cpu_usage', 'CPU Usage')}: {health_report['cpu_usage']['percent']}%"),
+            ("disk", f"{i18n.t('disk_usage', 'Disk Usage')}: {health_report['disk_usage']['percent']}%"),
+            ("mode", f"{i18n.t('current_mode', 'Current Mode')}: {health_report['performance_mode']}")
+        ))
+
+    def show_alert(self, event):
+        """List the rules that are currently firing"""
+        active = self.settings_manager.alerts.active()
+        if not active:
+            self.alert_label.hide()
+            return
+        lines = [
+            f"{i18n.t('alert', 'Alert')}: {rule.message} ({rule.last_value:.1f})"
+            for rule in active
+        ]
+        self.alert_label.setText("\n".join(lines))
+        self.alert_label.show()
 
     def run_health_check(self):
         # Get optimization suggestions
@@ -236,27 +315,24 @@ class DeviceSettingsPage(QWidget):
         )
 
     def optimize_system(self):
-        current_mode = self.mode_combo.currentText()
-        
-        # Apply optimization based on current health status
-        health_report = self.settings_manager.get_system_health_report()
-        
-        if health_report['cpu_usage']['percent'] > 80 or health_report['memory_usage']['percent'] > 80:
-            self.settings_manager.apply_optimization('performance')
-            self.mode_combo.setCurrentText('performance')
-        elif health_report['cpu_usage']['percent'] < 20 and health_report['memory_usage']['percent'] < 40:
-            self.settings_manager.apply_optimization('power_save')
-            self.mode_combo.setCurrentText('power_save')
-        else:
-            self.settings_manager.apply_optimization('balanced')
-            self.mode_combo.setCurrentText('balanced')
-            
+        # Decide from the smoothed load rather than a single sample
+        self.auto_optimizer.optimize_now()
         QMessageBox.information(
             self,
             i18n.t('optimization_complete', "Optimization Complete"),
             i18n.t('system_optimized', "System has been optimized based on current usage patterns")
         )
 
+    def show_trace(self):
+        TraceDialog(self).exec()
+
+    def show_mode_switch(self, decision):
+        """Reflect a mode chosen by the optimizer without re-applying it"""
+        self.mode_combo.blockSignals(True)
+        self.mode_combo.setCurrentText(decision["to"])
+        self.mode_combo.blockSignals(False)
+        self.interval_spin.setValue(self.settings_manager.get_runtime_settings()["monitoring_interval"])
+
     def update_translations(self):
         """Update all translatable text in the page"""
         self.title_label.setText(i18n.t('settings_monitoring', "Device Settings & Monitoring"))
@@ -269,4 +345,11 @@ class DeviceSettingsPage(QWidget):
         self.save_button.setText(i18n.t('save_settings', "Save Settings"))
         self.scan_button.setText(i18n.t('run_health_check', "Run Health Check"))
         self.optimize_button.setText(i18n.t('optimize_system', "Optimize System"))
-        self.update_system_health()
+        self.trace_button.setText(i18n.t('performance_trace', "Performance Trace"))
+        self.charts_group.setTitle(i18n.t('live_charts', "Live Charts"))
+        self.cpu_chart.set_title(i18n.t('cpu_usage_per_core', "CPU Usage (per core)"))
+        self.memory_chart.set_title(i18n.t('memory_usage', "Memory Usage"))
+        self.disk_chart.set_title(i18n.t('disk_io', "Disk I/O"))
+        self.network_chart.set_title(i18n.t('network_io', "Network I/O"))
+        if self.monitoring_timer.isActive():
+            self.update_system_health()
@@ -4,31 +4,51 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QLabel,
     QProgressBar,
-    QTextEdit,
     QScrollArea,
     QFrame
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from ..utils.styles import apply_style
 from ..utils.i18n import i18n
+from ..utils.bound_view import BoundSectionPanel
 from core.system_scanner import SystemScanner
-import json
 
 class ScanWorker(QThread):
-    finished = pyqtSignal(dict)
+    finished = pyqtSignal(object)
     progress = pyqtSignal(int)
-    
+    section_ready = pyqtSignal(str, object)
+
+    def __init__(self, scanner: SystemScanner):
+        super().__init__()
+        self.scanner = scanner
+
     def run(self):
-        scanner = SystemScanner()
-        self.progress.emit(20)
-        result = scanner.scan_system()
+        result = self.scanner.scan_system(on_section=self.handle_section)
         self.progress.emit(100)
         self.finished.emit(result)
 
+    def handle_section(self, result, done, total):
+        self.section_ready.emit(result.name, result.section())
+        self.progress.emit(int(done * 100 / total))
+
 class SystemScanPage(QWidget):
+    # Result sections in display order: name -> (translation key, default title)
+    SECTION_ORDER = {
+        "system_info": ('system_info', "System Information"),
+        "hardware_info": ('hardware_info', "Hardware Information"),
+        "performance_metrics": ('performance_metrics', "Performance Metrics"),
+        "python_environment": ('python_env', "Python Environment"),
+        "scan_errors": ('scan_errors', "Scan Errors"),
+        "recommendations": ('recommendations', "Recommendations"),
+        "ai_recommendations": ('ai_recommendations', "AI Agent Recommendations"),
+    }
+    # Sections delivered by the scanner as they are collected
+    SCAN_SECTIONS = ("system_info", "hardware_info", "performance_metrics", "python_environment")
+
     def __init__(self):
         super().__init__()
         self.scanner = SystemScanner()
+        self.rendered_sections = []
         self.init_ui()
         self.scan_worker = None
 
@@ -68,6 +88,7 @@ class SystemScanPage(QWidget):
         
         self.results_widget = QWidget()
         self.results_layout = QVBoxLayout(self.results_widget)
+        self.results_panel = BoundSectionPanel(self.results_layout, list(self.SECTION_ORDER))
         
         scroll.setWidget(self.results_widget)
         layout.addWidget(scroll)
@@ -80,12 +101,12 @@ class SystemScanPage(QWidget):
         self.progress_bar.show()
         self.progress_bar.setValue(0)
         
-        # Clear previous results
-        for i in reversed(range(self.results_layout.count())): 
-            self.results_layout.itemAt(i).widget().setParent(None)
+        # Previous results stay on screen and are updated in place
+        self.rendered_sections = []
 
         # Create and start worker thread
-        self.scan_worker = ScanWorker()
+        self.scan_worker = ScanWorker(self.scanner)
+        self.scan_worker.section_ready.connect(self.display_section)
         self.scan_worker.finished.connect(self.handle_scan_complete)
         self.scan_worker.progress.connect(self.progress_bar.setValue)
         self.scan_worker.start()
@@ -94,71 +115,60 @@ class SystemScanPage(QWidget):
         self.scan_button.setEnabled(True)
         self.display_results(results)
 
+    def display_section(self, name, data):
+        """Render one scan section as soon as the worker delivers it"""
+        if name not in self.SCAN_SECTIONS:
+            return
+        if name == "python_environment" and "error" not in data:
+            data = {
+                i18n.t('python_path', "Python Path"): data["python_path"],
+                i18n.t('python_version', "Python Version"): data["python_version"],
+                i18n.t('installed_packages', "Installed Packages"): f"{len(data['pip_packages'])} {i18n.t('packages_installed', 'packages installed')}"
+            }
+        elif name == "hardware_info" and "error" not in data:
+            data = self.format_hardware_info(data)
+        elif name == "performance_metrics" and "error" not in data:
+            data = self.format_performance_metrics(data)
+        self.show_section(name, data)
+
+    def show_section(self, name, data):
+        title_key, title = self.SECTION_ORDER[name]
+        self.results_panel.set_section(name, i18n.t(title_key, title), data)
+        self.rendered_sections.append(name)
+
     def display_results(self, results):
-        # System Info Section
-        self.add_section(i18n.t('system_info', "System Information"), results["system_info"])
+        # Sections normally arrive through display_section while scanning
+        for name in self.SCAN_SECTIONS:
+            if name in results and name not in self.rendered_sections:
+                self.display_section(name, results[name])
         
-        # Hardware Info Section
-        hardware = self.format_hardware_info(results["hardware_info"])
-        self.add_section(i18n.t('hardware_info', "Hardware Information"), hardware)
-        
-        # Performance Metrics Section
-        metrics = self.format_performance_metrics(results["performance_metrics"])
-        self.add_section(i18n.t('performance_metrics', "Performance Metrics"), metrics)
-        
-        # Python Environment Section
-        env_info = results["python_environment"]
-        self.add_section(i18n.t('python_env', "Python Environment"), {
-            i18n.t('python_path', "Python Path"): env_info["python_path"],
-            i18n.t('python_version', "Python Version"): env_info["python_version"],
-            i18n.t('installed_packages', "Installed Packages"): f"{len(env_info['pip_packages'])} {i18n.t('packages_installed', 'packages installed')}"
-        })
+        # Collectors that failed or timed out
+        failed = getattr(results, "failed_sections", lambda: {})()
+        if failed:
+            self.show_section("scan_errors", {
+                name: info["error"] for name, info in failed.items()
+            })
         
         # Recommendations
-        recommendations = self.scanner.get_hardware_recommendations()
+        recommendations = self.scanner.get_hardware_recommendations(results)
         if recommendations:
-            self.add_section(i18n.t('recommendations', "Recommendations"), {
+            self.show_section("recommendations", {
                 f"{i18n.t('recommendation', 'Recommendation')} {i+1}": rec 
                 for i, rec in enumerate(recommendations)
             })
         
         # AI Agent Recommendations
-        ai_recommendations = self.scanner.get_ai_agent_recommendations()
+        ai_recommendations = self.scanner.get_ai_agent_recommendations(results)
         if ai_recommendations:
-            self.add_section(i18n.t('ai_recommendations', "AI Agent Recommendations"), {
+            self.show_section("ai_recommendations", {
                 f"{i18n.t('recommendation', 'Recommendation')} {i+1}": rec 
                 for i, rec in enumerate(ai_recommendations)
             })
 
-    def add_section(self, title, data):
-        # Section Title
-        section_title = QLabel(title)
-        section_title.setObjectName("section-title")
-        apply_style(section_title, """
-            QLabel#section-title {
-                font-size: 18px;
-                font-weight: bold;
-                margin-top: 15px;
-                margin-bottom: 10px;
-            }
-        """)
-        self.results_layout.addWidget(section_title)
-        
-        # Section Content
-        content = QTextEdit()
-        content.setReadOnly(True)
-        content.setMaximumHeight(200)
-        
-        # Format the data
-        if isinstance(data, dict):
-            formatted_data = json.dumps(data, indent=2)
-        elif isinstance(data, list):
-            formatted_data = "\n".join(f"- {item}" for item in data)
-        else:
-            formatted_data = str(data)
-            
-        content.setText(formatted_data)
-        self.results_layout.addWidget(content)
+        # Drop sections left over from a previous scan
+        for name in self.results_panel.visible_sections():
+            if name not in self.rendered_sections:
+                self.results_panel.hide_section(name)
 
     def format_hardware_info(self, info):
         return {
@@ -172,13 +182,22 @@ class SystemScanPage(QWidget):
         }
 
     def format_performance_metrics(self, metrics):
+        rates = metrics.get('io_rates', {})
+        disk_rate = rates.get('disk', {}).get('total', {})
+        net_rate = rates.get('network', {}).get('total', {})
         return {
-            i18n.t('cpu_usage_per_core', "CPU Usage (per core)"): f"{metrics['cpu_usage']}%",
+            i18n.t('cpu_usage_per_core', "CPU Usage (per core)"): f"{list(metrics['cpu_usage'])}%",
             i18n.t('memory_usage', "Memory Usage"): f"{metrics['memory_usage']}%",
             i18n.t('disk_io', "Disk I/O"): metrics['disk_io'] if metrics['disk_io'] else "N/A",
+            i18n.t('disk_throughput', "Disk Throughput"): {
+                i18n.t('read', "Read"): f"{disk_rate.get('read_bytes_per_sec', 0) / 1024:.1f}KB/s",
+                i18n.t('write', "Write"): f"{disk_rate.get('write_bytes_per_sec', 0) / 1024:.1f}KB/s"
+            },
             i18n.t('network_io', "Network I/O"): {
                 i18n.t('bytes_sent', "Bytes Sent"): f"{metrics['network_io']['bytes_sent'] / (1024**2):.2f}MB",
-                i18n.t('bytes_received', "Bytes Received"): f"{metrics['network_io']['bytes_recv'] / (1024**2):.2f}MB"
+                i18n.t('bytes_received', "Bytes Received"): f"{metrics['network_io']['bytes_recv'] / (1024**2):.2f}MB",
+                i18n.t('send_rate', "Send Rate"): f"{net_rate.get('bytes_sent_per_sec', 0) / 1024:.1f}KB/s",
+                i18n.t('receive_rate', "Receive Rate"): f"{net_rate.get('bytes_recv_per_sec', 0) / 1024:.1f}KB/s"
             }
         }
 
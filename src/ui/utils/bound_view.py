@@ -0,0 +1,125 @@
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from PyQt6.QtWidgets import QLabel, QTextEdit, QVBoxLayout
+from .styles import apply_style
+
+SECTION_TITLE_STYLE = """
+    QLabel#section-title {
+        font-size: 18px;
+        font-weight: bold;
+        margin-top: 15px;
+        margin-bottom: 10px;
+    }
+"""
+
+
+def format_section_data(data: Any) -> str:
+    """Render section data the way the result panels always have"""
+    if isinstance(data, dict):
+        return json.dumps(data, indent=2)
+    if isinstance(data, (list, tuple)):
+        return "\n".join(f"- {item}" for item in data)
+    return str(data)
+
+
+class BoundLabelPanel:
+    """Persistent label per key; refreshing only touches labels whose text changed"""
+
+    def __init__(self, layout: QVBoxLayout):
+        self.layout = layout
+        self._labels: Dict[str, QLabel] = {}
+        self._texts: Dict[str, str] = {}
+
+    def update(self, values: Iterable[Tuple[str, str]]) -> int:
+        """Apply (key, text) pairs in display order; returns the number of labels changed"""
+        changed = 0
+        seen = set()
+        for key, text in values:
+            seen.add(key)
+            label = self._labels.get(key)
+            if label is None:
+                label = QLabel(text)
+                self._labels[key] = label
+                self._texts[key] = text
+                self.layout.addWidget(label)
+                changed += 1
+            elif self._texts[key] != text:
+                label.setText(text)
+                self._texts[key] = text
+                changed += 1
+            if label.isHidden():
+                label.show()
+        for key, label in self._labels.items():
+            if key not in seen and not label.isHidden():
+                label.hide()
+        return changed
+
+    def label(self, key: str) -> Optional[QLabel]:
+        return self._labels.get(key)
+
+
+class BoundSectionPanel:
+    """Persistent title + text box per section, kept in a fixed order"""
+
+    def __init__(self, layout: QVBoxLayout, order: List[str], max_height: int = 200):
+        self.layout = layout
+        self.order = list(order)
+        self.max_height = max_height
+        self._widgets: Dict[str, Tuple[QLabel, QTextEdit]] = {}
+        self._texts: Dict[str, Tuple[str, str]] = {}
+
+    def _index_for(self, key: str) -> int:
+        if key not in self.order:
+            self.order.append(key)
+        position = self.order.index(key)
+        built_before = sum(1 for other in self.order[:position] if other in self._widgets)
+        return built_before * 2
+
+    def set_section(self, key: str, title: str, data: Any) -> bool:
+        """Show a section, creating it on first use; returns True if anything changed"""
+        content = format_section_data(data)
+        widgets = self._widgets.get(key)
+        if widgets is None:
+            index = self._index_for(key)
+            title_label = QLabel(title)
+            title_label.setObjectName("section-title")
+            apply_style(title_label, SECTION_TITLE_STYLE)
+            text_box = QTextEdit()
+            text_box.setReadOnly(True)
+            text_box.setMaximumHeight(self.max_height)
+            text_box.setText(content)
+            self.layout.insertWidget(index, title_label)
+            self.layout.insertWidget(index + 1, text_box)
+            self._widgets[key] = (title_label, text_box)
+            self._texts[key] = (title, content)
+            return True
+
+        title_label, text_box = widgets
+        changed = False
+        old_title, old_content = self._texts[key]
+        if old_title != title:
+            title_label.setText(title)
+            changed = True
+        if old_content != content:
+            text_box.setText(content)
+            changed = True
+        self._texts[key] = (title, content)
+        if title_label.isHidden():
+            title_label.show()
+            text_box.show()
+            changed = True
+        return changed
+
+    def hide_section(self, key: str) -> None:
+        widgets = self._widgets.get(key)
+        if widgets is not None:
+            for widget in widgets:
+                widget.hide()
+
+    def hide_all(self) -> None:
+        for key in self._widgets:
+            self.hide_section(key)
+
+    def visible_sections(self) -> List[str]:
+        return [key for key in self.order
+                if key in self._widgets and not self._widgets[key][0].isHidden()]
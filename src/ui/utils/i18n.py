@@ -49,7 +49,21 @@ class I18n:
             'agent_generated': '代理已生成',
             'generation_failed': '代理生成失敗',
             'validation_passed': '系統符合需求',
-            'validation_failed': '系統不符合需求'
+            'validation_failed': '系統不符合需求',
+            'scan_errors': '掃描錯誤',
+            'live_charts': '即時圖表',
+            'alert': '警報',
+            'performance_trace': '效能追蹤',
+            'enable_tracing': '記錄耗時',
+            'operation': '操作',
+            'refresh': '重新整理',
+            'export_trace': '匯出 Chrome 追蹤...',
+            'reset': '重設',
+            'trace_exported': '已匯出 {count} 個事件',
+            'generate_from_manifest': '從清單批次生成',
+            'select_manifest': '選擇代理清單',
+            'async_runtime': '非同步執行（並行處理請求）',
+            'batch_generated': '{total} 個代理：已寫入 {written} 個，未變更 {unchanged} 個，失敗 {failed} 個'
         }
     }
 
@@ -0,0 +1,57 @@
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional
+from PyQt6.QtCore import QEvent, QObject
+
+# Default cold-start budget from main.py import to the first painted frame
+DEFAULT_TARGET_MS = 1000.0
+
+_process_start = time.perf_counter()
+
+
+def mark_process_start(timestamp: Optional[float] = None) -> None:
+    """Record when startup began (call first thing in main.py)"""
+    global _process_start
+    _process_start = time.perf_counter() if timestamp is None else timestamp
+
+
+def startup_target_ms() -> float:
+    """Startup budget in ms, overridable with AI_AGENT_STARTUP_TARGET_MS"""
+    try:
+        return float(os.environ.get("AI_AGENT_STARTUP_TARGET_MS", DEFAULT_TARGET_MS))
+    except ValueError:
+        return DEFAULT_TARGET_MS
+
+
+class FirstPaintProbe(QObject):
+    """Event filter that measures time from process start to the window's first paint"""
+
+    def __init__(self, window, target_ms: Optional[float] = None):
+        super().__init__(window)
+        self.window = window
+        self.target_ms = startup_target_ms() if target_ms is None else target_ms
+        self.elapsed_ms: Optional[float] = None
+        self._callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        window.installEventFilter(self)
+
+    def on_first_paint(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        self._callbacks.append(callback)
+
+    def eventFilter(self, obj, event) -> bool:
+        if obj is self.window and event.type() == QEvent.Type.Paint and self.elapsed_ms is None:
+            self.elapsed_ms = (time.perf_counter() - _process_start) * 1000
+            self.window.removeEventFilter(self)
+            report = self.report()
+            if not report["within_target"] or os.environ.get("AI_AGENT_STARTUP_TRACE"):
+                print(f"Startup: first paint after {report['first_paint_ms']:.0f} ms "
+                      f"(target {report['target_ms']:.0f} ms)")
+            for callback in self._callbacks:
+                callback(report)
+        return False
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "first_paint_ms": self.elapsed_ms,
+            "target_ms": self.target_ms,
+            "within_target": self.elapsed_ms is not None and self.elapsed_ms <= self.target_ms
+        }
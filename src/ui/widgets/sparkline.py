@@ -0,0 +1,168 @@
+from typing import Callable, List, Optional, Sequence
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtCore import Qt, QRect, QPointF
+from PyQt6.QtGui import QColor, QPainter, QPen, QPixmap, QPolygonF
+from core.ring_buffer import RingBuffer
+
+BACKGROUND = QColor("#FFFFFF")
+GRID = QColor("#E0E0E0")
+TEXT = QColor("#404040")
+
+
+def format_percent(values: List[float]) -> str:
+    """Average of many channels (per-core CPU), otherwise each value"""
+    if len(values) > 4:
+        return f"{sum(values) / len(values):.1f}% avg"
+    return " / ".join(f"{value:.1f}%" for value in values)
+
+
+def format_rate(values: List[float]) -> str:
+    """Human readable bytes per second for each channel"""
+    parts = []
+    for value in values:
+        for unit in ("B/s", "KB/s", "MB/s", "GB/s"):
+            if value < 1024 or unit == "GB/s":
+                parts.append(f"{value:.1f} {unit}")
+                break
+            value /= 1024
+    return " / ".join(parts)
+
+
+def channel_colors(count: int) -> List[QColor]:
+    """Distinct colors; many channels (per-core CPU) get translucent hues"""
+    alpha = 255 if count <= 4 else 150
+    return [QColor.fromHsv(int(360 * i / max(count, 1)) % 360, 200, 200, alpha) for i in range(count)]
+
+
+class SparklineChart(QWidget):
+    """Scrolling line chart backed by a RingBuffer.
+
+    The plot lives in an off-screen pixmap. Each new sample scrolls the
+    pixmap and draws only the newest segment per channel, and the widget
+    repaints only that strip. A full redraw happens only on resize or when
+    the y-axis has to grow.
+    """
+
+    def __init__(self, title: str, channels: int = 1, capacity: int = 600,
+                 y_max: Optional[float] = 100.0,
+                 formatter: Callable[[List[float]], str] = format_percent, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.formatter = formatter
+        self.buffer = RingBuffer(capacity, channels)
+        self.auto_scale = y_max is None
+        self.y_max = y_max or 1.0
+        self.colors = channel_colors(channels)
+        self._pens = [QPen(color, 1) for color in self.colors]
+        self._pixmap: Optional[QPixmap] = None
+        self._drawn_total = 0
+        self.setMinimumHeight(70)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def set_title(self, title: str) -> None:
+        self.title = title
+        self._full_redraw()
+
+    def _step(self) -> float:
+        return max(self.width() - 1, 1) / max(self.buffer.capacity - 1, 1)
+
+    def _x(self, sample_index: int, newest_index: int) -> int:
+        # Positions are rounded from the absolute sample index so that
+        # scrolling by whole pixels never accumulates drift
+        step = self._step()
+        return self.width() - 1 - (round(newest_index * step) - round(sample_index * step))
+
+    def _y(self, value: float) -> float:
+        height = self.height() - 1
+        return height - min(max(value / self.y_max, 0.0), 1.0) * (height - 14)
+
+    def append(self, values: Sequence[float]) -> None:
+        """Add one sample (one value per channel) and draw just the new segment"""
+        self.buffer.append(values)
+        if self.auto_scale:
+            peak = max(values) if len(values) else 0.0
+            if peak > self.y_max:
+                self.y_max = peak * 1.5
+                self._full_redraw()
+                return
+            # Occasionally let the axis shrink once old peaks scroll out
+            if self.buffer.total % 60 == 0 and self.buffer.max() * 4.5 < self.y_max:
+                self._full_redraw()
+                return
+        if self._pixmap is None or self._pixmap.size() != self.size() or len(self.buffer) < 2:
+            self._full_redraw()
+            return
+
+        newest = self.buffer.total - 1
+        shift = round(newest * self._step()) - round(self._drawn_total * self._step())
+        self._drawn_total = newest
+        width = self.width()
+        if shift > 0:
+            self._pixmap.scroll(-shift, 0, self._pixmap.rect())
+        strip_left = max(self._x(newest - 1, newest) - 1, 0)
+        painter = QPainter(self._pixmap)
+        painter.fillRect(QRect(strip_left + 1, 0, width - strip_left, self.height()), BACKGROUND)
+        painter.setPen(GRID)
+        painter.drawLine(strip_left, self.height() - 1, width, self.height() - 1)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        x0 = float(self._x(newest - 1, newest))
+        x1 = float(width - 1)
+        for channel, pen in enumerate(self._pens):
+            painter.setPen(pen)
+            painter.drawLine(
+                QPointF(x0, self._y(self.buffer.value(1, channel))),
+                QPointF(x1, self._y(self.buffer.value(0, channel)))
+            )
+        self._draw_label(painter)
+        painter.end()
+        if shift > 0:
+            self.update()  # contents moved; blit the whole pixmap
+        else:
+            self.update(QRect(strip_left, 0, width - strip_left, self.height()))
+            self.update(QRect(0, 0, width, 13))
+
+    def _draw_label(self, painter: QPainter) -> None:
+        latest = self.buffer.latest()
+        text = f"{self.title}: {self.formatter(latest)}" if latest else self.title
+        painter.fillRect(QRect(0, 0, self.width(), 13), BACKGROUND)
+        painter.setPen(TEXT)
+        painter.drawText(QRect(2, 0, self.width() - 4, 13), Qt.AlignmentFlag.AlignLeft, text)
+
+    def _full_redraw(self) -> None:
+        if self.width() <= 1 or self.height() <= 1:
+            return
+        if self.auto_scale:
+            self.y_max = max(self.buffer.max() * 1.5, 1.0)
+        self._pixmap = QPixmap(self.size())
+        self._pixmap.fill(BACKGROUND)
+        painter = QPainter(self._pixmap)
+        painter.setPen(GRID)
+        painter.drawLine(0, self.height() - 1, self.width(), self.height() - 1)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        size = len(self.buffer)
+        newest = self.buffer.total - 1
+        if size >= 2:
+            for channel, pen in enumerate(self._pens):
+                painter.setPen(pen)
+                points = [
+                    QPointF(self._x(newest - age, newest), self._y(self.buffer.value(age, channel)))
+                    for age in range(size - 1, -1, -1)
+                ]
+                painter.drawPolyline(QPolygonF(points))
+        self._draw_label(painter)
+        painter.end()
+        self._drawn_total = max(newest, 0)
+        self.update()
+
+    def resizeEvent(self, event):
+        self._full_redraw()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._pixmap is None:
+            painter.fillRect(event.rect(), BACKGROUND)
+        else:
+            painter.drawPixmap(event.rect(), self._pixmap, event.rect())
+        painter.end()
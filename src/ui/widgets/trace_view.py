@@ -0,0 +1,112 @@
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QMessageBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout
+)
+from PyQt6.QtCore import Qt
+from core.tracing import get_tracer
+from ..utils.i18n import i18n
+
+COLUMNS = ("count", "mean", "p50", "p95", "max", "total")
+
+
+def format_seconds(value: float) -> str:
+    if value >= 1:
+        return f"{value:.2f} s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.1f} ms"
+    return f"{value * 1e6:.0f} µs"
+
+
+class _NumericItem(QTableWidgetItem):
+    """Sorts by the raw value rather than the formatted text"""
+
+    def __lt__(self, other):
+        return self.data(Qt.ItemDataRole.UserRole) < other.data(Qt.ItemDataRole.UserRole)
+
+
+class TraceDialog(QDialog):
+    """Span timings collected by core.tracing, with Chrome trace export"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.tracer = get_tracer()
+        self.setWindowTitle(i18n.t('performance_trace', "Performance Trace"))
+        self.resize(720, 420)
+        layout = QVBoxLayout(self)
+
+        self.enable_check = QCheckBox(i18n.t('enable_tracing', "Record timings"))
+        self.enable_check.setChecked(self.tracer.enabled)
+        self.enable_check.toggled.connect(self.set_enabled)
+        layout.addWidget(self.enable_check)
+
+        self.table = QTableWidget(0, len(COLUMNS) + 1)
+        self.table.setHorizontalHeaderLabels([i18n.t('operation', "Operation"), *COLUMNS])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        self.refresh_button = QPushButton(i18n.t('refresh', "Refresh"))
+        self.refresh_button.clicked.connect(self.refresh)
+        self.export_button = QPushButton(i18n.t('export_trace', "Export Chrome Trace..."))
+        self.export_button.clicked.connect(self.export_trace)
+        self.reset_button = QPushButton(i18n.t('reset', "Reset"))
+        self.reset_button.clicked.connect(self.reset)
+        for button in (self.refresh_button, self.export_button, self.reset_button):
+            buttons.addWidget(button)
+        buttons.addStretch()
+        layout.addLayout(buttons)
+        self.refresh()
+
+    def set_enabled(self, enabled: bool):
+        if enabled:
+            self.tracer.enable()
+        else:
+            self.tracer.disable()
+
+    def refresh(self):
+        stats = self.tracer.histograms()
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(stats))
+        for row, (name, values) in enumerate(stats.items()):
+            self.table.setItem(row, 0, QTableWidgetItem(name))
+            for column, key in enumerate(COLUMNS, start=1):
+                value = values[key]
+                item = _NumericItem(str(value) if key == "count" else format_seconds(value))
+                item.setData(Qt.ItemDataRole.UserRole, value)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        self.table.setSortingEnabled(True)
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            i18n.t('export_trace', "Export Chrome Trace..."),
+            "trace.json",
+            "JSON (*.json)"
+        )
+        if not path:
+            return
+        try:
+            count = self.tracer.export_chrome_trace(path)
+        except OSError as e:
+            QMessageBox.warning(self, i18n.t('error', "Error"), str(e))
+            return
+        QMessageBox.information(
+            self,
+            i18n.t('success', "Success"),
+            i18n.t('trace_exported', "Exported {count} events").format(count=count)
+        )
+
+    def reset(self):
+        self.tracer.reset()
+        self.refresh()
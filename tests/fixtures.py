@@ -0,0 +1,114 @@
+"""Fixtures shared by the tests and the benchmarks (imported by both conftest files)"""
+import importlib.util
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from psutil_stub import FakePsutil
+
+
+@pytest.fixture
+def fake_psutil(monkeypatch):
+    """Deterministic psutil for the duration of one test"""
+    stub = FakePsutil()
+    stub.install(monkeypatch)
+    return stub
+
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    """Keep settings, metrics and shared singletons out of the user's environment"""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.chdir(tmp_path)
+
+    from core import cpu_sampler, device_settings, io_rates, process_profiler
+    from core.system_scanner import SystemScanner
+
+    for module, name in ((cpu_sampler, "_shared_sampler"), (io_rates, "_shared_tracker"),
+                         (process_profiler, "_shared_profiler"), (device_settings, "_shared_store")):
+        monkeypatch.setattr(module, name, None)
+    SystemScanner.invalidate_snapshot()
+    yield tmp_path
+    if cpu_sampler._shared_sampler is not None:
+        cpu_sampler._shared_sampler.stop()
+    if device_settings._shared_store is not None:
+        device_settings._shared_store.close()
+    SystemScanner.invalidate_snapshot()
+
+
+class Upstream(BaseHTTPRequestHandler):
+    """Stub API server; the path picks the caching behaviour of the response"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.calls += 1
+        server.hits[self.path] = server.hits.get(self.path, 0) + 1
+        status, headers = 200, {"Content-Type": "application/json"}
+        if self.path.startswith("/flaky") and server.hits[self.path] == 1:
+            status = 503
+        elif self.path.startswith("/cached"):
+            headers["Cache-Control"] = "max-age=300"
+        elif self.path.startswith("/etag"):
+            headers.update({"Cache-Control": "no-cache", "ETag": '"v1"'})
+            if self.headers.get("If-None-Match") == '"v1"':
+                status = 304
+        elif self.path.startswith("/bad-age"):
+            headers.update({"Cache-Control": "max-age=300", "Age": "soon"})
+        elif self.path.startswith("/private"):
+            headers["Cache-Control"] = "no-store"
+        body = b"" if status == 304 else json.dumps({"path": self.path}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def upstream():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Upstream)
+    server.calls = 0
+    server.hits = {}
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def load_module(path, name: str):
+    """Import a generated agent module from disk"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def http_agent(tmp_path, monkeypatch):
+    """The generated basic agent, imported from disk"""
+    pytest.importorskip("requests")
+    pytest.importorskip("yaml")
+    from core.agent_designer import AgentDesigner
+
+    monkeypatch.setenv("AGENT_HTTP_BACKOFF", "0")
+    monkeypatch.chdir(tmp_path)
+    designer = AgentDesigner()
+    path = designer.save_agent("http_agent", designer.create_agent_config("basic", {}), str(tmp_path))
+    module = load_module(path, "generated_http_agent")
+    logging.getLogger("Basic Agent").setLevel(logging.WARNING)
+    return module.BasicAgent()
+
+
+def url(server, path: str) -> str:
+    return f"http://127.0.0.1:{server.server_port}{path}"
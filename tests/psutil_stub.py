@@ -0,0 +1,103 @@
+"""Deterministic stand-in for the parts of psutil the app uses.
+
+Counters advance by a fixed amount on every call, so derived rates and
+percentages are the same on every run and on every machine.
+"""
+from collections import namedtuple
+
+scputimes = namedtuple("scputimes", "user nice system idle iowait irq softirq steal")
+svmem = namedtuple("svmem", "total available percent used free")
+sdiskusage = namedtuple("sdiskusage", "total used free percent")
+sdiskio = namedtuple("sdiskio", "read_count write_count read_bytes write_bytes read_time write_time")
+snetio = namedtuple("snetio", "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout")
+scpufreq = namedtuple("scpufreq", "current min max")
+pcputimes = namedtuple("pcputimes", "user system children_user children_system")
+pmem = namedtuple("pmem", "rss vms")
+
+GB = 1024 ** 3
+
+
+class FakeProcess:
+    def __init__(self, pid: int, info: dict):
+        self.pid = pid
+        self.info = info
+
+
+class FakePsutil:
+    """Replacement functions with the same signatures as psutil's"""
+
+    def __init__(self, cores: int = 8, disks: int = 2, nics: int = 2, processes: int = 300):
+        self.cores = cores
+        self.disks = [f"sd{chr(ord('a') + i)}" for i in range(disks)]
+        self.nics = ["lo"] + [f"eth{i}" for i in range(nics - 1)]
+        self.process_count = processes
+        self.ticks = 0
+
+    def _tick(self) -> int:
+        self.ticks += 1
+        return self.ticks
+
+    def cpu_times(self, percpu: bool = False):
+        tick = self._tick()
+        rows = [
+            scputimes(user=tick * (10 + core), nice=0.0, system=tick * 5.0, idle=tick * (85 - core),
+                      iowait=0.0, irq=0.0, softirq=0.0, steal=0.0)
+            for core in range(self.cores)
+        ]
+        if percpu:
+            return rows
+        return scputimes(*(sum(values) for values in zip(*rows)))
+
+    def cpu_count(self, logical: bool = True):
+        return self.cores if logical else self.cores // 2
+
+    def cpu_freq(self, percpu: bool = False):
+        return scpufreq(current=2400.0, min=800.0, max=3600.0)
+
+    def virtual_memory(self):
+        return svmem(total=16 * GB, available=9 * GB, percent=43.75, used=7 * GB, free=9 * GB)
+
+    def disk_usage(self, path):
+        return sdiskusage(total=512 * GB, used=200 * GB, free=312 * GB, percent=39.1)
+
+    def _disk(self, scale: int) -> sdiskio:
+        tick = self.ticks
+        return sdiskio(read_count=tick * 10 * scale, write_count=tick * 20 * scale,
+                       read_bytes=tick * 4096 * scale, write_bytes=tick * 8192 * scale,
+                       read_time=tick * scale, write_time=tick * scale)
+
+    def disk_io_counters(self, perdisk: bool = False, nowrap: bool = True):
+        self._tick()
+        if perdisk:
+            return {name: self._disk(i + 1) for i, name in enumerate(self.disks)}
+        return self._disk(sum(range(1, len(self.disks) + 1)))
+
+    def _nic(self, scale: int) -> snetio:
+        tick = self.ticks
+        return snetio(bytes_sent=tick * 1500 * scale, bytes_recv=tick * 3000 * scale,
+                      packets_sent=tick * scale, packets_recv=tick * 2 * scale,
+                      errin=0, errout=0, dropin=0, dropout=0)
+
+    def net_io_counters(self, pernic: bool = False, nowrap: bool = True):
+        self._tick()
+        if pernic:
+            return {name: self._nic(i + 1) for i, name in enumerate(self.nics)}
+        return self._nic(sum(range(1, len(self.nics) + 1)))
+
+    def process_iter(self, attrs=None, ad_value=None):
+        tick = self._tick()
+        for pid in range(1, self.process_count + 1):
+            yield FakeProcess(pid, {
+                "pid": pid,
+                "name": f"proc{pid}",
+                "cpu_times": pcputimes(user=tick * pid * 0.001, system=0.0, children_user=0.0, children_system=0.0),
+                "memory_info": pmem(rss=pid * 1024 * 1024, vms=pid * 2 * 1024 * 1024),
+                "create_time": 1_700_000_000.0 + pid
+            })
+
+    def install(self, monkeypatch) -> None:
+        """Patch these functions into the real psutil module for one test"""
+        import psutil
+        for name in ("cpu_times", "cpu_count", "cpu_freq", "virtual_memory", "disk_usage",
+                     "disk_io_counters", "net_io_counters", "process_iter"):
+            monkeypatch.setattr(psutil, name, getattr(self, name))
@@ -0,0 +1,100 @@
+import pytest
+
+from core.alerts import FIRING, OK, PENDING, RESOLVED, AlertEngine, AlertRule, default_alert_rules
+
+
+def test_sustain_delays_firing():
+    rule = AlertRule("cpu", "cpu.percent", 80, sustain=10)
+    assert rule.evaluate(90, 0) is None and rule.state == PENDING
+    assert rule.evaluate(90, 9) is None
+    assert rule.evaluate(90, 10) == FIRING and rule.state == FIRING
+    assert rule.evaluate(95, 11) is None
+
+
+def test_dip_below_threshold_restarts_sustain():
+    rule = AlertRule("cpu", "cpu.percent", 80, sustain=10)
+    rule.evaluate(90, 0)
+    rule.evaluate(70, 5)
+    assert rule.state == OK
+    assert rule.evaluate(90, 12) is None
+    assert rule.evaluate(90, 22) == FIRING
+
+
+def test_hysteresis_prevents_flapping():
+    rule = AlertRule("cpu", "cpu.percent", 80, hysteresis=5)
+    assert rule.evaluate(81, 0) == FIRING
+    assert rule.evaluate(79, 1) is None and rule.state == FIRING
+    assert rule.evaluate(75, 2) is None
+    assert rule.evaluate(74.9, 3) == RESOLVED and rule.state == OK
+
+
+def test_below_rule():
+    rule = AlertRule("disk", "disk.free", 10, direction="below", hysteresis=2)
+    assert rule.evaluate(9, 0) == FIRING
+    assert rule.evaluate(11, 1) is None
+    assert rule.evaluate(12.5, 2) == RESOLVED
+
+
+def test_cooldown_holds_rule_pending():
+    rule = AlertRule("cpu", "cpu.percent", 80, cooldown=60)
+    assert rule.evaluate(90, 0) == FIRING
+    assert rule.evaluate(50, 1) == RESOLVED
+    assert rule.evaluate(90, 2) is None and rule.state == PENDING
+    assert rule.evaluate(90, 59) is None
+    assert rule.evaluate(90, 60) == FIRING
+
+
+def test_unknown_direction():
+    with pytest.raises(ValueError):
+        AlertRule("cpu", "cpu.percent", 80, direction="sideways")
+
+
+def test_engine_routes_by_metric_and_notifies():
+    engine = AlertEngine()
+    engine.add_rule(AlertRule("cpu", "cpu.percent", 80))
+    engine.add_rule(AlertRule("memory", "memory.percent", 80))
+    received = []
+    engine.add_listener(received.append)
+
+    assert engine.observe("disk.percent", 99, 0) == []
+    events = engine.observe_many({"cpu.percent": 90, "memory.percent": 10}, 0)
+    assert [(e.rule, e.kind) for e in events] == [("cpu", FIRING)]
+    assert received == events
+    assert [rule.name for rule in engine.active()] == ["cpu"]
+    assert events[0].as_dict()["threshold"] == 80
+
+    engine.remove_listener(received.append)
+    engine.observe("cpu.percent", 10, 1)
+    assert len(received) == 1
+
+
+def test_disabled_engine_keeps_state_but_stays_quiet():
+    engine = AlertEngine(enabled=False)
+    engine.add_rule(AlertRule("cpu", "cpu.percent", 80))
+    received = []
+    engine.add_listener(received.append)
+    assert engine.observe("cpu.percent", 90, 0)
+    assert not received
+    assert engine.get_rule("cpu").state == FIRING
+
+
+def test_add_rule_replaces_and_remove_rule():
+    engine = AlertEngine()
+    engine.add_rule(AlertRule("cpu", "cpu.percent", 80))
+    engine.add_rule(AlertRule("cpu", "cpu.percent", 50))
+    assert len(engine.rules()) == 1 and engine.get_rule("cpu").threshold == 50
+    engine.remove_rule("cpu")
+    assert engine.rules() == [] and engine.observe("cpu.percent", 99, 0) == []
+
+
+def test_listener_errors_are_contained(capsys):
+    engine = AlertEngine()
+    engine.add_rule(AlertRule("cpu", "cpu.percent", 80))
+    engine.add_listener(lambda event: 1 / 0)
+    assert engine.observe("cpu.percent", 90, 0)
+    assert "Error in alert listener" in capsys.readouterr().out
+
+
+def test_default_rules_follow_settings():
+    rules = default_alert_rules({"max_cpu_usage": 70, "max_memory_usage": 85})
+    assert {rule.metric: rule.threshold for rule in rules} == {"cpu.percent": 70, "memory.percent": 85}
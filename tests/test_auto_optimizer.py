@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from core.auto_optimizer import AutoOptimizer, choose_mode
+
+
+class FakeSettings:
+    def __init__(self, mode="balanced", auto=True):
+        self.values = {"performance_mode": mode, "auto_optimize": auto}
+        self.applied = []
+        self.saved = []
+
+    def get_runtime_settings(self):
+        return dict(self.values)
+
+    def apply_runtime_mode(self, mode):
+        self.applied.append(mode)
+        self.values["performance_mode"] = mode
+        return True
+
+    def apply_optimization(self, mode):
+        self.saved.append(mode)
+        self.values["performance_mode"] = mode
+        return True
+
+
+@pytest.fixture
+def settings():
+    return FakeSettings()
+
+
+def wait_for_switch(optimizer):
+    done = threading.Event()
+    optimizer.add_listener(lambda decision: done.set())
+    return done
+
+
+@pytest.mark.parametrize("cpu, memory, mode", [(90, 10, "performance"), (10, 90, "performance"),
+                                               (10, 30, "power_save"), (50, 50, "balanced")])
+def test_choose_mode(cpu, memory, mode):
+    assert choose_mode(cpu, memory) == mode
+
+
+def test_ewma_halves_the_gap_every_half_life(settings):
+    optimizer = AutoOptimizer(settings, half_life=10)
+    optimizer.update(0, 50, 0)
+    optimizer.update(100, 50, 10)
+    assert optimizer.cpu_ewma == pytest.approx(50)
+    optimizer.update(100, 50, 20)
+    assert optimizer.cpu_ewma == pytest.approx(75)
+    assert optimizer.memory_ewma == pytest.approx(50)
+
+
+def test_single_spike_does_not_switch(settings):
+    optimizer = AutoOptimizer(settings, half_life=30, min_dwell=0, warmup=0)
+    optimizer.update(50, 50, 0)
+    assert optimizer.update(100, 50, 1) is None
+    assert settings.applied == []
+
+
+def test_sustained_load_switches_once_warm(settings):
+    optimizer = AutoOptimizer(settings, half_life=1, min_dwell=0, warmup=5)
+    done = wait_for_switch(optimizer)
+    assert optimizer.update(95, 50, 0) is None
+    assert optimizer.update(95, 50, 4) is None
+    decision = optimizer.update(95, 50, 5)
+    assert decision["from"] == "balanced" and decision["to"] == "performance"
+    assert decision["trigger"] == "auto"
+    assert done.wait(5)
+    assert settings.applied == ["performance"] and decision["applied"] is True
+    assert settings.saved == []
+
+
+def test_dwell_holds_back_the_next_switch(settings):
+    optimizer = AutoOptimizer(settings, half_life=1, min_dwell=300, warmup=0)
+    done = wait_for_switch(optimizer)
+    assert optimizer.update(95, 50, 0)
+    assert done.wait(5)
+    done.clear()
+    for ts in range(10, 300, 10):
+        assert optimizer.update(5, 10, ts) is None
+    assert optimizer.update(5, 10, 300)["to"] == "power_save"
+    assert done.wait(5)
+    assert settings.applied == ["performance", "power_save"]
+
+
+def test_disabled_does_nothing(settings):
+    settings.values["auto_optimize"] = False
+    optimizer = AutoOptimizer(settings, half_life=1, min_dwell=0, warmup=0)
+    assert optimizer.update(95, 95, 0) is None
+    assert optimizer.update(95, 95, 100) is None
+    assert settings.applied == []
+
+
+def test_optimize_now_ignores_dwell(settings):
+    optimizer = AutoOptimizer(settings, half_life=1, min_dwell=300, warmup=0)
+    optimizer.update(95, 50, 0)
+    decision = optimizer.optimize_now()
+    assert decision["trigger"] == "manual" and decision["applied"] is True
+    assert settings.saved == ["performance"]
+    assert optimizer.get_status()["decisions"][-1] is decision
@@ -0,0 +1,38 @@
+import pytest
+
+pytest.importorskip("yaml")
+
+from core.batch_generator import MIN_PARALLEL, BatchGenerator, parse_manifest  # noqa: E402
+
+
+@pytest.fixture
+def manifest():
+    return parse_manifest({
+        "defaults": {"customizations": {"requirements": {"memory": "4GB"}}},
+        "agents": [{"file_name": f"customer_{i}", "template": "advanced" if i % 3 == 0 else "basic",
+                    "customizations": {"name": f"Customer {i} Agent"}} for i in range(200)]
+    })
+
+
+def test_pool_keeps_order(manifest, tmp_path):
+    entries = manifest["agents"]
+    assert len(entries) >= MIN_PARALLEL
+    generator = BatchGenerator(tmp_path, workers=2)
+    first = generator.run(entries)
+    assert [r["file_name"] for r in first["results"]] == [e["file_name"] for e in entries]
+    assert first["written"] == len(entries) and not first["failed"]
+
+    entries[5]["customizations"]["description"] = "Changed"
+    again = generator.run(entries)
+    assert [r["file_name"] for r in again["results"]] == [e["file_name"] for e in entries]
+    assert again["written"] == 1 and again["unchanged"] == len(entries) - 1
+    assert again["results"][5]["status"] == "written"
+
+
+def test_manifest_template_dir_is_per_run(tmp_path):
+    (tmp_path / "templates").mkdir()
+    path = tmp_path / "manifest.yaml"
+    path.write_text("template_dir: templates\nagents:\n  - {file_name: one, template: basic}\n")
+    generator = BatchGenerator(tmp_path / "out", workers=1)
+    assert generator.run_manifest(path)["written"] == 1
+    assert generator.template_dir is None
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from cli import main
+
+
+def test_help_lists_commands(capsys):
+    with pytest.raises(SystemExit):
+        main(["--help"])
+    out = capsys.readouterr().out
+    for command in ("scan", "health", "validate", "generate", "batch", "templates", "daemon", "fleet", "gui"):
+        assert command in out
+
+
+def test_scan_unknown_section(fake_psutil, isolated, capsys):
+    assert main(["scan", "--section", "nope"]) == 2
+    assert "Unknown section(s): nope" in capsys.readouterr().err
+
+
+def test_scan_json(fake_psutil, isolated, capsys):
+    assert main(["scan", "--section", "system_info", "--json"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert set(data) == {"system_info", "collectors"}
+    assert data["collectors"]["system_info"]["status"] == "ok"
+
+
+def test_health(fake_psutil, isolated, capsys):
+    assert main(["health", "--json"]) == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["health"]["cpu_usage"]["cores"] == 8 and data["suggestions"] == []
+    assert main(["health"]) == 0
+    assert "Memory          43.75%" in capsys.readouterr().out
+
+
+def test_unknown_template(isolated, capsys):
+    assert main(["validate", "no-such-template"]) == 2
+    assert "Unknown template 'no-such-template'" in capsys.readouterr().err
+
+
+def test_generate(isolated, tmp_path, capsys):
+    pytest.importorskip("yaml")
+    assert main(["generate", "basic", "--name", "Cli Agent", "--output-dir", str(tmp_path), "--json"]) == 0
+    path = json.loads(capsys.readouterr().out)["path"]
+    with open(path) as f:
+        assert "class CliAgent" in f.read()
+
+
+def test_fleet_status_unreachable(capsys):
+    assert main(["fleet", "status", "--server", "http://127.0.0.1:9"]) == 2
+    assert "Cannot reach fleet collector" in capsys.readouterr().err
+
+
+def test_daemon_passes_arguments_through(fake_psutil, isolated, capsys):
+    assert main(["daemon", "--once", "--no-history"]) == 0
+    assert "health" in json.loads(capsys.readouterr().out)
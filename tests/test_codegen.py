@@ -0,0 +1,108 @@
+import pytest
+
+
+def _feature_params():
+    from core.codegen import ASYNC_RUNTIME, BUILTIN_FEATURES
+
+    features = [(feature, {"features": [feature.aliases[0]]}) for feature in BUILTIN_FEATURES]
+    return features + [(ASYNC_RUNTIME, {"runtime": "async"})]
+
+
+@pytest.mark.parametrize("feature, overrides", _feature_params(), ids=lambda value: getattr(value, "key", ""))
+def test_feature_renders(feature, overrides):
+    import ast
+    import re
+    from core.codegen import CodeGenerator
+
+    config = {"name": "none", "requirements": {"memory": "1GB", "cpu_cores": 1}, **overrides}
+    tree = ast.parse(CodeGenerator(cache_size=0).render(config))
+    agent = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "NoneAgent")
+    methods = {node.name for node in agent.body if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+    expected = re.findall(r"^\s*(?:async\s+)?def\s+(\w+)", feature.methods.render({}), re.M) if feature.methods else []
+    assert set(expected) <= methods
+    assert {"__init__", "run"} <= methods
+
+
+@pytest.mark.parametrize("name, expected", [("none", "NoneAgent"), ("exception", "ExceptionAgent"),
+                                            ("response cache", "ResponseCacheAgent"), ("my agent 2", "MyAgent2")])
+def test_class_name(name, expected):
+    from core.codegen import BUILTIN_FEATURES, CodeGenerator
+
+    config = {"name": name, "features": [feature.aliases[0] for feature in BUILTIN_FEATURES]}
+    assert f"class {expected}:" in CodeGenerator(cache_size=0).render(config)
+
+
+@pytest.fixture
+def async_agent(tmp_path, monkeypatch):
+    from core.codegen import CodeGenerator
+    from fixtures import load_module
+
+    agents = []
+
+    def make(concurrency, timeout):
+        monkeypatch.setenv("AGENT_MAX_CONCURRENCY", str(concurrency))
+        monkeypatch.setenv("AGENT_REQUEST_TIMEOUT", str(timeout))
+        path = tmp_path / "probe_agent.py"
+        path.write_text(CodeGenerator(cache_size=0).render({"name": "Probe Agent", "runtime": "async"}))
+        agent = load_module(path, "probe_agent").ProbeAgent()
+        agents.append(agent)
+        return agent
+
+    yield make
+    for agent in agents:
+        agent.close()
+
+
+def test_async_agent_bounds_concurrency(async_agent):
+    import threading
+    import time
+
+    agent = async_agent(3, 0.5)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def run(input_data):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(1.0 if input_data.get("slow") else 0.02)
+        with lock:
+            state["active"] -= 1
+        return {"status": "success", "data": input_data}
+
+    agent.run = run
+    # Every run_batch() call runs on a new event loop
+    for _ in range(2):
+        results = agent.run_batch([{"index": i} for i in range(10)])
+        assert [r["data"]["index"] for r in results] == list(range(10))
+    assert 1 < state["peak"] <= 3
+    result, = agent.run_batch([{"slow": True}])
+    assert result["status"] == "error" and "timed out" in result["message"]
+
+
+def test_async_timeout_starts_when_the_call_runs(async_agent):
+    import time
+
+    agent = async_agent(1, 0.3)
+
+    def run(input_data):
+        time.sleep(1.0 if input_data.get("slow") else 0.01)
+        return {"status": "success", "data": input_data}
+
+    agent.run = run
+    slow, quick = agent.run_batch([{"slow": True}, {"index": 1}])
+    assert slow["status"] == "error"
+    # Waited for the timed-out call's thread, but only its own run counts against the timeout
+    assert quick == {"status": "success", "data": {"index": 1}}
+
+
+def test_every_custom_feature_gets_a_hook():
+    import ast
+    from core.codegen import CodeGenerator
+
+    features = ["Résumé parsing", "翻譯", "摘要", "A/B testing", "A-B testing", "翻譯 "]
+    tree = ast.parse(CodeGenerator(cache_size=0).render({"name": "Hooks Agent", "features": features}))
+    agent = next(node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "HooksAgent")
+    hooks = [node.name for node in agent.body if isinstance(node, ast.FunctionDef) and node.name.startswith("handle_")]
+    assert len(hooks) == len(set(hooks)) == 5
+    assert "handle_r_sum_parsing" in hooks and "handle_a_b_testing" in hooks
@@ -0,0 +1,19 @@
+import threading
+
+from core.collectors import CollectorRegistry, WorkerPool
+
+
+def test_hung_collector_frees_its_worker():
+    release = threading.Event()
+    pool = WorkerPool(1)
+    registry = CollectorRegistry(pool)
+    registry.register("hung", release.wait, timeout=0.1)
+    # Queued behind the hung probe on the only worker; its timeout starts when it runs
+    registry.register("quick", lambda: "done", timeout=0.1)
+    try:
+        results = registry.run()
+        assert results["hung"].status == "timeout"
+        assert results["quick"].ok and results["quick"].data == "done"
+        assert len(pool._workers) == 1
+    finally:
+        release.set()
@@ -0,0 +1,65 @@
+import threading
+from collections import namedtuple
+
+import pytest
+
+from core.cpu_sampler import CpuSampler, _busy_percent
+
+times = namedtuple("times", "user system idle iowait")
+
+
+@pytest.mark.parametrize("before, after, percent", [
+    (times(0, 0, 0, 0), times(30, 10, 50, 10), 40.0),
+    (times(5, 5, 5, 5), times(5, 5, 5, 5), 0.0),
+    (times(10, 0, 0, 0), times(5, 0, 0, 0), 0.0),
+])
+def test_busy_percent(before, after, percent):
+    assert _busy_percent(before, after) == percent
+
+
+@pytest.fixture
+def sampler(fake_psutil):
+    sampler = CpuSampler(interval=3600, history=3)
+    yield sampler
+    sampler.stop()
+
+
+def test_sample_per_core(sampler):
+    assert sampler.sample() == tuple(15.0 + core for core in range(8))
+    assert sampler.per_core()[7] == 22.0
+    assert sampler.percent() == 18.5
+
+
+def test_per_core_before_first_sample(sampler):
+    assert len(sampler.per_core()) == 8 and not sampler.history()
+
+
+def test_history_is_bounded(sampler, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("core.cpu_sampler.time.time", lambda: now[0])
+    for _ in range(5):
+        now[0] += 10
+        sampler.sample()
+    assert [ts for ts, _ in sampler.history()] == [1030.0, 1040.0, 1050.0]
+    assert [ts for ts, _ in sampler.history(15)] == [1040.0, 1050.0]
+    assert sampler.get_status()["samples"] == 3
+
+
+def test_listeners(sampler, capsys):
+    received = []
+    sampler.add_listener(lambda ts, per_core: 1 / 0)
+    sampler.add_listener(lambda ts, per_core: received.append(per_core))
+    sampler.sample()
+    assert len(received) == 1 and "Error in CPU sampler listener" in capsys.readouterr().out
+
+
+def test_set_interval_wakes_thread(sampler):
+    sampled = threading.Event()
+    sampler.add_listener(lambda ts, per_core: sampled.set())
+    sampler.start()
+    assert sampler.is_running()
+    sampler.set_interval(0.01)
+    assert sampler.interval == 0.05
+    assert sampled.wait(5)
+    sampler.stop()
+    assert not sampler.get_status()["running"]
@@ -0,0 +1,58 @@
+import asyncio
+import json
+import sys
+
+import pytest
+
+from core.alerts import FIRING, AlertEvent, AlertRule
+from core.daemon import MonitorDaemon, main
+
+
+@pytest.fixture
+def daemon(fake_psutil, isolated, tmp_path):
+    return MonitorDaemon(output_path=str(tmp_path / "samples.jsonl"), interval=0.01)
+
+
+def test_run_appends_one_line_per_tick(daemon):
+    asyncio.run(daemon.run(iterations=2))
+    with open(daemon.output_path) as f:
+        records = [json.loads(line) for line in f]
+    assert len(records) == 2
+    assert records[0]["health"]["cpu_usage"]["cores"] == 8
+    assert {"timestamp", "alerts", "events"} <= set(records[0])
+
+
+def test_events_are_reported_once(daemon):
+    daemon._on_alert(AlertEvent(AlertRule("cpu", "cpu.percent", 80), FIRING, 95, 0))
+    daemon._on_mode_switch({"from": "balanced", "to": "performance"})
+    first, second = daemon.collect(), daemon.collect()
+    assert [event["kind"] for event in first["events"]] == [FIRING, "mode_switch"]
+    assert second["events"] == []
+    daemon.settings.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs Unix sockets")
+def test_socket_streams_latest_record(daemon, tmp_path):
+    daemon.output_path = None
+    daemon.socket_path = str(tmp_path / "daemon.sock")
+
+    async def scenario():
+        await daemon.tick()
+        await daemon.start_socket()
+        reader, writer = await asyncio.open_unix_connection(daemon.socket_path)
+        replayed = json.loads(await reader.readline())
+        await daemon.tick()
+        streamed = json.loads(await reader.readline())
+        writer.close()
+        await daemon.shutdown()
+        return replayed, streamed
+
+    replayed, streamed = asyncio.run(scenario())
+    assert replayed["timestamp"] <= streamed["timestamp"]
+    assert not (tmp_path / "daemon.sock").exists()
+
+
+def test_main_once(fake_psutil, isolated, capsys):
+    assert main(["--once", "--no-history"]) == 0
+    record = json.loads(capsys.readouterr().out)
+    assert record["health"]["memory_usage"]["percent"] == 43.75
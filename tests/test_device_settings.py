@@ -0,0 +1,40 @@
+import pytest
+
+from core.device_settings import DeviceSettings
+
+
+@pytest.fixture
+def settings(fake_psutil, isolated):
+    return DeviceSettings()
+
+
+def test_close_detaches_from_shared_store(settings):
+    store = settings.store
+    settings.default_settings["performance_mode"] = "power_save"
+    settings.close()
+    assert settings._on_settings_changed not in store._listeners
+    assert DeviceSettings().default_settings["performance_mode"] == "balanced"
+
+
+def test_runtime_mode_is_not_saved(settings):
+    from core.collectors import get_worker_pool
+
+    settings.update_settings({"max_cpu_usage": 75})
+    settings.save_settings()
+    with open(settings.settings_file) as f:
+        saved = f.read()
+
+    assert settings.apply_runtime_mode("performance")
+    runtime = settings.get_runtime_settings()
+    assert (runtime["performance_mode"], runtime["monitoring_interval"]) == ("performance", 30)
+    assert settings.cpu_sampler.interval == 0.5 and get_worker_pool().max_workers == 8
+    assert settings.get_current_settings()["performance_mode"] == "balanced"
+    assert settings.alerts.get_rule("cpu").threshold == 75
+    assert not settings.store._dirty
+    with open(settings.settings_file) as f:
+        assert f.read() == saved
+
+    settings.update_settings({"performance_mode": "power_save"})
+    assert settings.runtime_overrides == {}
+    assert settings.get_runtime_settings()["monitoring_interval"] == 60
+    assert not settings.apply_runtime_mode("turbo")
@@ -0,0 +1,73 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from core.fleet import FleetAgent, FleetServer, decode_payload, encode_payload, http_sender
+
+
+@pytest.fixture
+def server():
+    server = FleetServer(port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def _host(server, host):
+    with urllib.request.urlopen(f"{server.url}/fleet/{host}", timeout=5) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+def test_delta_batches_round_trip(server):
+    agent = FleetAgent(http_sender(server.url), host_id="box-1", settings=object(), scanner=object())
+    agent.sample(100.0, {"cpu.percent": 10.0, "memory.percent": 50.0, "disk.sdb.percent": 5.0})
+    agent.sample(105.0, {"cpu.percent": 12.5, "memory.percent": 50.0})
+    agent.build_batch()
+    assert agent.flush()
+    assert _host(server, "box-1")["metrics"] == {"cpu.percent": 12.5, "memory.percent": 50.0}
+
+    agent.sample(110.0, {"cpu.percent": 20.0, "memory.percent": 50.0})
+    body = agent.build_batch()
+    assert decode_payload(body)["samples"] == [{"d": {"cpu.percent": 7.5}, "t": 0.0}]
+    assert agent.flush()
+    detail = _host(server, "box-1")
+    assert detail["metrics"] == {"cpu.percent": 20.0, "memory.percent": 50.0}
+    assert detail["bytes_received"] == agent.bytes_sent
+
+
+def test_resync_after_collector_restart(server):
+    agent = FleetAgent(http_sender(server.url), host_id="box-2", settings=object(), scanner=object())
+    agent.sample(100.0, {"cpu.percent": 10.0})
+    agent.build_batch()
+    assert agent.flush()
+
+    server.collector.hosts.clear()
+    agent.sample(105.0, {"cpu.percent": 30.0})
+    agent.build_batch()
+    assert not agent.flush()
+    agent.sample(110.0, {"cpu.percent": 40.0})
+    agent.build_batch()
+    assert agent.flush()
+    assert _host(server, "box-2")["metrics"] == {"cpu.percent": 40.0}
+
+
+@pytest.mark.parametrize("payload, error", [
+    ([1, 2], "payload must be a JSON object"),
+    ({"v": 1, "host": "box-3", "seq": None}, "seq must be an integer"),
+    ({"v": 1, "host": ["box-3"], "seq": 1}, "host must be a non-empty string"),
+    ({"v": 1, "host": "box-3", "seq": 1, "samples": {}}, "samples must be a list"),
+    ({"v": 1, "host": "box-3", "seq": 1, "samples": [{"v": {"cpu.percent": "high"}}]},
+     "samples[0].v must map metric names to numbers"),
+    ({"v": 1, "host": "box-3", "seq": 1, "samples": [{"v": {}}, {"r": "cpu.percent"}]},
+     "samples[1].r must be a list of metric names"),
+])
+def test_malformed_payload_is_rejected(server, payload, error):
+    request = urllib.request.Request(f"{server.url}/ingest", data=encode_payload(payload), method="POST",
+                                     headers={"Content-Encoding": "gzip"})
+    with pytest.raises(urllib.error.HTTPError) as info:
+        urllib.request.urlopen(request, timeout=5)
+    assert info.value.code == 400
+    assert json.loads(info.value.read().decode("utf-8")) == {"error": error}
+    assert "box-3" not in server.collector.hosts
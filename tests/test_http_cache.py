@@ -0,0 +1,30 @@
+import threading
+
+from fixtures import url
+
+
+def test_revalidation_and_retry(http_agent, upstream):
+    assert http_agent.fetch(url(upstream, "/etag")) == {"path": "/etag"}
+    assert http_agent.fetch(url(upstream, "/flaky")) == {"path": "/flaky"}
+    assert upstream.hits["/flaky"] == 2  # the 503 was retried
+    assert http_agent.fetch(url(upstream, "/etag")) == {"path": "/etag"}
+    assert upstream.hits["/etag"] == 2  # revalidated, answered by a 304
+    assert http_agent.run({"url": url(upstream, "/cached")})["status"] == "success"
+
+
+def test_no_store_is_not_cached(http_agent, upstream):
+    for _ in range(3):
+        http_agent.fetch(url(upstream, "/private"))
+    assert upstream.hits["/private"] == 3
+
+
+def test_malformed_age_and_concurrent_counts(http_agent, upstream):
+    assert http_agent.fetch(url(upstream, "/bad-age")) == {"path": "/bad-age"}
+    threads = [threading.Thread(target=lambda: [http_agent.fetch(url(upstream, "/bad-age")) for _ in range(50)])
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert upstream.hits["/bad-age"] == 1
+    assert (http_agent.cache.hits, http_agent.cache.misses) == (400, 1)
@@ -0,0 +1,58 @@
+from collections import namedtuple
+
+import pytest
+
+from core import io_rates
+from core.io_rates import TOTAL, CounterRates, IORateTracker, counter_delta
+
+counters = namedtuple("counters", "rx tx")
+
+
+@pytest.mark.parametrize("old, new, delta", [
+    (100, 150, 50),
+    (100, 100, 0),
+    (2 ** 32 - 10, 5, 15),
+    (2 ** 64 - 1, 0, 1),
+    (2 ** 33, 2 ** 32 + 5, None),  # 64-bit counter went backwards by far less than a wrap
+    (10, 5, None),                 # reset, not a wrap
+])
+def test_counter_delta(old, new, delta):
+    assert counter_delta(old, new) == delta
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(io_rates.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_rates_from_second_sample(clock):
+    readings = [{"eth0": counters(0, 0)}, {"eth0": counters(1000, 500), "eth1": counters(7, 7)}]
+    rates = CounterRates(lambda: readings.pop(0), {"rx": "rx_per_sec", "tx": "tx_per_sec"})
+    assert rates.sample() == {}
+    clock[0] += 2
+    assert rates.sample() == {"eth0": {"rx_per_sec": 500.0, "tx_per_sec": 250.0}}
+
+
+def test_wrap_and_reset_rates(clock):
+    readings = [{"eth0": counters(2 ** 32 - 100, 50)}, {"eth0": counters(100, 10)},
+                {"eth1": counters(1, 1)}]
+    rates = CounterRates(lambda: readings.pop(0), {"rx": "rx_per_sec", "tx": "tx_per_sec"})
+    rates.sample()
+    clock[0] += 1
+    assert rates.sample() == {"eth0": {"rx_per_sec": 200.0, "tx_per_sec": 0.0}}
+    clock[0] += 1
+    assert rates.sample() == {}  # eth0 disappeared, eth1 is new
+
+
+def test_tracker_reuses_recent_result(fake_psutil, clock):
+    tracker = IORateTracker(min_interval=0.5)
+    clock[0] += 1
+    first = tracker.sample()
+    assert TOTAL in first["disk"] and TOTAL in first["network"]
+    clock[0] += 0.1
+    assert tracker.sample() is first
+    clock[0] += 1
+    assert tracker.sample() is not first
+    assert set(tracker.totals()) == {"disk", "network"}
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_close_removes_listeners(app, fake_psutil, isolated):
+    from ui.main_window import MainWindow
+
+    window = MainWindow()
+    window.start_alerts()
+    window.show_page("device_settings")
+    alerts = window.settings_manager.alerts
+    sampler = window.settings_manager.cpu_sampler
+    optimizer = window.auto_optimizer
+    assert len(alerts._listeners) == 2
+    assert window.device_settings_page.auto_optimizer is optimizer and optimizer._on_sample in sampler._listeners
+    window.close()
+    assert alerts._listeners == [] and optimizer._listeners == []
+    assert optimizer._on_sample not in sampler._listeners
+    window.deleteLater()
+    app.processEvents()
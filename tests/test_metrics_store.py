@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from core.metrics_store import MetricsStore, flatten_metrics
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetricsStore(str(tmp_path / "metrics.db"), batch_size=10_000, flush_interval=3600)
+    yield store
+    store.close()
+
+
+def test_rollups(store):
+    base = int(time.time()) // 60 * 60 - 180  # minute-aligned, inside the 1s retention
+    for i in range(120):
+        store.record("cpu.percent", i, base + i)
+    assert store.flush() == 120
+
+    seconds = store.query("cpu.percent", base, base + 119, resolution="1s")
+    assert len(seconds) == 120 and seconds[5]["avg"] == 5
+    minutes = store.query("cpu.percent", base, base + 119, resolution="1m")
+    assert [(m["min"], m["max"], m["avg"], m["count"]) for m in minutes] == [(0, 59, 29.5, 60),
+                                                                              (60, 119, 89.5, 60)]
+    hours = store.query("cpu.percent", base, base + 119, resolution="1h")
+    assert sum(h["count"] for h in hours) == 120 and all(h["timestamp"] % 3600 == 0 for h in hours)
+
+
+def test_flushes_merge_into_existing_buckets(store):
+    base = int(time.time()) // 60 * 60 - 60
+    store.record("x", 10, base)
+    store.flush()
+    store.record("x", 30, base + 1)
+    bucket, = store.query("x", base, base + 59, resolution="1m")
+    assert (bucket["min"], bucket["max"], bucket["avg"]) == (10, 30, 20)
+
+
+def test_batch_size_triggers_flush(tmp_path):
+    store = MetricsStore(str(tmp_path / "m.db"), batch_size=3, flush_interval=3600)
+    try:
+        store.record_many({"a": 1, "b": 2, "c": None})
+        assert store._buffer
+        store.record("a", 3)
+        assert not store._buffer
+    finally:
+        store.close()
+
+
+def test_retention_prunes_each_resolution(tmp_path):
+    store = MetricsStore(str(tmp_path / "m.db"), retention={"1s": 60, "1m": 3600})
+    try:
+        now = time.time()
+        store.record_many({"x": 1}, now - 600)
+        store.record_many({"x": 2}, now)
+        store.flush()
+        store._prune()
+        assert [row["avg"] for row in store.query("x", now - 700, resolution="1s")] == [2]
+        assert len(store.query("x", now - 700, resolution="1m")) == 2
+    finally:
+        store.close()
+
+
+def test_pick_resolution(store):
+    now = time.time()
+    assert store._pick_resolution(now - 60) == "1s"
+    assert store._pick_resolution(now - 3600) == "1m"
+    assert store._pick_resolution(now - 7 * 86400) == "1h"
+    assert store._pick_resolution(now - 365 * 86400) == "1h"
+    with pytest.raises(ValueError):
+        store.query("x", now, resolution="1d")
+
+
+def test_reopen_keeps_data(tmp_path):
+    path = str(tmp_path / "m.db")
+    store = MetricsStore(path)
+    store.record("x", 5)
+    store.close()
+    store = MetricsStore(path)
+    try:
+        assert store.metric_names() == ["x"]
+        assert store.latest("x")["avg"] == 5
+        assert store.latest("missing") is None
+    finally:
+        store.close()
+
+
+def test_flatten_metrics():
+    data = {"cpu": {"percent": 5, "ok": True, "name": "x"}, "load": 1.5}
+    assert flatten_metrics(data) == {"cpu.percent": 5, "load": 1.5}
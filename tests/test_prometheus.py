@@ -0,0 +1,6 @@
+from core.prometheus import format_family
+
+
+def test_non_finite_values():
+    lines = format_family("x", "x", [({"v": "a"}, float("nan")), ({"v": "b"}, float("inf")), ({}, float("-inf"))])
+    assert lines[2:] == ['ai_agent_x{v="a"} NaN', 'ai_agent_x{v="b"} +Inf', "ai_agent_x -Inf"]
@@ -0,0 +1,50 @@
+import pytest
+
+from core.ring_buffer import RingBuffer
+
+
+def test_append_and_read_back():
+    buffer = RingBuffer(3, channels=2)
+    assert len(buffer) == 0 and buffer.latest() == [] and buffer.max() == 0.0
+    buffer.append([1, 10])
+    buffer.append([2])  # missing channels become 0
+    assert buffer.latest() == [2.0, 0.0]
+    assert buffer.value(1, 1) == 10.0
+    assert buffer.channel(0) == [1.0, 2.0]
+
+
+def test_wraps_oldest_first():
+    buffer = RingBuffer(3)
+    buffer.extend([i] for i in range(5))
+    assert len(buffer) == 3 and buffer.total == 5
+    assert buffer.channel() == [2.0, 3.0, 4.0]
+    assert [buffer.value(age) for age in range(3)] == [4.0, 3.0, 2.0]
+    assert buffer.max() == 4.0
+
+
+def test_value_out_of_range():
+    buffer = RingBuffer(3)
+    buffer.append([1])
+    with pytest.raises(IndexError):
+        buffer.value(1)
+
+
+def test_max_ignores_unused_rows():
+    buffer = RingBuffer(4, channels=2)
+    buffer.append([-5, -1])
+    assert buffer.max() == -1.0
+
+
+def test_clear():
+    buffer = RingBuffer(2)
+    buffer.extend([[1], [2], [3]])
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.channel() == []
+    buffer.append([7])
+    assert buffer.channel() == [7.0]
+
+
+@pytest.mark.parametrize("capacity, channels", [(0, 1), (1, 0)])
+def test_invalid_size(capacity, channels):
+    with pytest.raises(ValueError):
+        RingBuffer(capacity, channels)
@@ -0,0 +1,48 @@
+import copy
+import pickle
+
+import pytest
+
+from core.scan_snapshot import ScanSnapshot, freeze
+
+
+@pytest.fixture
+def snapshot():
+    return ScanSnapshot({"hardware_info": {"cpu_cores": 8, "disks": [{"path": "/"}]}},
+                        collectors={"hardware_info": {"status": "ok", "duration": 0.1}})
+
+
+@pytest.mark.parametrize("mutate", [
+    lambda d: d.__setitem__("x", 1),
+    lambda d: d.__delitem__("hardware_info"),
+    lambda d: d.update(x=1),
+    lambda d: d.setdefault("x", 1),
+    lambda d: d.pop("hardware_info"),
+    lambda d: d.popitem(),
+    lambda d: d.clear(),
+    lambda d: d.__ior__({"x": 1}),
+    lambda d: d["hardware_info"].update(cpu_cores=1),
+])
+def test_read_only(snapshot, mutate):
+    with pytest.raises(TypeError):
+        mutate(snapshot)
+    assert dict(snapshot)["hardware_info"]["cpu_cores"] == 8 and "x" not in snapshot
+
+
+def test_in_place_union_operator(snapshot):
+    info = snapshot["hardware_info"]
+    with pytest.raises(TypeError):
+        info |= {"cpu_cores": 1}
+    assert snapshot["hardware_info"]["cpu_cores"] == 8
+    assert (info | {"cpu_cores": 1})["cpu_cores"] == 1  # plain | returns a new dict
+
+
+def test_copies_and_thaw(snapshot):
+    assert copy.deepcopy(snapshot) is snapshot
+    restored = pickle.loads(pickle.dumps(snapshot))
+    assert restored == snapshot and restored.collectors == snapshot.collectors
+    data = snapshot.to_dict()
+    data["hardware_info"]["disks"].append({"path": "/home"})
+    assert len(snapshot["hardware_info"]["disks"]) == 1
+    assert hash(freeze({"a": [1, 2]})) == hash(freeze({"a": (1, 2)}))
+    assert not snapshot.failed_sections() and snapshot.is_fresh(60)
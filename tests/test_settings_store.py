@@ -0,0 +1,122 @@
+import json
+import os
+
+import pytest
+
+from core import fileio
+from core.settings_store import SettingsStore, validate
+
+SCHEMA = {
+    "interval": {"type": int, "min": 1, "max": 60},
+    "mode": {"type": str, "choices": ["fast", "slow"]},
+}
+DEFAULTS = {"interval": 5, "mode": "fast"}
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    stores = []
+
+    def make(**kwargs):
+        kwargs.setdefault("debounce", 3600)
+        store = SettingsStore(tmp_path / "settings.json", DEFAULTS, SCHEMA, watch_interval=3600, **kwargs)
+        stores.append(store)
+        return store
+
+    yield make
+    for store in stores:
+        store.close()
+
+
+def read(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def test_validate():
+    assert validate({"interval": 5, "mode": "slow", "other": object()}, SCHEMA) == []
+    assert validate({"interval": True}, SCHEMA) == ["interval: expected int, got bool"]
+    assert validate({"interval": 0, "mode": "x"}, SCHEMA) == ["interval: must be at least 1",
+                                                              "mode: must be one of fast, slow"]
+
+
+def test_update_rejects_invalid_values(make_store):
+    store = make_store()
+    with pytest.raises(ValueError):
+        store.update({"interval": 99})
+    assert store.values["interval"] == 5
+
+
+def test_saves_are_coalesced(make_store, monkeypatch):
+    writes = []
+    real = fileio.atomic_write
+    monkeypatch.setattr("core.settings_store.atomic_write",
+                        lambda path, data: (writes.append(data), real(path, data)))
+    store = make_store()
+    store.update({"interval": 10})
+    store.update({"mode": "slow"})
+    assert not store.path.exists()
+    assert store.flush() and store.flush()
+    assert len(writes) == 1
+    assert read(store.path) == {"interval": 10, "mode": "slow"}
+
+
+def test_failed_write_keeps_old_file(make_store, monkeypatch, tmp_path):
+    store = make_store()
+    store.update({"interval": 10})
+    store.flush()
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(fileio.os, "replace", fail)
+    store.update({"interval": 20})
+    assert store.flush() is False
+    assert read(store.path)["interval"] == 10
+    assert os.listdir(tmp_path) == ["settings.json"]
+
+
+def test_external_edits_reach_listeners(make_store):
+    store = make_store()
+    store.update({"interval": 10})
+    store.flush()
+    assert not store.watcher.check()  # our own write is not reported
+
+    received = []
+    store.add_listener(received.append)
+    with open(store.path, "w") as f:
+        json.dump({"mode": "slow", "interval": "bad"}, f)
+    assert store.watcher.check()
+    assert received == [{"interval": 5, "mode": "slow"}]
+    assert store.values is not received[0] and store.values["mode"] == "slow"
+
+
+def test_pending_write_wins_over_external_edit(make_store):
+    store = make_store()
+    store.update({"interval": 10})
+    with open(store.path, "w") as f:
+        json.dump({"interval": 30}, f)
+    store.watcher.check()
+    assert store.values["interval"] == 10
+    store.flush()
+    assert read(store.path)["interval"] == 10
+
+
+def test_legacy_migration(make_store, tmp_path, capsys):
+    legacy = tmp_path / "old" / "device_settings.json"
+    legacy.parent.mkdir()
+    legacy.write_text(json.dumps({"interval": 7, "mode": "turbo"}))
+    store = make_store(legacy_paths=[str(tmp_path / "missing.json"), str(legacy)])
+    assert store.values == {"interval": 7, "mode": "fast"}
+    assert read(store.path) == {"interval": 7}
+    assert "Migrated settings" in capsys.readouterr().out
+
+    # Only runs when the new file does not exist yet
+    legacy.write_text(json.dumps({"interval": 9}))
+    assert make_store(legacy_paths=[str(legacy)]).values["interval"] == 7
+
+
+def test_corrupt_file_falls_back_to_defaults(make_store, tmp_path, capsys):
+    (tmp_path / "settings.json").write_text("{not json")
+    assert make_store().values == DEFAULTS
+    assert "Error loading settings" in capsys.readouterr().out
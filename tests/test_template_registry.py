@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("yaml")
+
+from core.template_registry import TemplateRegistry  # noqa: E402
+
+TEMPLATE = "requirements: {memory: 2GB, cpu_cores: 1}\nfeatures: [Caching]\n"
+
+
+def test_identical_files_keep_their_own_keys(tmp_path):
+    (tmp_path / "first.yaml").write_text(TEMPLATE)
+    registry = TemplateRegistry(tmp_path)
+    # Parsed on the next reload from the cache entry of the first file
+    (tmp_path / "second.yaml").write_text(TEMPLATE)
+    assert registry.reload()["added"] == ["second"]
+    assert registry.get("first")["name"] == "first"
+    assert registry.get("second")["name"] == "second"
+    assert registry.sources == {"first": str(tmp_path / "first.yaml"),
+                                "second": str(tmp_path / "second.yaml")}
+
+
+def test_renamed_file_is_keyed_by_its_new_name(tmp_path):
+    (tmp_path / "old.yaml").write_text(TEMPLATE)
+    registry = TemplateRegistry(tmp_path)
+    (tmp_path / "old.yaml").rename(tmp_path / "new.yaml")
+    assert registry.reload() == {"added": ["new"], "changed": [], "removed": ["old"]}
+    assert registry.get("new")["name"] == "new"
+    assert registry.reload() == {"added": [], "changed": [], "removed": []}
+
+
+def test_id_and_name_from_the_file_win(tmp_path):
+    (tmp_path / "file.yaml").write_text("id: custom\nname: Custom Agent\n" + TEMPLATE)
+    registry = TemplateRegistry(tmp_path)
+    assert registry.get("custom")["name"] == "Custom Agent"
+    assert "id" not in registry.get("custom") and registry.get("file") is None
+
+
+def test_invalid_file_is_reported(tmp_path):
+    (tmp_path / "broken.yaml").write_text("requirements: {cpu_cores: 1}\n")
+    registry = TemplateRegistry(tmp_path)
+    assert registry.get("broken") is None
+    assert registry.errors == {str(tmp_path / "broken.yaml"): "requirements.memory is missing"}